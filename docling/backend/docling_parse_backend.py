@@ -4,13 +4,18 @@ from io import BytesIO
 from pathlib import Path
 from typing import Iterable, List, Optional, Union
 
+import numpy as np
 import pypdfium2 as pdfium
 from docling_core.types.doc import BoundingBox, CoordOrigin, Size
 from docling_parse.docling_parse import pdf_parser_v1
 from PIL import Image, ImageDraw
 from pypdfium2 import PdfPage
 
-from docling.backend.pdf_backend import PdfDocumentBackend, PdfPageBackend
+from docling.backend.pdf_backend import (
+    PdfDocumentBackend,
+    PdfPageBackend,
+    TextCellIndex,
+)
 from docling.datamodel.base_models import Cell
 from docling.datamodel.document import InputDocument
 
@@ -22,6 +27,7 @@ class DoclingParsePageBackend(PdfPageBackend):
         self, parser: pdf_parser_v1, document_hash: str, page_no: int, page_obj: PdfPage
     ):
         self._ppage = page_obj
+        self._text_index: Optional[TextCellIndex] = None
         parsed_page = parser.parse_pdf_from_key_on_page(document_hash, page_no)
 
         self.valid = "pages" in parsed_page
@@ -35,38 +41,38 @@ class DoclingParsePageBackend(PdfPageBackend):
     def is_valid(self) -> bool:
         return self.valid
 
+    def _get_text_index(self) -> TextCellIndex:
+        if self._text_index is None:
+            page_size = self.get_size()
+            parser_width = self._dpage["width"]
+            parser_height = self._dpage["height"]
+
+            cells = self._dpage["cells"]
+            rects = np.array(
+                [cell["box"]["device"] for cell in cells], dtype=np.float64
+            ).reshape(-1, 4)
+
+            # Cell boxes in top-left origin, with the coordinates left unswapped
+            bboxes = np.stack(
+                [
+                    rects[:, 0] * page_size.width / parser_width,
+                    page_size.height - rects[:, 3] * page_size.height / parser_height,
+                    rects[:, 2] * page_size.width / parser_width,
+                    page_size.height - rects[:, 1] * page_size.height / parser_height,
+                ],
+                axis=1,
+            )
+            self._text_index = TextCellIndex(
+                bboxes, [cell["content"]["rnormalized"] for cell in cells]
+            )
+
+        return self._text_index
+
     def get_text_in_rect(self, bbox: BoundingBox) -> str:
         if not self.valid:
             return ""
-        # Find intersecting cells on the page
-        text_piece = ""
-        page_size = self.get_size()
-        parser_width = self._dpage["width"]
-        parser_height = self._dpage["height"]
 
-        scale = (
-            1  # FIX - Replace with param in get_text_in_rect across backends (optional)
-        )
-
-        for i in range(len(self._dpage["cells"])):
-            rect = self._dpage["cells"][i]["box"]["device"]
-            x0, y0, x1, y1 = rect
-            cell_bbox = BoundingBox(
-                l=x0 * scale * page_size.width / parser_width,
-                b=y0 * scale * page_size.height / parser_height,
-                r=x1 * scale * page_size.width / parser_width,
-                t=y1 * scale * page_size.height / parser_height,
-                coord_origin=CoordOrigin.BOTTOMLEFT,
-            ).to_top_left_origin(page_height=page_size.height * scale)
-
-            overlap_frac = cell_bbox.intersection_area_with(bbox) / cell_bbox.area()
-
-            if overlap_frac > 0.5:
-                if len(text_piece) > 0:
-                    text_piece += " "
-                text_piece += self._dpage["cells"][i]["content"]["rnormalized"]
-
-        return text_piece
+        return self._get_text_index().get_text_in_rect(bbox)
 
     def get_text_cells(self) -> Iterable[Cell]:
         cells: List[Cell] = []
@@ -146,7 +152,10 @@ class DoclingParsePageBackend(PdfPageBackend):
                 yield cropbox
 
     def get_page_image(
-        self, scale: float = 1, cropbox: Optional[BoundingBox] = None
+        self,
+        scale: float = 1,
+        cropbox: Optional[BoundingBox] = None,
+        oversample: float = 1.5,
     ) -> Image.Image:
 
         page_size = self.get_size()
@@ -167,15 +176,16 @@ class DoclingParsePageBackend(PdfPageBackend):
             padbox.r = page_size.width - padbox.r
             padbox.t = page_size.height - padbox.t
 
-        image = (
-            self._ppage.render(
-                scale=scale * 1.5,
-                rotation=0,  # no additional rotation
-                crop=padbox.as_tuple(),
-            )
-            .to_pil()
-            .resize(size=(round(cropbox.width * scale), round(cropbox.height * scale)))
-        )  # We resize the image from 1.5x the given scale to make it sharper.
+        image = self._ppage.render(
+            scale=scale * oversample,
+            rotation=0,  # no additional rotation
+            crop=padbox.as_tuple(),
+        ).to_pil()
+
+        # We resize the image from the oversampled scale to make it sharper.
+        size = (round(cropbox.width * scale), round(cropbox.height * scale))
+        if image.size != size:
+            image = image.resize(size=size)
 
         return image
 
@@ -185,6 +195,7 @@ class DoclingParsePageBackend(PdfPageBackend):
     def unload(self):
         self._ppage = None
         self._dpage = None
+        self._text_index = None
 
 
 class DoclingParseDocumentBackend(PdfDocumentBackend):
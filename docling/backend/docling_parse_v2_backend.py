@@ -1,17 +1,22 @@
 import logging
-import random
 from io import BytesIO
+from operator import itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable, List, Optional, Union
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Union
 
+import numpy as np
 import pypdfium2 as pdfium
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from docling_parse.docling_parse import pdf_parser_v2
-from PIL import Image, ImageDraw
+from PIL import Image
 from pypdfium2 import PdfPage
 
-from docling.backend.pdf_backend import PdfDocumentBackend, PdfPageBackend
-from docling.datamodel.base_models import Cell, Size
+from docling.backend.pdf_backend import (
+    PdfDocumentBackend,
+    PdfPageBackend,
+    TextCellIndex,
+)
+from docling.datamodel.base_models import Cell, PageCells, Size
 
 if TYPE_CHECKING:
     from docling.datamodel.document import InputDocument
@@ -24,6 +29,9 @@ class DoclingParseV2PageBackend(PdfPageBackend):
         self, parser: pdf_parser_v2, document_hash: str, page_no: int, page_obj: PdfPage
     ):
         self._ppage = page_obj
+        self._cell_rects: Optional[np.ndarray] = None
+        self._cell_texts: List[str] = []
+        self._text_index: Optional[TextCellIndex] = None
         parsed_page = parser.parse_pdf_from_key_on_page(document_hash, page_no)
 
         self.valid = "pages" in parsed_page and len(parsed_page["pages"]) == 1
@@ -37,107 +45,94 @@ class DoclingParseV2PageBackend(PdfPageBackend):
     def is_valid(self) -> bool:
         return self.valid
 
+    def _decode_cells(self):
+        # Decodes the sanitized cells table once into columns: the cell rects,
+        # scaled to page coordinates in bottom-left origin, and the cell texts.
+        if self._cell_rects is None:
+            page_size = self.get_size()
+            parser_width = self._dpage["sanitized"]["dimension"]["width"]
+            parser_height = self._dpage["sanitized"]["dimension"]["height"]
+
+            cells_data = self._dpage["sanitized"]["cells"]["data"]
+            cells_header = self._dpage["sanitized"]["cells"]["header"]
+            get_rect = itemgetter(
+                *[cells_header.index(k) for k in ["x0", "y0", "x1", "y1"]]
+            )
+            text_column = cells_header.index("text")
+
+            rects = np.array(
+                [get_rect(cell_data) for cell_data in cells_data], dtype=np.float64
+            ).reshape(-1, 4)
+            rects[:, [0, 2]] = rects[:, [0, 2]] * page_size.width / parser_width
+            rects[:, [1, 3]] = rects[:, [1, 3]] * page_size.height / parser_height
+
+            self._cell_rects = rects
+            self._cell_texts = [cell_data[text_column] for cell_data in cells_data]
+
+        return self._cell_rects, self._cell_texts
+
+    def _get_text_index(self) -> TextCellIndex:
+        if self._text_index is None:
+            rects, texts = self._decode_cells()
+            page_height = self.get_size().height
+
+            # Cell boxes in top-left origin, with the coordinates left unswapped
+            bboxes = np.stack(
+                [
+                    rects[:, 0],
+                    page_height - rects[:, 3],
+                    rects[:, 2],
+                    page_height - rects[:, 1],
+                ],
+                axis=1,
+            )
+            self._text_index = TextCellIndex(bboxes, texts)
+
+        return self._text_index
+
     def get_text_in_rect(self, bbox: BoundingBox) -> str:
         if not self.valid:
             return ""
-        # Find intersecting cells on the page
-        text_piece = ""
-        page_size = self.get_size()
 
-        parser_width = self._dpage["sanitized"]["dimension"]["width"]
-        parser_height = self._dpage["sanitized"]["dimension"]["height"]
-
-        scale = (
-            1  # FIX - Replace with param in get_text_in_rect across backends (optional)
+        return self._get_text_index().get_text_in_rect(bbox)
+
+    def _get_cell_bboxes(self) -> np.ndarray:
+        rects, _ = self._decode_cells()
+        page_height = self.get_size().height
+
+        # Cell boxes in top-left origin, with inverted coordinates swapped
+        return np.stack(
+            [
+                np.minimum(rects[:, 0], rects[:, 2]),
+                page_height - np.maximum(rects[:, 1], rects[:, 3]),
+                np.maximum(rects[:, 0], rects[:, 2]),
+                page_height - np.minimum(rects[:, 1], rects[:, 3]),
+            ],
+            axis=1,
         )
 
-        cells_data = self._dpage["sanitized"]["cells"]["data"]
-        cells_header = self._dpage["sanitized"]["cells"]["header"]
-
-        for i, cell_data in enumerate(cells_data):
-            x0 = cell_data[cells_header.index("x0")]
-            y0 = cell_data[cells_header.index("y0")]
-            x1 = cell_data[cells_header.index("x1")]
-            y1 = cell_data[cells_header.index("y1")]
-
-            cell_bbox = BoundingBox(
-                l=x0 * scale * page_size.width / parser_width,
-                b=y0 * scale * page_size.height / parser_height,
-                r=x1 * scale * page_size.width / parser_width,
-                t=y1 * scale * page_size.height / parser_height,
-                coord_origin=CoordOrigin.BOTTOMLEFT,
-            ).to_top_left_origin(page_height=page_size.height * scale)
-
-            overlap_frac = cell_bbox.intersection_area_with(bbox) / cell_bbox.area()
-
-            if overlap_frac > 0.5:
-                if len(text_piece) > 0:
-                    text_piece += " "
-                text_piece += cell_data[cells_header.index("text")]
-
-        return text_piece
-
     def get_text_cells(self) -> Iterable[Cell]:
-        cells: List[Cell] = []
-        cell_counter = 0
-
         if not self.valid:
-            return cells
+            return []
+
+        _, texts = self._decode_cells()
+        return self._iter_text_cells(self._get_cell_bboxes().tolist(), texts)
+
+    @staticmethod
+    def _iter_text_cells(bboxes: List[List[float]], texts: List[str]) -> Iterator[Cell]:
+        for cell_counter, ((l, t, r, b), text_piece) in enumerate(zip(bboxes, texts)):
+            yield Cell(
+                id=cell_counter,
+                text=text_piece,
+                bbox=BoundingBox(l=l, t=t, r=r, b=b, coord_origin=CoordOrigin.TOPLEFT),
+            )
 
-        page_size = self.get_size()
+    def get_page_cells(self) -> PageCells:
+        if not self.valid:
+            return PageCells()
 
-        parser_width = self._dpage["sanitized"]["dimension"]["width"]
-        parser_height = self._dpage["sanitized"]["dimension"]["height"]
-
-        cells_data = self._dpage["sanitized"]["cells"]["data"]
-        cells_header = self._dpage["sanitized"]["cells"]["header"]
-
-        for i, cell_data in enumerate(cells_data):
-            x0 = cell_data[cells_header.index("x0")]
-            y0 = cell_data[cells_header.index("y0")]
-            x1 = cell_data[cells_header.index("x1")]
-            y1 = cell_data[cells_header.index("y1")]
-
-            if x1 < x0:
-                x0, x1 = x1, x0
-            if y1 < y0:
-                y0, y1 = y1, y0
-
-            text_piece = cell_data[cells_header.index("text")]
-            cells.append(
-                Cell(
-                    id=cell_counter,
-                    text=text_piece,
-                    bbox=BoundingBox(
-                        # l=x0, b=y0, r=x1, t=y1,
-                        l=x0 * page_size.width / parser_width,
-                        b=y0 * page_size.height / parser_height,
-                        r=x1 * page_size.width / parser_width,
-                        t=y1 * page_size.height / parser_height,
-                        coord_origin=CoordOrigin.BOTTOMLEFT,
-                    ).to_top_left_origin(page_size.height),
-                )
-            )
-            cell_counter += 1
-
-        def draw_clusters_and_cells():
-            image = (
-                self.get_page_image()
-            )  # make new image to avoid drawing on the saved ones
-            draw = ImageDraw.Draw(image)
-            for c in cells:
-                x0, y0, x1, y1 = c.bbox.as_tuple()
-                cell_color = (
-                    random.randint(30, 140),
-                    random.randint(30, 140),
-                    random.randint(30, 140),
-                )
-                draw.rectangle([(x0, y0), (x1, y1)], outline=cell_color)
-            image.show()
-
-        # draw_clusters_and_cells()
-
-        return cells
+        _, texts = self._decode_cells()
+        return PageCells(texts=texts, bboxes=self._get_cell_bboxes())
 
     def get_bitmap_rects(self, scale: float = 1) -> Iterable[BoundingBox]:
         AREA_THRESHOLD = 32 * 32
@@ -161,7 +156,10 @@ class DoclingParseV2PageBackend(PdfPageBackend):
                 yield cropbox
 
     def get_page_image(
-        self, scale: float = 1, cropbox: Optional[BoundingBox] = None
+        self,
+        scale: float = 1,
+        cropbox: Optional[BoundingBox] = None,
+        oversample: float = 1.5,
     ) -> Image.Image:
 
         page_size = self.get_size()
@@ -182,15 +180,16 @@ class DoclingParseV2PageBackend(PdfPageBackend):
             padbox.r = page_size.width - padbox.r
             padbox.t = page_size.height - padbox.t
 
-        image = (
-            self._ppage.render(
-                scale=scale * 1.5,
-                rotation=0,  # no additional rotation
-                crop=padbox.as_tuple(),
-            )
-            .to_pil()
-            .resize(size=(round(cropbox.width * scale), round(cropbox.height * scale)))
-        )  # We resize the image from 1.5x the given scale to make it sharper.
+        image = self._ppage.render(
+            scale=scale * oversample,
+            rotation=0,  # no additional rotation
+            crop=padbox.as_tuple(),
+        ).to_pil()
+
+        # We resize the image from the oversampled scale to make it sharper.
+        size = (round(cropbox.width * scale), round(cropbox.height * scale))
+        if image.size != size:
+            image = image.resize(size=size)
 
         return image
 
@@ -200,6 +199,9 @@ class DoclingParseV2PageBackend(PdfPageBackend):
     def unload(self):
         self._ppage = None
         self._dpage = None
+        self._cell_rects = None
+        self._cell_texts = []
+        self._text_index = None
 
 
 class DoclingParseV2DocumentBackend(PdfDocumentBackend):
@@ -1,16 +1,75 @@
 from abc import ABC, abstractmethod
 from io import BytesIO
 from pathlib import Path
-from typing import Iterable, Optional, Set, Union
+from typing import Iterable, List, Optional, Set, Union
 
+import numpy as np
 from docling_core.types.doc import BoundingBox, Size
 from PIL import Image
+from rtree import index
 
 from docling.backend.abstract_backend import PaginatedDocumentBackend
-from docling.datamodel.base_models import Cell, InputFormat
+from docling.datamodel.base_models import Cell, InputFormat, PageCells
 from docling.datamodel.document import InputDocument
 
 
+class TextCellIndex:
+    """Spatial index over the text cells of a page, serving get_text_in_rect."""
+
+    def __init__(self, bboxes: np.ndarray, texts: List[str]):
+        # bboxes holds one (l, t, r, b) row per cell, in top-left origin. Rows are
+        # kept as given, since inverted cells never overlap a rect by the area test.
+        self._bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+        self._texts = texts
+        self._areas = (self._bboxes[:, 2] - self._bboxes[:, 0]) * (
+            self._bboxes[:, 3] - self._bboxes[:, 1]
+        )
+
+        # Only cells with a positive extent can overlap a rect
+        indexed = np.nonzero(
+            (self._bboxes[:, 2] > self._bboxes[:, 0])
+            & (self._bboxes[:, 3] > self._bboxes[:, 1])
+        )[0]
+        p = index.Property()
+        p.dimension = 2
+        if len(indexed) == 0:
+            self._index = index.Index(properties=p)
+        else:
+            self._index = index.Index(
+                ((int(i), tuple(self._bboxes[i]), None) for i in indexed),
+                properties=p,
+            )
+
+    def get_text_in_rect(self, bbox: BoundingBox, min_overlap: float = 0.5) -> str:
+        if bbox.r <= bbox.l or bbox.b <= bbox.t:
+            return ""
+
+        candidates = np.array(
+            sorted(self._index.intersection((bbox.l, bbox.t, bbox.r, bbox.b))),
+            dtype=np.intp,
+        )
+        if len(candidates) == 0:
+            return ""
+
+        cell_bboxes = self._bboxes[candidates]
+        width = np.minimum(cell_bboxes[:, 2], bbox.r) - np.maximum(
+            cell_bboxes[:, 0], bbox.l
+        )
+        height = np.minimum(cell_bboxes[:, 3], bbox.b) - np.maximum(
+            cell_bboxes[:, 1], bbox.t
+        )
+        intersection = np.where((width > 0) & (height > 0), width * height, 0.0)
+        overlap_frac = intersection / self._areas[candidates]
+
+        text_piece = ""
+        for i in candidates[overlap_frac > min_overlap]:
+            if len(text_piece) > 0:
+                text_piece += " "
+            text_piece += self._texts[i]
+
+        return text_piece
+
+
 class PdfPageBackend(ABC):
 
     @abstractmethod
@@ -21,13 +80,19 @@ class PdfPageBackend(ABC):
     def get_text_cells(self) -> Iterable[Cell]:
         pass
 
+    def get_page_cells(self) -> PageCells:
+        return PageCells.from_cells(self.get_text_cells())
+
     @abstractmethod
-    def get_bitmap_rects(self, float: int = 1) -> Iterable[BoundingBox]:
+    def get_bitmap_rects(self, scale: float = 1) -> Iterable[BoundingBox]:
         pass
 
     @abstractmethod
     def get_page_image(
-        self, scale: float = 1, cropbox: Optional[BoundingBox] = None
+        self,
+        scale: float = 1,
+        cropbox: Optional[BoundingBox] = None,
+        oversample: float = 1.5,
     ) -> Image.Image:
         pass
 
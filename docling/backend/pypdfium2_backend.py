@@ -193,7 +193,10 @@ class PyPdfiumPageBackend(PdfPageBackend):
         return cells
 
     def get_page_image(
-        self, scale: float = 1, cropbox: Optional[BoundingBox] = None
+        self,
+        scale: float = 1,
+        cropbox: Optional[BoundingBox] = None,
+        oversample: float = 1.5,
     ) -> Image.Image:
 
         page_size = self.get_size()
@@ -214,15 +217,16 @@ class PyPdfiumPageBackend(PdfPageBackend):
             padbox.r = page_size.width - padbox.r
             padbox.t = page_size.height - padbox.t
 
-        image = (
-            self._ppage.render(
-                scale=scale * 1.5,
-                rotation=0,  # no additional rotation
-                crop=padbox.as_tuple(),
-            )
-            .to_pil()
-            .resize(size=(round(cropbox.width * scale), round(cropbox.height * scale)))
-        )  # We resize the image from 1.5x the given scale to make it sharper.
+        image = self._ppage.render(
+            scale=scale * oversample,
+            rotation=0,  # no additional rotation
+            crop=padbox.as_tuple(),
+        ).to_pil()
+
+        # We resize the image from the oversampled scale to make it sharper.
+        size = (round(cropbox.width * scale), round(cropbox.height * scale))
+        if image.size != size:
+            image = image.resize(size=size)
 
         return image
 
@@ -10,10 +10,7 @@ from typing import Annotated, Dict, Iterable, List, Optional, Type
 import typer
 from docling_core.utils.file import resolve_file_source
 
-from docling.backend.docling_parse_backend import DoclingParseDocumentBackend
-from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
 from docling.backend.pdf_backend import PdfDocumentBackend
-from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
 from docling.datamodel.base_models import (
     ConversionStatus,
     FormatToExtensions,
@@ -129,6 +126,65 @@ def export_documents(
     )
 
 
+def get_format_options(
+    ocr: bool,
+    force_ocr: bool,
+    ocr_engine: OcrEngine,
+    pdf_backend: PdfBackend,
+    table_mode: TableFormerMode,
+    artifacts_path: Optional[Path],
+) -> Dict[InputFormat, FormatOption]:
+    match ocr_engine:
+        case OcrEngine.EASYOCR:
+            ocr_options: OcrOptions = EasyOcrOptions(force_full_page_ocr=force_ocr)
+        case OcrEngine.TESSERACT_CLI:
+            ocr_options = TesseractCliOcrOptions(force_full_page_ocr=force_ocr)
+        case OcrEngine.TESSERACT:
+            ocr_options = TesseractOcrOptions(force_full_page_ocr=force_ocr)
+        case _:
+            raise RuntimeError(f"Unexpected OCR engine type {ocr_engine}")
+
+    pipeline_options = PdfPipelineOptions(
+        do_ocr=ocr,
+        ocr_options=ocr_options,
+        do_table_structure=True,
+    )
+    pipeline_options.table_structure_options.do_cell_matching = True  # do_cell_matching
+    pipeline_options.table_structure_options.mode = table_mode
+
+    if artifacts_path is not None:
+        pipeline_options.artifacts_path = artifacts_path
+
+    # Only the selected PDF backend is imported.
+    match pdf_backend:
+        case PdfBackend.DLPARSE_V1:
+            from docling.backend.docling_parse_backend import (
+                DoclingParseDocumentBackend,
+            )
+
+            backend: Type[PdfDocumentBackend] = DoclingParseDocumentBackend
+        case PdfBackend.DLPARSE_V2:
+            from docling.backend.docling_parse_v2_backend import (
+                DoclingParseV2DocumentBackend,
+            )
+
+            backend = DoclingParseV2DocumentBackend
+        case PdfBackend.PYPDFIUM2:
+            from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+
+            backend = PyPdfiumDocumentBackend
+        case _:
+            raise RuntimeError(f"Unexpected PDF backend type {pdf_backend}")
+
+    format_options: Dict[InputFormat, FormatOption] = {
+        InputFormat.PDF: PdfFormatOption(
+            pipeline_options=pipeline_options,
+            backend=backend,  # pdf_backend
+        )
+    }
+    return format_options
+
+
 @app.command(no_args_is_help=True)
 def convert(
     input_sources: Annotated[
@@ -238,43 +294,14 @@ def convert(
     export_txt = OutputFormat.TEXT in to_formats
     export_doctags = OutputFormat.DOCTAGS in to_formats
 
-    match ocr_engine:
-        case OcrEngine.EASYOCR:
-            ocr_options: OcrOptions = EasyOcrOptions(force_full_page_ocr=force_ocr)
-        case OcrEngine.TESSERACT_CLI:
-            ocr_options = TesseractCliOcrOptions(force_full_page_ocr=force_ocr)
-        case OcrEngine.TESSERACT:
-            ocr_options = TesseractOcrOptions(force_full_page_ocr=force_ocr)
-        case _:
-            raise RuntimeError(f"Unexpected OCR engine type {ocr_engine}")
-
-    pipeline_options = PdfPipelineOptions(
-        do_ocr=ocr,
-        ocr_options=ocr_options,
-        do_table_structure=True,
+    format_options = get_format_options(
+        ocr=ocr,
+        force_ocr=force_ocr,
+        ocr_engine=ocr_engine,
+        pdf_backend=pdf_backend,
+        table_mode=table_mode,
+        artifacts_path=artifacts_path,
     )
-    pipeline_options.table_structure_options.do_cell_matching = True  # do_cell_matching
-    pipeline_options.table_structure_options.mode = table_mode
-
-    if artifacts_path is not None:
-        pipeline_options.artifacts_path = artifacts_path
-
-    match pdf_backend:
-        case PdfBackend.DLPARSE_V1:
-            backend: Type[PdfDocumentBackend] = DoclingParseDocumentBackend
-        case PdfBackend.DLPARSE_V2:
-            backend = DoclingParseV2DocumentBackend
-        case PdfBackend.PYPDFIUM2:
-            backend = PyPdfiumDocumentBackend
-        case _:
-            raise RuntimeError(f"Unexpected PDF backend type {pdf_backend}")
-
-    format_options: Dict[InputFormat, FormatOption] = {
-        InputFormat.PDF: PdfFormatOption(
-            pipeline_options=pipeline_options,
-            backend=backend,  # pdf_backend
-        )
-    }
     doc_converter = DocumentConverter(
         allowed_formats=from_formats,
         format_options=format_options,
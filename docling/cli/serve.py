@@ -0,0 +1,162 @@
+import logging
+import warnings
+from pathlib import Path
+from typing import Annotated, List, Optional
+
+import typer
+
+from docling.cli.main import OcrEngine, PdfBackend, get_format_options
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.pipeline_options import TableFormerMode
+from docling.document_converter import DocumentConverter
+from docling.server import ConversionServer
+
+warnings.filterwarnings(action="ignore", category=UserWarning, module="pydantic|torch")
+warnings.filterwarnings(action="ignore", category=FutureWarning, module="easyocr")
+
+_log = logging.getLogger(__name__)
+
+app = typer.Typer(
+    name="Docling Server",
+    add_completion=False,
+    pretty_exceptions_enable=False,
+)
+
+
+@app.command()
+def serve(
+    host: Annotated[
+        str, typer.Option(..., help="Host to listen on for HTTP requests.")
+    ] = "127.0.0.1",
+    port: Annotated[
+        int, typer.Option(..., help="Port to listen on for HTTP requests.")
+    ] = 5001,
+    socket_path: Annotated[
+        Optional[Path],
+        typer.Option(
+            ..., "--socket", help="If provided, listen on this Unix socket instead."
+        ),
+    ] = None,
+    from_formats: List[InputFormat] = typer.Option(
+        None,
+        "--from",
+        help="Specify input formats to accept. Defaults to all formats.",
+    ),
+    ocr: Annotated[
+        bool,
+        typer.Option(
+            ..., help="If enabled, the bitmap content will be processed using OCR."
+        ),
+    ] = True,
+    force_ocr: Annotated[
+        bool,
+        typer.Option(
+            ...,
+            help="Replace any existing text with OCR generated text over the full content.",
+        ),
+    ] = False,
+    ocr_engine: Annotated[
+        OcrEngine, typer.Option(..., help="The OCR engine to use.")
+    ] = OcrEngine.EASYOCR,
+    pdf_backend: Annotated[
+        PdfBackend, typer.Option(..., help="The PDF backend to use.")
+    ] = PdfBackend.DLPARSE_V1,
+    table_mode: Annotated[
+        TableFormerMode,
+        typer.Option(..., help="The mode to use in the table structure model."),
+    ] = TableFormerMode.FAST,
+    artifacts_path: Annotated[
+        Optional[Path],
+        typer.Option(..., help="If provided, the location of the model artifacts."),
+    ] = None,
+    max_queued_pages: Annotated[
+        int,
+        typer.Option(
+            ..., help="Reject new requests while more pages are waiting for conversion."
+        ),
+    ] = 1000,
+    max_queued_requests: Annotated[
+        int,
+        typer.Option(
+            ..., help="Reject new requests while this many requests are in progress."
+        ),
+    ] = 100,
+    batch_size: Annotated[
+        int,
+        typer.Option(..., help="Maximum number of requests converted as one batch."),
+    ] = 8,
+    batch_wait_time: Annotated[
+        float,
+        typer.Option(
+            ..., help="Seconds to wait for concurrent requests to join a batch."
+        ),
+    ] = 0.05,
+    allow_source_paths: Annotated[
+        Optional[List[Path]],
+        typer.Option(
+            ...,
+            help="Allow requests to convert server-side files below this directory, can be repeated.",
+        ),
+    ] = None,
+    allow_source_urls: Annotated[
+        bool,
+        typer.Option(..., help="Allow requests to convert URLs fetched by the server."),
+    ] = False,
+    max_request_size: Annotated[
+        int,
+        typer.Option(
+            ..., help="Reject requests with a larger body, in bytes, with a 413."
+        ),
+    ] = 100
+    * 1024
+    * 1024,
+    verbose: Annotated[
+        int,
+        typer.Option(
+            "--verbose",
+            "-v",
+            count=True,
+            help="Set the verbosity level. -v for info logging, -vv for debug logging.",
+        ),
+    ] = 0,
+):
+    if verbose == 0:
+        logging.basicConfig(level=logging.WARNING)
+    elif verbose == 1:
+        logging.basicConfig(level=logging.INFO)
+    elif verbose == 2:
+        logging.basicConfig(level=logging.DEBUG)
+
+    if from_formats is None:
+        from_formats = [e for e in InputFormat]
+
+    format_options = get_format_options(
+        ocr=ocr,
+        force_ocr=force_ocr,
+        ocr_engine=ocr_engine,
+        pdf_backend=pdf_backend,
+        table_mode=table_mode,
+        artifacts_path=artifacts_path,
+    )
+    doc_converter = DocumentConverter(
+        allowed_formats=from_formats,
+        format_options=format_options,
+    )
+
+    server = ConversionServer(
+        doc_converter,
+        max_queued_pages=max_queued_pages,
+        max_queued_requests=max_queued_requests,
+        max_batch_size=batch_size,
+        batch_wait_time=batch_wait_time,
+        source_roots=allow_source_paths,
+        allow_source_urls=allow_source_urls,
+        max_request_size=max_request_size,
+    )
+    server.serve_forever(host=host, port=port, socket_path=socket_path)
+
+
+click_app = typer.main.get_command(app)
+
+if __name__ == "__main__":
+    app()
@@ -1,19 +1,36 @@
+import weakref
 from enum import Enum, auto
 from io import BytesIO
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
 
+import numpy as np
 from docling_core.types.doc import (
     BoundingBox,
+    CoordOrigin,
     DocItemLabel,
+    ImageRef,
     PictureDataType,
     Size,
     TableCell,
 )
 from PIL.Image import Image
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, GetCoreSchemaHandler, TypeAdapter
+from pydantic_core import core_schema
 
 if TYPE_CHECKING:
     from docling.backend.pdf_backend import PdfPageBackend
+    from docling.utils.image_store import PageImageStore
 
 
 class ConversionStatus(str, Enum):
@@ -105,6 +122,184 @@ class OcrCell(Cell):
     confidence: float
 
 
+class PageCells(Sequence[Cell]):
+    """Compact store of the text cells of a page.
+
+    The cells are kept column-wise: ids, bboxes (l, t, r, b in top-left origin),
+    OCR confidence and OCR flags in NumPy arrays, and all texts in a single
+    string table. It reads like a list of cells, building the Cell or OcrCell of
+    an entry only when it is accessed.
+    """
+
+    def __init__(
+        self,
+        texts: Sequence[str] = (),
+        bboxes: Optional[np.ndarray] = None,
+        ids: Optional[np.ndarray] = None,
+        confidence: Optional[np.ndarray] = None,
+        is_ocr: Optional[np.ndarray] = None,
+    ):
+        num_cells = len(texts)
+
+        self.bboxes = (
+            np.zeros((0, 4), dtype=np.float64)
+            if bboxes is None
+            else np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+        )
+        self.ids = (
+            np.arange(num_cells, dtype=np.int64)
+            if ids is None
+            else np.asarray(ids, dtype=np.int64)
+        )
+        self.confidence = (
+            np.ones(num_cells, dtype=np.float64)
+            if confidence is None
+            else np.asarray(confidence, dtype=np.float64)
+        )
+        self.is_ocr = (
+            np.zeros(num_cells, dtype=bool)
+            if is_ocr is None
+            else np.asarray(is_ocr, dtype=bool)
+        )
+        if not (
+            len(self.bboxes)
+            == len(self.ids)
+            == len(self.confidence)
+            == len(self.is_ocr)
+            == num_cells
+        ):
+            raise ValueError("All columns of PageCells must have the same length.")
+
+        self._text_table = "".join(texts)
+        self._text_offsets = np.zeros(num_cells + 1, dtype=np.int64)
+        np.cumsum([len(text) for text in texts], out=self._text_offsets[1:])
+
+    @classmethod
+    def from_cells(cls, cells: Iterable[Cell]) -> "PageCells":
+        if isinstance(cells, PageCells):
+            return cells
+
+        cells = list(cells)
+        for cell in cells:
+            if cell.bbox.coord_origin != CoordOrigin.TOPLEFT:
+                raise ValueError("PageCells only holds cells in top-left origin.")
+
+        return cls(
+            texts=[c.text for c in cells],
+            bboxes=np.array([c.bbox.as_tuple() for c in cells], dtype=np.float64),
+            ids=np.array([c.id for c in cells], dtype=np.int64),
+            confidence=np.array(
+                [c.confidence if isinstance(c, OcrCell) else 1.0 for c in cells],
+                dtype=np.float64,
+            ),
+            is_ocr=np.array([isinstance(c, OcrCell) for c in cells], dtype=bool),
+        )
+
+    @property
+    def texts(self) -> List[str]:
+        offsets = self._text_offsets.tolist()
+        return [self._text_table[start:end] for start, end in zip(offsets, offsets[1:])]
+
+    def take(self, indices: Union[Sequence[int], np.ndarray]) -> "PageCells":
+        indices = np.asarray(indices, dtype=np.intp).reshape(-1)
+        texts = self.texts
+        return PageCells(
+            texts=[texts[ix] for ix in indices.tolist()],
+            bboxes=self.bboxes[indices],
+            ids=self.ids[indices],
+            confidence=self.confidence[indices],
+            is_ocr=self.is_ocr[indices],
+        )
+
+    def __add__(self, other: Iterable[Cell]) -> "PageCells":
+        other = PageCells.from_cells(other)
+        return PageCells(
+            texts=self.texts + other.texts,
+            bboxes=np.concatenate([self.bboxes, other.bboxes]),
+            ids=np.concatenate([self.ids, other.ids]),
+            confidence=np.concatenate([self.confidence, other.confidence]),
+            is_ocr=np.concatenate([self.is_ocr, other.is_ocr]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, index: int) -> Cell: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PageCells": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PageCells index out of range")
+
+        return self._make_cell(
+            int(self.ids[index]),
+            self._text_table[self._text_offsets[index] : self._text_offsets[index + 1]],
+            self.bboxes[index].tolist(),
+            bool(self.is_ocr[index]),
+            float(self.confidence[index]),
+        )
+
+    def __iter__(self) -> Iterator[Cell]:
+        return map(
+            self._make_cell,
+            self.ids.tolist(),
+            self.texts,
+            self.bboxes.tolist(),
+            self.is_ocr.tolist(),
+            self.confidence.tolist(),
+        )
+
+    @staticmethod
+    def _make_cell(
+        id: int, text: str, bbox: List[float], is_ocr: bool, confidence: float
+    ) -> Cell:
+        l, t, r, b = bbox
+        cell_bbox = BoundingBox(l=l, t=t, r=r, b=b, coord_origin=CoordOrigin.TOPLEFT)
+        if is_ocr:
+            return OcrCell(id=id, text=text, bbox=cell_bbox, confidence=confidence)
+        return Cell(id=id, text=text, bbox=cell_bbox)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (PageCells, list, tuple)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"PageCells({list(self)!r})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        # Validated from (and serialized to) a list of cells, as before.
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda cells, info: [cell.model_dump(mode=info.mode) for cell in cells],
+                info_arg=True,
+            ),
+        )
+
+    @classmethod
+    def _validate(cls, value: Any) -> "PageCells":
+        if isinstance(value, PageCells):
+            return value
+        return cls.from_cells(_cell_list_adapter.validate_python(value))
+
+
+_cell_list_adapter = TypeAdapter(List[Union[OcrCell, Cell]])
+
+
 class Cluster(BaseModel):
     id: int
     label: DocItemLabel
@@ -130,6 +325,7 @@ class Table(BasePageElement):
     num_rows: int = 0
     num_cols: int = 0
     table_cells: List[TableCell]
+    image: Optional[ImageRef] = None  # Cropped at page assembly, when requested
 
 
 class TableStructurePrediction(BaseModel):
@@ -145,6 +341,7 @@ class FigureElement(BasePageElement):
     provenance: Optional[str] = None
     predicted_class: Optional[str] = None
     confidence: Optional[float] = None
+    image: Optional[ImageRef] = None  # Cropped at page assembly, when requested
 
 
 class FigureClassificationPrediction(BaseModel):
@@ -174,12 +371,13 @@ class AssembledUnit(BaseModel):
 
 
 class Page(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    # Assignments are validated, so that lists of cells get stored as PageCells.
+    model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=True)
 
     page_no: int
-    # page_hash: Optional[str] = None
+    page_hash: Optional[str] = None
     size: Optional[Size] = None
-    cells: List[Cell] = []
+    cells: PageCells = Field(default_factory=PageCells)
     predictions: PagePredictions = PagePredictions()
     assembled: Optional[AssembledUnit] = None
 
@@ -190,18 +388,52 @@ class Page(BaseModel):
     _image_cache: Dict[float, Image] = (
         {}
     )  # Cache of images in different scales. By default it is cleared during assembling.
+    _image_scales: List[float] = (
+        []
+    )  # Scales of the page images planned by the pipeline, rendered only once.
+    _image_oversample: float = 1.5  # Render images at this multiple of their scale.
+    _image_store: Optional["PageImageStore"] = (
+        None  # Store holding the page images after assembling, if memory-bounded.
+    )
+    _image_keys: Dict[float, int] = {}  # Keys of the page images in the image store.
 
     def get_image(self, scale: float = 1.0) -> Optional[Image]:
         if self._backend is None:
+            if self._image_store is not None and scale in self._image_keys:
+                return self._image_store.get(self._image_keys[scale])
             return self._image_cache.get(scale, None)
         if not scale in self._image_cache:
-            self._image_cache[scale] = self._backend.get_page_image(scale=scale)
+            # Derive the image from the closest larger cached one. Without one,
+            # render at the largest planned scale so the others derive from it.
+            larger_scales = [s for s in self._image_cache if s > scale]
+            if len(larger_scales) > 0:
+                source_scale = min(larger_scales)
+            else:
+                source_scale = max([scale, *self._image_scales])
+                self._image_cache[source_scale] = self._backend.get_page_image(
+                    scale=source_scale, oversample=self._image_oversample
+                )
+            if source_scale != scale:
+                size = self._backend.get_size()
+                self._image_cache[scale] = self._image_cache[source_scale].resize(
+                    size=(round(size.width * scale), round(size.height * scale))
+                )
         return self._image_cache[scale]
 
     @property
     def image(self) -> Optional[Image]:
         return self.get_image(scale=self._default_image_scale)
 
+    def store_images(self, image_store: "PageImageStore"):
+        """Move the cached page images to image_store, which bounds their memory."""
+        for scale, image in self._image_cache.items():
+            self._image_keys[scale] = image_store.put(image)
+        self._image_cache = {}
+        self._image_store = image_store
+
+        # The images are dropped from the store together with the page
+        weakref.finalize(self, image_store.discard, list(self._image_keys.values()))
+
 
 class DocumentStream(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -92,7 +92,8 @@ class InputDocument(BaseModel):
     filesize: Optional[int] = None
     page_count: int = 0
 
-    _backend: AbstractDocumentBackend  # Internal PDF backend used
+    # Internal PDF backend used, None once dropped, e.g. to cross a process boundary
+    _backend: Optional[AbstractDocumentBackend] = None
 
     def __init__(
         self,
@@ -137,7 +138,7 @@ class InputDocument(BaseModel):
                 )
 
             # For paginated backends, check if the maximum page count is exceeded.
-            if self.valid and self._backend.is_valid():
+            if self.valid and self._backend is not None and self._backend.is_valid():
                 if self._backend.supports_pagination() and isinstance(
                     self._backend, PaginatedDocumentBackend
                 ):
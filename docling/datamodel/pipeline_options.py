@@ -26,6 +26,20 @@ class OcrOptions(BaseModel):
     bitmap_area_threshold: float = (
         0.05  # percentage of the area for a bitmap to processed with OCR
     )
+    # Bitmaps closer than this distance (in pt) are OCRed together. 0: OCR each
+    # group of touching bitmaps by itself
+    bitmap_merge_distance: float = 0.0
+    # Skip OCR of rects whose area is covered by programmatic text cells to at
+    # least this fraction, e.g. 0.15 for typical digital pages. None: always OCR
+    text_coverage_threshold: Optional[float] = None
+    text_density_threshold: float = (
+        0.002  # minimum programmatic characters per pt^2 for a rect to be skipped
+    )
+    # Reuse the OCR results of identical crops, e.g. recurring letterheads or
+    # forms. Results are cached in memory, and on disk when a path is given.
+    cache_memory_size: int = 0  # in bytes, 0: no in-memory cache
+    cache_path: Optional[Union[Path, str]] = None
+    cache_max_size: Optional[int] = None  # on disk, in bytes, None: unbounded
 
 
 class EasyOcrOptions(OcrOptions):
@@ -34,6 +48,8 @@ class EasyOcrOptions(OcrOptions):
     use_gpu: bool = True  # same default as easyocr.Reader
     model_storage_directory: Optional[str] = None
     download_enabled: bool = True  # same default as easyocr.Reader
+    batch_size: int = 4  # number of OCR rects detected together
+    recognition_batch_size: int = 16  # number of text lines recognized together
 
     model_config = ConfigDict(
         extra="forbid",
@@ -46,6 +62,9 @@ class TesseractCliOcrOptions(OcrOptions):
     lang: List[str] = ["fra", "deu", "spa", "eng"]
     tesseract_cmd: str = "tesseract"
     path: Optional[str] = None
+    # Number of tesseract processes running concurrently. Each is multi-threaded
+    # with OpenMP already, set OMP_THREAD_LIMIT=1 in the environment when raising it.
+    num_workers: int = 1
 
     model_config = ConfigDict(
         extra="forbid",
@@ -56,6 +75,9 @@ class TesseractOcrOptions(OcrOptions):
     kind: Literal["tesserocr"] = "tesserocr"
     lang: List[str] = ["fra", "deu", "spa", "eng"]
     path: Optional[str] = None
+    # Number of OCR rects processed concurrently. Tesseract is multi-threaded with
+    # OpenMP already, set OMP_THREAD_LIMIT=1 in the environment when raising it.
+    num_workers: int = 1
 
     model_config = ConfigDict(
         extra="forbid",
@@ -79,6 +101,19 @@ class PdfPipelineOptions(PipelineOptions):
     )
 
     images_scale: float = 1.0
+    # Page images are rendered at this multiple of their scale and downsampled,
+    # which makes them sharper. 1.0: render directly at the target scale
+    images_oversample: float = 1.5
     generate_page_images: bool = False
     generate_picture_images: bool = False
     generate_table_images: bool = False
+    # Memory budget for the page images kept by the generate_*_images options, in
+    # bytes. Images beyond it are spilled to disk and loaded back on access.
+    # None: unbounded
+    images_max_memory: Optional[int] = None
+    images_spill_path: Optional[Union[Path, str]] = None  # None: system temp dir
+
+    # Directory to memoize the per-page results of the OCR, layout and table
+    # structure stages. None: disabled
+    page_cache_path: Optional[Union[Path, str]] = None
+    page_cache_max_size: Optional[int] = None  # in bytes, None: unbounded
@@ -0,0 +1,44 @@
+import sys
+from typing import List, Optional
+
+from docling_core.types.doc import DoclingDocument
+from pydantic import Base64Bytes, BaseModel, model_validator
+
+from docling.datamodel.base_models import ConversionStatus, ErrorItem
+
+
+class ConversionRequest(BaseModel):
+    # Either a path or URL resolved by the server, if it allows them, or the file
+    # content.
+    source: Optional[str] = None
+    filename: Optional[str] = None
+    content: Optional[Base64Bytes] = None
+
+    max_num_pages: int = sys.maxsize
+    max_file_size: int = sys.maxsize
+
+    @model_validator(mode="after")
+    def check_source(self) -> "ConversionRequest":
+        if (self.source is None) == (self.content is None):
+            raise ValueError("Exactly one of source and content must be provided.")
+        if self.content is not None and self.filename is None:
+            raise ValueError("A filename must be provided with the content.")
+        return self
+
+
+class ConversionResponse(BaseModel):
+    filename: str
+    status: ConversionStatus
+    errors: List[ErrorItem] = []
+    document: Optional[DoclingDocument] = None
+
+
+class ServerHealth(BaseModel):
+    queued_requests: int
+    queued_pages: int
+    max_queued_pages: int
+    max_queued_requests: int
+
+
+class ErrorMessage(BaseModel):
+    detail: str
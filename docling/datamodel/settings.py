@@ -1,4 +1,5 @@
 import sys
+from enum import Enum
 from pathlib import Path
 
 from pydantic import BaseModel
@@ -10,11 +11,25 @@ class DocumentLimits(BaseModel):
     max_file_size: int = sys.maxsize
 
 
+class DocBatchExecutor(str, Enum):
+    SERIAL = "serial"  # convert documents one after the other in this process
+    PROCESS_POOL = "process_pool"  # convert documents in warm worker processes
+
+
 class BatchConcurrencySettings(BaseModel):
     doc_batch_size: int = 2
     doc_batch_concurrency: int = 2
+    doc_batch_executor: DocBatchExecutor = DocBatchExecutor.SERIAL
+    doc_batch_ordered: bool = True  # False: yield results as workers complete them
+    # True: pool the pages of all documents in a doc batch into shared page batches
+    doc_page_pooling: bool = False
     page_batch_size: int = 4
     page_batch_concurrency: int = 2
+    # True: run each page stage on its own thread, overlapping the stages of
+    # consecutive page batches. page_stage_queue_size bounds the batches queued
+    # between two stages.
+    page_stage_pipelining: bool = False
+    page_stage_queue_size: int = 2
     elements_batch_size: int = 16
 
     # doc_batch_size: int = 1
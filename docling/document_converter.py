@@ -1,31 +1,71 @@
+import asyncio
+import importlib
 import logging
+import multiprocessing
 import sys
 import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import aclosing
 from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional, Type
+from typing import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
-from pydantic import BaseModel, ConfigDict, model_validator, validate_call
+from docling_core.types.doc import DoclingDocument
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    model_validator,
+    validate_call,
+)
 
 from docling.backend.abstract_backend import AbstractDocumentBackend
-from docling.backend.asciidoc_backend import AsciiDocBackend
-from docling.backend.docling_parse_backend import DoclingParseDocumentBackend
-from docling.backend.html_backend import HTMLDocumentBackend
-from docling.backend.md_backend import MarkdownDocumentBackend
-from docling.backend.mspowerpoint_backend import MsPowerpointDocumentBackend
-from docling.backend.msword_backend import MsWordDocumentBackend
-from docling.datamodel.base_models import ConversionStatus, DocumentStream, InputFormat
+from docling.datamodel.base_models import (
+    ConversionStatus,
+    DocumentStream,
+    ErrorItem,
+    InputFormat,
+)
 from docling.datamodel.document import (
     ConversionResult,
     InputDocument,
     _DocumentConversionInput,
 )
 from docling.datamodel.pipeline_options import PipelineOptions
-from docling.datamodel.settings import DocumentLimits, settings
-from docling.pipeline.base_pipeline import BasePipeline
+from docling.datamodel.settings import (
+    BatchConcurrencySettings,
+    DebugSettings,
+    DocBatchExecutor,
+    DocumentLimits,
+    settings,
+)
+from docling.pipeline.base_pipeline import BasePipeline, PaginatedPipeline
 from docling.pipeline.simple_pipeline import SimplePipeline
-from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
-from docling.utils.utils import chunkify
+from docling.utils.cache import BaseCacheStore
+from docling.utils.utils import chunkify, create_hash, get_docling_version
 
 _log = logging.getLogger(__name__)
 
@@ -44,66 +84,131 @@ class FormatOption(BaseModel):
         return self
 
 
+def _import_on_use(module: str, name: str) -> Callable[[], Type]:
+    # Backends and pipelines pull in heavy dependencies (bs4, python-docx,
+    # docling-parse, torch, ...), they are only imported when first used.
+    def import_class() -> Type:
+        return getattr(importlib.import_module(module), name)
+
+    return import_class
+
+
 class WordFormatOption(FormatOption):
     pipeline_cls: Type = SimplePipeline
-    backend: Type[AbstractDocumentBackend] = MsWordDocumentBackend
+    backend: Type[AbstractDocumentBackend] = Field(
+        default_factory=_import_on_use(
+            "docling.backend.msword_backend", "MsWordDocumentBackend"
+        )
+    )
 
 
 class PowerpointFormatOption(FormatOption):
     pipeline_cls: Type = SimplePipeline
-    backend: Type[AbstractDocumentBackend] = MsPowerpointDocumentBackend
+    backend: Type[AbstractDocumentBackend] = Field(
+        default_factory=_import_on_use(
+            "docling.backend.mspowerpoint_backend", "MsPowerpointDocumentBackend"
+        )
+    )
 
 
 class MarkdownFormatOption(FormatOption):
     pipeline_cls: Type = SimplePipeline
-    backend: Type[AbstractDocumentBackend] = MarkdownDocumentBackend
+    backend: Type[AbstractDocumentBackend] = Field(
+        default_factory=_import_on_use(
+            "docling.backend.md_backend", "MarkdownDocumentBackend"
+        )
+    )
 
 
 class AsciiDocFormatOption(FormatOption):
     pipeline_cls: Type = SimplePipeline
-    backend: Type[AbstractDocumentBackend] = AsciiDocBackend
+    backend: Type[AbstractDocumentBackend] = Field(
+        default_factory=_import_on_use(
+            "docling.backend.asciidoc_backend", "AsciiDocBackend"
+        )
+    )
 
 
 class HTMLFormatOption(FormatOption):
     pipeline_cls: Type = SimplePipeline
-    backend: Type[AbstractDocumentBackend] = HTMLDocumentBackend
+    backend: Type[AbstractDocumentBackend] = Field(
+        default_factory=_import_on_use(
+            "docling.backend.html_backend", "HTMLDocumentBackend"
+        )
+    )
 
 
 class PdfFormatOption(FormatOption):
-    pipeline_cls: Type = StandardPdfPipeline
-    backend: Type[AbstractDocumentBackend] = DoclingParseDocumentBackend
+    pipeline_cls: Type = Field(
+        default_factory=_import_on_use(
+            "docling.pipeline.standard_pdf_pipeline", "StandardPdfPipeline"
+        )
+    )
+    backend: Type[AbstractDocumentBackend] = Field(
+        default_factory=_import_on_use(
+            "docling.backend.docling_parse_backend", "DoclingParseDocumentBackend"
+        )
+    )
 
 
 class ImageFormatOption(FormatOption):
-    pipeline_cls: Type = StandardPdfPipeline
-    backend: Type[AbstractDocumentBackend] = DoclingParseDocumentBackend
-
-
-_format_to_default_options = {
-    InputFormat.DOCX: FormatOption(
-        pipeline_cls=SimplePipeline, backend=MsWordDocumentBackend
-    ),
-    InputFormat.PPTX: FormatOption(
-        pipeline_cls=SimplePipeline, backend=MsPowerpointDocumentBackend
-    ),
-    InputFormat.MD: FormatOption(
-        pipeline_cls=SimplePipeline, backend=MarkdownDocumentBackend
-    ),
-    InputFormat.ASCIIDOC: FormatOption(
-        pipeline_cls=SimplePipeline, backend=AsciiDocBackend
-    ),
-    InputFormat.HTML: FormatOption(
-        pipeline_cls=SimplePipeline, backend=HTMLDocumentBackend
-    ),
-    InputFormat.IMAGE: FormatOption(
-        pipeline_cls=StandardPdfPipeline, backend=DoclingParseDocumentBackend
-    ),
-    InputFormat.PDF: FormatOption(
-        pipeline_cls=StandardPdfPipeline, backend=DoclingParseDocumentBackend
-    ),
+    pipeline_cls: Type = Field(
+        default_factory=_import_on_use(
+            "docling.pipeline.standard_pdf_pipeline", "StandardPdfPipeline"
+        )
+    )
+    backend: Type[AbstractDocumentBackend] = Field(
+        default_factory=_import_on_use(
+            "docling.backend.docling_parse_backend", "DoclingParseDocumentBackend"
+        )
+    )
+
+
+_format_to_default_options: Dict[InputFormat, Type[FormatOption]] = {
+    InputFormat.DOCX: WordFormatOption,
+    InputFormat.PPTX: PowerpointFormatOption,
+    InputFormat.MD: MarkdownFormatOption,
+    InputFormat.ASCIIDOC: AsciiDocFormatOption,
+    InputFormat.HTML: HTMLFormatOption,
+    InputFormat.IMAGE: ImageFormatOption,
+    InputFormat.PDF: PdfFormatOption,
 }
 
 
+class _DefaultFormatOptions(Dict[InputFormat, FormatOption]):
+    """Format options which create the default options of a format, and thereby
+    import its backend and pipeline, when the format is first looked up."""
+
+    def __init__(self, formats: Iterable[InputFormat]):
+        super().__init__({f: None for f in formats})  # type: ignore
+
+    def __getitem__(self, format: InputFormat) -> FormatOption:
+        option = super().__getitem__(format)
+        if option is None:
+            option = _format_to_default_options[format]()
+            self[format] = option
+        return option
+
+    def get(self, format, default=None):  # type: ignore
+        return self[format] if format in self else default
+
+    def values(self):  # type: ignore
+        return [self[f] for f in self]
+
+    def items(self):  # type: ignore
+        return [(f, self[f]) for f in self]
+
+    def __reduce__(self):
+        # Formats not looked up yet stay lazy in the worker processes.
+        return (
+            _DefaultFormatOptions,
+            (list(self.keys()),),
+            None,
+            None,
+            ((f, o) for f, o in super().items() if o is not None),
+        )
+
+
 class DocumentConverter:
     _default_download_filename = "file"
 
@@ -111,9 +216,10 @@ class DocumentConverter:
         self,
         allowed_formats: Optional[List[InputFormat]] = None,
         format_options: Optional[Dict[InputFormat, FormatOption]] = None,
+        cache_store: Optional[BaseCacheStore] = None,
     ):
         self.allowed_formats = allowed_formats
-        self.format_to_options = format_options
+        self.cache_store = cache_store  # conversion results cache, None: disabled
 
         if self.allowed_formats is None:
             # if self.format_to_options is not None:
@@ -121,23 +227,19 @@ class DocumentConverter:
             # else:
             self.allowed_formats = [e for e in InputFormat]  # all formats
 
-        if self.format_to_options is None:
-            self.format_to_options = _format_to_default_options
-        else:
-            for f in self.allowed_formats:
-                if f not in self.format_to_options.keys():
-                    _log.debug(f"Requested format {f} will use default options.")
-                    self.format_to_options[f] = _format_to_default_options[f]
-
-            remove_keys = []
-            for f in self.format_to_options.keys():
-                if f not in self.allowed_formats:
-                    remove_keys.append(f)
-
-            for f in remove_keys:
-                self.format_to_options.pop(f)
+        # Formats without explicit options use the default ones, created on use.
+        self.format_to_options: Dict[InputFormat, FormatOption] = _DefaultFormatOptions(
+            self.allowed_formats
+        )
+        for f, option in (format_options or {}).items():
+            if f in self.allowed_formats:
+                self.format_to_options[f] = option
+            else:
+                _log.debug(f"Ignoring options of format {f}, which is not allowed.")
 
         self.initialized_pipelines: Dict[Type[BasePipeline], BasePipeline] = {}
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_executor: Optional[ThreadPoolExecutor] = None
 
     def initialize_pipeline(self, format: InputFormat):
         """Initialize the conversion pipeline for the selected format."""
@@ -178,18 +280,168 @@ class DocumentConverter:
         )
         conv_res_iter = self._convert(conv_input, raises_on_error=raises_on_error)
         for conv_res in conv_res_iter:
-            if raises_on_error and conv_res.status not in {
-                ConversionStatus.SUCCESS,
-                ConversionStatus.PARTIAL_SUCCESS,
-            }:
-                raise RuntimeError(
-                    f"Conversion failed for: {conv_res.input.file} with status: {conv_res.status}"
+            self._check_conversion_status(conv_res, raises_on_error=raises_on_error)
+            yield conv_res
+
+    async def aconvert(
+        self,
+        source: Path | str | DocumentStream,
+        raises_on_error: bool = True,
+        max_num_pages: int = sys.maxsize,
+        max_file_size: int = sys.maxsize,
+    ) -> ConversionResult:
+        """Convert a single document without blocking the event loop."""
+        async with aclosing(
+            self.aconvert_all(
+                source=[source],
+                raises_on_error=raises_on_error,
+                max_num_pages=max_num_pages,
+                max_file_size=max_file_size,
+            )
+        ) as all_res:
+            async for conv_res in all_res:
+                return conv_res
+
+        raise RuntimeError(f"Conversion of {source} returned no result.")
+
+    async def aconvert_all(
+        self,
+        source: Union[
+            Iterable[Path | str | DocumentStream],
+            AsyncIterable[Path | str | DocumentStream],
+        ],
+        raises_on_error: bool = True,
+        max_num_pages: int = sys.maxsize,
+        max_file_size: int = sys.maxsize,
+    ) -> AsyncGenerator[ConversionResult, None]:
+        """Convert documents without blocking the event loop.
+
+        The conversions run on the converter's executor: a single worker thread,
+        or the worker processes if the process-pool executor is configured. At
+        most doc_batch_concurrency * doc_batch_size documents are in flight, the
+        next sources are only consumed as results are taken from the iterator.
+        Closing the iterator or cancelling the consuming task drops the queued
+        conversions.
+        """
+        limits = DocumentLimits(
+            max_num_pages=max_num_pages,
+            max_file_size=max_file_size,
+        )
+        loop = asyncio.get_running_loop()
+        if settings.perf.doc_batch_executor == DocBatchExecutor.PROCESS_POOL:
+            executor: Executor = self._get_process_pool()
+            convert_source = _convert_in_worker
+        else:
+            executor = self._get_thread_executor()
+            convert_source = self._convert_source
+        max_in_flight = max(
+            1, settings.perf.doc_batch_concurrency * settings.perf.doc_batch_size
+        )
+
+        pending: Deque[asyncio.Future] = deque()
+        try:
+            async for item in _aiter_sources(source):
+                pending.append(
+                    loop.run_in_executor(
+                        executor, convert_source, item, limits, raises_on_error
+                    )
                 )
-            else:
-                yield conv_res
+                if len(pending) >= max_in_flight:
+                    for conv_res in await self._acollect_results(pending):
+                        self._check_conversion_status(conv_res, raises_on_error)
+                        yield conv_res
+
+            while pending:
+                for conv_res in await self._acollect_results(pending):
+                    self._check_conversion_status(conv_res, raises_on_error)
+                    yield conv_res
+        finally:
+            # Consumer stopped early, got cancelled or a conversion raised.
+            for future in pending:
+                future.cancel()
+
+    def convert_batch(
+        self, in_docs: List[InputDocument], raises_on_error: bool = True
+    ) -> Iterator[ConversionResult]:
+        """Convert opened input documents as one batch, in their order.
+
+        The pages of documents handled by the same paginated pipeline are pooled
+        into shared page batches, regardless of settings.perf.doc_page_pooling.
+        This is the entry point of callers which open the documents themselves,
+        e.g. the conversion server.
+        """
+        conv_res_iter = self._process_document_batch(
+            in_docs, raises_on_error=raises_on_error
+        )
+        for conv_res in conv_res_iter:
+            assert conv_res is not None
+            self._check_conversion_status(conv_res, raises_on_error)
+            yield conv_res
+
+    async def _acollect_results(
+        self, pending: Deque[asyncio.Future]
+    ) -> List[ConversionResult]:
+        if settings.perf.doc_batch_ordered:
+            done = [pending[0]]
+            await done[0]
+            pending.popleft()
+        else:
+            done_set, _ = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            done = [f for f in pending if f in done_set]
+            for future in done:
+                pending.remove(future)
+
+        results = []
+        for future in done:
+            for item in future.result():
+                _log.info(f"Finished converting document {item.input.file.name}.")
+                results.append(item)
+        return results
+
+    def _check_conversion_status(
+        self, conv_res: ConversionResult, raises_on_error: bool
+    ):
+        if raises_on_error and conv_res.status not in {
+            ConversionStatus.SUCCESS,
+            ConversionStatus.PARTIAL_SUCCESS,
+        }:
+            raise RuntimeError(
+                f"Conversion failed for: {conv_res.input.file} with status: {conv_res.status}"
+            )
+
+    def _convert_source(
+        self,
+        source: Path | str | DocumentStream,
+        limits: Optional[DocumentLimits],
+        raises_on_error: bool,
+    ) -> List[ConversionResult]:
+        conv_input = _DocumentConversionInput(
+            path_or_stream_iterator=[source], limits=limits
+        )
+        return list(self._convert_serial(conv_input, raises_on_error=raises_on_error))
+
+    def _get_thread_executor(self) -> ThreadPoolExecutor:
+        if self._thread_executor is None:
+            # A single thread: the PDF backends are not thread-safe.
+            self._thread_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="docling-convert"
+            )
+        return self._thread_executor
 
     def _convert(
         self, conv_input: _DocumentConversionInput, raises_on_error: bool
+    ) -> Iterator[ConversionResult]:
+        if settings.perf.doc_batch_executor == DocBatchExecutor.PROCESS_POOL:
+            yield from self._convert_with_process_pool(
+                conv_input, raises_on_error=raises_on_error
+            )
+        else:
+            yield from self._convert_serial(conv_input, raises_on_error=raises_on_error)
+
+    def _convert_serial(
+        self, conv_input: _DocumentConversionInput, raises_on_error: bool
     ) -> Iterator[ConversionResult]:
         assert self.format_to_options is not None
 
@@ -208,10 +460,19 @@ class DocumentConverter:
             #   yield from pool.map(self.process_document, input_batch)
             # Note: PDF backends are not thread-safe, thread pool usage was disabled.
 
-            for item in map(
-                partial(self._process_document, raises_on_error=raises_on_error),
-                input_batch,
-            ):
+            if settings.perf.doc_page_pooling:
+                batch_results: Iterable[Optional[ConversionResult]] = (
+                    self._process_document_batch(
+                        input_batch, raises_on_error=raises_on_error
+                    )
+                )
+            else:
+                batch_results = map(
+                    partial(self._process_document, raises_on_error=raises_on_error),
+                    input_batch,
+                )
+
+            for item in batch_results:
                 elapsed = time.monotonic() - start_time
                 start_time = time.monotonic()
 
@@ -223,6 +484,77 @@ class DocumentConverter:
                 else:
                     _log.info(f"Skipped a document. We lost {elapsed:.2f} sec.")
 
+    def _convert_with_process_pool(
+        self, conv_input: _DocumentConversionInput, raises_on_error: bool
+    ) -> Iterator[ConversionResult]:
+        pool = self._get_process_pool()
+        max_in_flight = max(
+            1, settings.perf.doc_batch_concurrency * settings.perf.doc_batch_size
+        )
+
+        pending: Deque[Future] = deque()
+        try:
+            for source in conv_input.path_or_stream_iterator:
+                pending.append(
+                    pool.submit(
+                        _convert_in_worker,
+                        source,
+                        conv_input.limits,
+                        raises_on_error,
+                    )
+                )
+                if len(pending) >= max_in_flight:
+                    yield from self._collect_worker_results(pending)
+
+            while pending:
+                yield from self._collect_worker_results(pending)
+        finally:
+            # Consumer stopped early or a conversion raised: drop queued work.
+            for future in pending:
+                future.cancel()
+
+    def _collect_worker_results(
+        self, pending: Deque[Future]
+    ) -> Iterator[ConversionResult]:
+        if settings.perf.doc_batch_ordered:
+            done = [pending.popleft()]
+        else:
+            done_set, _ = wait(pending, return_when=FIRST_COMPLETED)
+            done = [f for f in pending if f in done_set]
+            for future in done:
+                pending.remove(future)
+
+        for future in done:
+            for item in future.result():
+                _log.info(f"Finished converting document {item.input.file.name}.")
+                yield item
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            # Use spawn: forking a process with loaded torch models can deadlock.
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=settings.perf.doc_batch_concurrency,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker_converter,
+                initargs=(
+                    self.allowed_formats,
+                    self.format_to_options,
+                    self.cache_store,
+                    settings.perf,
+                    settings.debug,
+                ),
+            )
+        return self._process_pool
+
+    def shutdown(self):
+        """Stop the worker processes and threads used by the executors."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True, cancel_futures=True)
+            self._process_pool = None
+        if self._thread_executor is not None:
+            self._thread_executor.shutdown(wait=True, cancel_futures=True)
+            self._thread_executor = None
+
     def _get_pipeline(self, doc_format: InputFormat) -> Optional[BasePipeline]:
         assert self.format_to_options is not None
 
@@ -256,6 +588,47 @@ class DocumentConverter:
 
         return conv_res
 
+    def _process_document_batch(
+        self, in_docs: List[InputDocument], raises_on_error: bool
+    ) -> Iterator[Optional[ConversionResult]]:
+        assert self.allowed_formats is not None
+
+        # Documents handled by the same paginated pipeline share their page batches
+        pooled_docs: Dict[int, Tuple[PaginatedPipeline, List[int]]] = {}
+        pooled_results: Dict[int, ConversionResult] = {}
+        cache_keys: Dict[int, str] = {}
+        for ix, in_doc in enumerate(in_docs):
+            assert in_doc.format in self.allowed_formats
+            if not in_doc.valid:
+                continue
+            pipeline = self._get_pipeline(in_doc.format)
+            if not isinstance(pipeline, PaginatedPipeline):
+                continue
+
+            if self.cache_store is not None:
+                cache_keys[ix] = self._get_cache_key(in_doc, pipeline)
+                cached_res = self._load_cached_result(in_doc, cache_keys[ix])
+                if cached_res is not None:
+                    pooled_results[ix] = cached_res
+                    continue
+
+            pooled_docs.setdefault(id(pipeline), (pipeline, []))[1].append(ix)
+
+        for pipeline, doc_indices in pooled_docs.values():
+            conv_results = pipeline.execute_batch(
+                [in_docs[ix] for ix in doc_indices], raises_on_error=raises_on_error
+            )
+            for ix, conv_res in zip(doc_indices, conv_results):
+                if ix in cache_keys:
+                    self._store_cached_result(conv_res, cache_keys[ix])
+                pooled_results[ix] = conv_res
+
+        for ix, in_doc in enumerate(in_docs):
+            if ix in pooled_results:
+                yield pooled_results[ix]
+            else:
+                yield self._process_document(in_doc, raises_on_error=raises_on_error)
+
     def _execute_pipeline(
         self, in_doc: InputDocument, raises_on_error: bool
     ) -> ConversionResult:
@@ -271,8 +644,18 @@ class DocumentConverter:
                     conv_res.status = ConversionStatus.FAILURE
                     return conv_res
 
+            cache_key = None
+            if self.cache_store is not None:
+                cache_key = self._get_cache_key(in_doc, pipeline)
+                cached_res = self._load_cached_result(in_doc, cache_key)
+                if cached_res is not None:
+                    return cached_res
+
             conv_res = pipeline.execute(in_doc, raises_on_error=raises_on_error)
 
+            if cache_key is not None:
+                self._store_cached_result(conv_res, cache_key)
+
         else:
             if raises_on_error:
                 raise RuntimeError(f"Input document {in_doc.file} is not valid.")
@@ -284,3 +667,130 @@ class DocumentConverter:
                 # TODO add error log why it failed.
 
         return conv_res
+
+    def _get_cache_key(self, in_doc: InputDocument, pipeline: BasePipeline) -> str:
+        assert self.format_to_options is not None
+
+        pipeline_cls = type(pipeline)
+        backend_cls = self.format_to_options[in_doc.format].backend
+        key_parts = [
+            in_doc.document_hash,
+            f"{pipeline_cls.__module__}.{pipeline_cls.__qualname__}",
+            f"{backend_cls.__module__}.{backend_cls.__qualname__}",
+            pipeline.pipeline_options.model_dump_json(),
+            get_docling_version(),
+        ]
+        return create_hash("\n".join(key_parts))
+
+    def _load_cached_result(
+        self, in_doc: InputDocument, cache_key: str
+    ) -> Optional[ConversionResult]:
+        assert self.cache_store is not None
+
+        cached = self.cache_store.get(cache_key)
+        if cached is None:
+            return None
+
+        try:
+            entry = _CachedConversion.model_validate_json(cached)
+        except ValidationError:
+            _log.warning(f"Ignoring invalid cache entry for {in_doc.file.name}.")
+            return None
+
+        _log.info(f"Using cached conversion result for {in_doc.file.name}.")
+        if in_doc._backend:
+            in_doc._backend.unload()
+
+        return ConversionResult(
+            input=in_doc,
+            status=entry.status,
+            errors=entry.errors,
+            document=entry.document,
+        )
+
+    def _store_cached_result(self, conv_res: ConversionResult, cache_key: str):
+        assert self.cache_store is not None
+
+        if conv_res.status not in {
+            ConversionStatus.SUCCESS,
+            ConversionStatus.PARTIAL_SUCCESS,
+        }:
+            return
+
+        entry = _CachedConversion(
+            status=conv_res.status,
+            errors=conv_res.errors,
+            document=conv_res.document,
+        )
+        self.cache_store.put(cache_key, entry.model_dump_json().encode("utf-8"))
+
+
+class _CachedConversion(BaseModel):
+    status: ConversionStatus
+    errors: List[ErrorItem] = []
+    document: DoclingDocument
+
+
+# Converter owned by each worker process of the process-pool executor. It keeps its
+# pipelines (and thereby the loaded models) warm across all documents of the worker.
+_worker_converter: Optional[DocumentConverter] = None
+
+
+def _init_worker_converter(
+    allowed_formats: Optional[List[InputFormat]],
+    format_options: Optional[Dict[InputFormat, FormatOption]],
+    cache_store: Optional[BaseCacheStore],
+    perf_settings: BatchConcurrencySettings,
+    debug_settings: DebugSettings,
+):
+    global _worker_converter
+    # Spawned workers start from a fresh settings object, carry over the parent's.
+    settings.perf = perf_settings.model_copy(
+        update={"doc_batch_executor": DocBatchExecutor.SERIAL}
+    )
+    settings.debug = debug_settings
+    _worker_converter = DocumentConverter(
+        allowed_formats=allowed_formats,
+        cache_store=cache_store,
+    )
+    if format_options is not None:
+        # Taken over as is, so that unused default options stay unresolved.
+        _worker_converter.format_to_options = format_options
+
+
+def _convert_in_worker(
+    source: Union[Path, str, DocumentStream],
+    limits: Optional[DocumentLimits],
+    raises_on_error: bool,
+) -> List[ConversionResult]:
+    assert _worker_converter is not None
+
+    conv_input = _DocumentConversionInput(
+        path_or_stream_iterator=[source], limits=limits
+    )
+    results = list(
+        _worker_converter._convert(conv_input, raises_on_error=raises_on_error)
+    )
+
+    # Backends hold native handles which can't cross the process boundary.
+    # They are already unloaded at the end of the pipeline.
+    for conv_res in results:
+        conv_res.input._backend = None
+        for page in conv_res.pages:
+            page._backend = None
+
+    return results
+
+
+async def _aiter_sources(
+    source: Union[
+        Iterable[Union[Path, str, DocumentStream]],
+        AsyncIterable[Union[Path, str, DocumentStream]],
+    ],
+) -> AsyncIterator[Union[Path, str, DocumentStream]]:
+    if isinstance(source, AsyncIterable):
+        async for item in source:
+            yield item
+    else:
+        for item in source:
+            yield item
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from itertools import groupby
+from typing import Any, Iterable, Tuple
 
 from docling_core.types.doc import DoclingDocument, NodeItem
 
@@ -14,6 +15,21 @@ class BasePageModel(ABC):
     ) -> Iterable[Page]:
         pass
 
+    def process_page_batch(
+        self, page_batch: Iterable[Tuple[ConversionResult, Page]]
+    ) -> Iterable[Tuple[ConversionResult, Page]]:
+        """Process a page batch which can mix pages of several documents.
+
+        By default, consecutive pages of the same document are passed to the
+        model together. Models which benefit from larger batches override this
+        to process all pages of the batch at once.
+        """
+        for _, doc_pages in groupby(page_batch, key=lambda item: id(item[0])):
+            doc_pages_list = list(doc_pages)
+            conv_res = doc_pages_list[0][0]
+            for page in self(conv_res, [page for _, page in doc_pages_list]):
+                yield conv_res, page
+
 
 class BaseEnrichmentModel(ABC):
 
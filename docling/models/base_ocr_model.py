@@ -1,82 +1,302 @@
 import copy
+import hashlib
 import logging
 from abc import abstractmethod
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from PIL import Image, ImageDraw
+from pydantic import TypeAdapter
 from rtree import index
-from scipy.ndimage import find_objects, label
 
-from docling.datamodel.base_models import Cell, OcrCell, Page
+from docling.datamodel.base_models import Cell, OcrCell, Page, PageCells, Size
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import OcrOptions
 from docling.datamodel.settings import settings
 from docling.models.base_model import BasePageModel
+from docling.utils.cache import (
+    BaseCacheStore,
+    InMemoryCacheStore,
+    LocalDirectoryCacheStore,
+)
+from docling.utils.utils import get_docling_version
 
 _log = logging.getLogger(__name__)
 
 
+# Above this many boxes, the union area is counted on a page raster
+_UNION_AREA_RASTER_MIN_BOXES = 64
+
+
+def _union_area(boxes: List[Tuple[int, int, int, int]], width: int, height: int) -> int:
+    # Area of the union of half-open integer boxes within the page
+    if len(boxes) >= _UNION_AREA_RASTER_MIN_BOXES:
+        mask = np.zeros((height, width), dtype=bool)
+        for l, t, r, b in boxes:
+            mask[t:b, l:r] = True
+        return int(np.count_nonzero(mask))
+
+    # Swept along x
+    xs = sorted({x for box in boxes for x in (box[0], box[2])})
+    area = 0
+    for x0, x1 in zip(xs[:-1], xs[1:]):
+        spans = sorted((t, b) for l, t, r, b in boxes if l <= x0 and r >= x1)
+        covered = 0
+        end = None
+        for t, b in spans:
+            if end is None or t > end:
+                covered += b - t
+                end = b
+            elif b > end:
+                covered += b - end
+                end = b
+        area += covered * (x1 - x0)
+    return area
+
+
+def _are_connected(a, b, distance: float = 0) -> bool:
+    # Half-open boxes which overlap or share an edge segment, as pixels which
+    # are 4-connected. With a distance, boxes within that gap are connected too.
+    gap_x = max(a[0], b[0]) - min(a[2], b[2])
+    gap_y = max(a[1], b[1]) - min(a[3], b[3])
+    if distance > 0:
+        return max(gap_x, gap_y) <= distance
+    return (gap_x < 0 and gap_y <= 0) or (gap_x <= 0 and gap_y < 0)
+
+
+def _connected_groups(boxes: List[Tuple], distance: float = 0) -> List[List[int]]:
+    # Indices of the connected boxes, candidate pairs are looked up in an R-tree
+    p = index.Property()
+    p.dimension = 2
+    box_index = index.Index(
+        ((ix, box[:4], None) for ix, box in enumerate(boxes)), properties=p
+    )
+
+    parents = list(range(len(boxes)))
+
+    def find(ix):
+        while parents[ix] != ix:
+            parents[ix] = parents[parents[ix]]
+            ix = parents[ix]
+        return ix
+
+    for ix, box in enumerate(boxes):
+        query = (
+            box[0] - distance,
+            box[1] - distance,
+            box[2] + distance,
+            box[3] + distance,
+        )
+        for jx in box_index.intersection(query):
+            if jx > ix and _are_connected(box, boxes[jx], distance=distance):
+                parents[find(ix)] = find(jx)
+
+    groups: Dict[int, List[int]] = {}
+    for ix in range(len(boxes)):
+        groups.setdefault(find(ix), []).append(ix)
+    return list(groups.values())
+
+
+def find_ocr_rects(
+    size: Size, bitmap_rects: Iterable[BoundingBox], merge_distance: float = 0.0
+) -> Tuple[float, List[BoundingBox]]:
+    """Group the bitmap rects of a page into the rects to OCR.
+
+    The bitmaps are snapped to the pixel grid of the page at scale 1, the groups
+    are their connected components. Returns the fraction of the page covered by
+    bitmaps and the bounding box of each group, with inclusive pixel coordinates.
+    Groups closer than merge_distance are merged into one.
+    """
+    width, height = round(size.width), round(size.height)
+
+    # Pixel boxes as drawn into a page raster, as half-open intervals
+    boxes: List[Tuple[int, int, int, int]] = []
+    for rect in bitmap_rects:
+        x0, y0, x1, y1 = (round(c) for c in rect.as_tuple())
+        box = (max(x0, 0), max(y0, 0), min(x1, width - 1) + 1, min(y1, height - 1) + 1)
+        if box[0] < box[2] and box[1] < box[3]:
+            boxes.append(box)
+
+    if len(boxes) == 0:
+        return (0.0, [])
+
+    def join(members):
+        # Enclosing box, followed by the first pixel in raster order
+        return (
+            min(member[0] for member in members),
+            min(member[1] for member in members),
+            max(member[2] for member in members),
+            max(member[3] for member in members),
+            min(member[4] for member in members),
+        )
+
+    # Find the connected components
+    groups = [(l, t, r, b, (t, l)) for l, t, r, b in boxes]
+    groups = [join([groups[ix] for ix in ixs]) for ixs in _connected_groups(groups)]
+
+    # Merge nearby components, until no more are close to each other
+    while merge_distance > 0:
+        merged = _connected_groups(groups, distance=merge_distance)
+        if len(merged) == len(groups):
+            break
+        groups = [join([groups[ix] for ix in ixs]) for ixs in merged]
+
+    # Enclosing bounding boxes, in the raster order of the components
+    groups.sort(key=lambda group: group[4])
+    bounding_boxes = [
+        BoundingBox(
+            l=l,
+            t=t,
+            r=r - 1,
+            b=b - 1,
+            coord_origin=CoordOrigin.TOPLEFT,
+        )
+        for l, t, r, b, _ in groups
+    ]
+
+    # Compute area fraction on page covered by bitmaps
+    area_frac = _union_area(boxes, width, height) / (size.width * size.height)
+
+    return (area_frac, bounding_boxes)
+
+
+_ocr_cells_adapter = TypeAdapter(List[OcrCell])
+
+
 class BaseOcrModel(BasePageModel):
     def __init__(self, enabled: bool, options: OcrOptions):
         self.enabled = enabled
         self.options = options
+        self.scale: float = 1.0  # scale at which the OCR engine sees the page
+        self.engine_version: str = ""  # version of the OCR engine, set when enabled
 
-    # Computes the optimum amount and coordinates of rectangles to OCR on a given page
-    def get_ocr_rects(self, page: Page) -> List[BoundingBox]:
-        BITMAP_COVERAGE_TRESHOLD = 0.75
-        assert page.size is not None
+        # OCR results by crop content, looked up in order
+        self.cache_stores: List[BaseCacheStore] = []
+        if self.options.cache_memory_size > 0:
+            self.cache_stores.append(
+                InMemoryCacheStore(max_size=self.options.cache_memory_size)
+            )
+        if self.options.cache_path is not None:
+            self.cache_stores.append(
+                LocalDirectoryCacheStore(
+                    self.options.cache_path, max_size=self.options.cache_max_size
+                )
+            )
 
-        def find_ocr_rects(size, bitmap_rects):
-            image = Image.new(
-                "1", (round(size.width), round(size.height))
-            )  # '1' mode is binary
+    def get_cache_key(self, image: Image.Image) -> Optional[str]:
+        """Key of the OCR results of a crop, None when caching is disabled.
 
-            # Draw all bitmap rects into a binary image
-            draw = ImageDraw.Draw(image)
-            for rect in bitmap_rects:
-                x0, y0, x1, y1 = rect.as_tuple()
-                x0, y0, x1, y1 = round(x0), round(y0), round(x1), round(y1)
-                draw.rectangle([(x0, y0), (x1, y1)], fill=1)
+        The crop content is hashed together with the engine and its version, the
+        options which change its output, the Docling version and the scale the
+        crop was rendered at.
+        """
+        if len(self.cache_stores) == 0:
+            return None
 
-            np_image = np.array(image)
+        hasher = hashlib.sha256()
+        engine = self.options.model_dump_json(
+            include={"kind", "lang", "path", "tesseract_cmd", "model_storage_directory"}
+        )
+        hasher.update(
+            f"{type(self).__name__}:{self.engine_version}:{engine}:"
+            f"{get_docling_version()}:{self.scale}".encode("utf-8")
+        )
+        hasher.update(f"{image.mode}:{image.size}".encode("utf-8"))
+        hasher.update(image.tobytes())
+        return hasher.hexdigest()
 
-            # Find the connected components
-            labeled_image, num_features = label(
-                np_image > 0
-            )  # Label black (0 value) regions
+    def get_cached_cells(self, cache_key: Optional[str]) -> Optional[List[OcrCell]]:
+        if cache_key is None:
+            return None
+        for ix, cache_store in enumerate(self.cache_stores):
+            value = cache_store.get(cache_key)
+            if value is not None:
+                # Promote to the faster stores
+                for faster_store in self.cache_stores[:ix]:
+                    faster_store.put(cache_key, value)
+                return _ocr_cells_adapter.validate_json(value)
+        return None
 
-            # Find enclosing bounding boxes for each connected component.
-            slices = find_objects(labeled_image)
-            bounding_boxes = [
-                BoundingBox(
-                    l=slc[1].start,
-                    t=slc[0].start,
-                    r=slc[1].stop - 1,
-                    b=slc[0].stop - 1,
-                    coord_origin=CoordOrigin.TOPLEFT,
-                )
-                for slc in slices
-            ]
+    def put_cached_cells(self, cache_key: Optional[str], cells: List[OcrCell]):
+        if cache_key is None:
+            return
+        value = _ocr_cells_adapter.dump_json(cells)
+        for cache_store in self.cache_stores:
+            cache_store.put(cache_key, value)
+
+    @staticmethod
+    def to_page_cells(cells: List[OcrCell], ocr_rect: BoundingBox) -> List[OcrCell]:
+        # Move the cells of a crop onto the page
+        return [
+            OcrCell(
+                id=cell.id,
+                text=cell.text,
+                confidence=cell.confidence,
+                bbox=BoundingBox.from_tuple(
+                    coord=(
+                        cell.bbox.l + ocr_rect.l,
+                        cell.bbox.t + ocr_rect.t,
+                        cell.bbox.r + ocr_rect.l,
+                        cell.bbox.b + ocr_rect.t,
+                    ),
+                    origin=CoordOrigin.TOPLEFT,
+                ),
+            )
+            for cell in cells
+        ]
+
+    # Computes the optimum amount and coordinates of rectangles to OCR on a given page
+    def get_ocr_rects(self, page: Page) -> List[BoundingBox]:
+        BITMAP_COVERAGE_TRESHOLD = 0.75
+        assert page.size is not None
 
-            # Compute area fraction on page covered by bitmaps
-            area_frac = np.sum(np_image > 0) / (size.width * size.height)
+        def has_programmatic_text(rect):
+            # Fraction of the rect covered by the programmatic cells and their
+            # character density, with the cells clipped to the rect
+            assert self.options.text_coverage_threshold is not None
+            bboxes = page.cells.bboxes
+            if rect.area() <= 0 or len(bboxes) == 0:
+                return False
+            l, t, r, b = rect.as_tuple()
+            widths = np.clip(
+                np.minimum(bboxes[:, 2], r) - np.maximum(bboxes[:, 0], l), 0, None
+            )
+            heights = np.clip(
+                np.minimum(bboxes[:, 3], b) - np.maximum(bboxes[:, 1], t), 0, None
+            )
+            inter = widths * heights
+            coverage = min(float(inter.sum()) / rect.area(), 1.0)
+
+            cell_areas = (bboxes[:, 2] - bboxes[:, 0]) * (bboxes[:, 3] - bboxes[:, 1])
+            inside = np.divide(
+                inter, cell_areas, out=np.zeros_like(inter), where=cell_areas > 0
+            )
+            texts = page.cells.texts
+            num_chars = sum(
+                len(texts[ix].strip()) for ix in np.flatnonzero(inside > 0.5)
+            )
+            density = num_chars / rect.area()
 
-            return (area_frac, bounding_boxes)  # fraction covered  # boxes
+            return (
+                coverage >= self.options.text_coverage_threshold
+                and density >= self.options.text_density_threshold
+            )
 
         if page._backend is not None:
             bitmap_rects = page._backend.get_bitmap_rects()
         else:
             bitmap_rects = []
-        coverage, ocr_rects = find_ocr_rects(page.size, bitmap_rects)
+        coverage, ocr_rects = find_ocr_rects(
+            page.size, bitmap_rects, merge_distance=self.options.bitmap_merge_distance
+        )
 
         # return full-page rectangle if sufficiently covered with bitmaps
         if self.options.force_full_page_ocr or coverage > max(
             BITMAP_COVERAGE_TRESHOLD, self.options.bitmap_area_threshold
         ):
-            return [
+            ocr_rects = [
                 BoundingBox(
                     l=0,
                     t=0,
@@ -95,7 +315,15 @@ class BaseOcrModel(BasePageModel):
                 if rect.area() / (page.size.width * page.size.height)
                 > self.options.bitmap_area_threshold
             ]
-            return ocr_rects
+
+        # skip OCR of rects whose text is already available programmatically
+        if (
+            not self.options.force_full_page_ocr
+            and self.options.text_coverage_threshold is not None
+        ):
+            ocr_rects = [rect for rect in ocr_rects if not has_programmatic_text(rect)]
+
+        return ocr_rects
 
     # Filters OCR cells by dropping any OCR cell that intersects with an existing programmatic cell.
     def _filter_ocr_cells(self, ocr_cells, programmatic_cells):
@@ -103,8 +331,8 @@ class BaseOcrModel(BasePageModel):
         p = index.Property()
         p.dimension = 2
         idx = index.Index(properties=p)
-        for i, cell in enumerate(programmatic_cells):
-            idx.insert(i, cell.bbox.as_tuple())
+        for i, bbox in enumerate(programmatic_cells.bboxes.tolist()):
+            idx.insert(i, bbox)
 
         def is_overlapping_with_existing_cells(ocr_cell):
             # Query the R-tree to get overlapping rectangles
@@ -119,7 +347,7 @@ class BaseOcrModel(BasePageModel):
         ]
         return filtered_ocr_cells
 
-    def post_process_cells(self, ocr_cells, programmatic_cells):
+    def post_process_cells(self, ocr_cells, programmatic_cells) -> PageCells:
         r"""
         Post-process the ocr and programmatic cells and return the final list of of cells
         """
@@ -129,12 +357,12 @@ class BaseOcrModel(BasePageModel):
                 Cell(id=c_ocr.id, text=c_ocr.text, bbox=c_ocr.bbox)
                 for c_ocr in ocr_cells
             ]
-            return cells
+            return PageCells.from_cells(cells)
 
         ## Remove OCR cells which overlap with programmatic cells.
+        programmatic_cells = PageCells.from_cells(programmatic_cells)
         filtered_ocr_cells = self._filter_ocr_cells(ocr_cells, programmatic_cells)
-        programmatic_cells.extend(filtered_ocr_cells)
-        return programmatic_cells
+        return programmatic_cells + filtered_ocr_cells
 
     def draw_ocr_rects_and_cells(self, conv_res, page, ocr_rects, show: bool = False):
         image = copy.deepcopy(page.image)
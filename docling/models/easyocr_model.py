@@ -1,8 +1,7 @@
 import logging
-from typing import Iterable
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy
-import torch
 from docling_core.types.doc import BoundingBox, CoordOrigin
 
 from docling.datamodel.base_models import Cell, OcrCell, Page
@@ -31,6 +30,7 @@ class EasyOcrModel(BaseOcrModel):
                     "Alternatively, Docling has support for other OCR engines. See the documentation."
                 )
 
+            self.engine_version = easyocr.__version__
             self.reader = easyocr.Reader(
                 lang_list=self.options.lang,
                 gpu=self.options.use_gpu,
@@ -38,6 +38,58 @@ class EasyOcrModel(BaseOcrModel):
                 download_enabled=self.options.download_enabled,
             )
 
+    def _batch_images(self, images: List[numpy.ndarray]) -> List[List[int]]:
+        # Group images of similar sizes, such that padding them to a common size
+        # at most doubles the pixels of any image in the group
+        batches: List[List[int]] = []
+        batch: List[int] = []
+        height = width = min_area = 0
+        for ix in sorted(range(len(images)), key=lambda ix: images[ix].shape[:2]):
+            im_height, im_width = images[ix].shape[:2]
+            if batch and (
+                len(batch) == self.options.batch_size
+                or max(height, im_height) * max(width, im_width)
+                > 2 * min(min_area, im_height * im_width)
+            ):
+                batches.append(batch)
+                batch = []
+            if not batch:
+                height, width, min_area = im_height, im_width, im_height * im_width
+            batch.append(ix)
+            height, width = max(height, im_height), max(width, im_width)
+            min_area = min(min_area, im_height * im_width)
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _read_images(self, images: List[numpy.ndarray]) -> List[list]:
+        # Detect and recognize the text in batches of images. The images of a
+        # batch are padded on the right and bottom, so that the coordinates of
+        # the detected text are unchanged.
+        results: List[list] = [[] for _ in images]
+        for batch_ixs in self._batch_images(images):
+            height = max(images[ix].shape[0] for ix in batch_ixs)
+            width = max(images[ix].shape[1] for ix in batch_ixs)
+
+            batch = []
+            for ix in batch_ixs:
+                im = images[ix]
+                if im.shape[:2] != (height, width):
+                    padded = numpy.full(
+                        (height, width, *im.shape[2:]), 255, dtype=im.dtype
+                    )
+                    padded[: im.shape[0], : im.shape[1]] = im
+                    im = padded
+                batch.append(im)
+
+            batch_results = self.reader.readtext_batched(
+                batch, batch_size=self.options.recognition_batch_size
+            )
+            for ix, result in zip(batch_ixs, batch_results):
+                results[ix] = result
+
+        return results
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
@@ -46,53 +98,72 @@ class EasyOcrModel(BaseOcrModel):
             yield from page_batch
             return
 
-        for page in page_batch:
-
-            assert page._backend is not None
-            if not page._backend.is_valid():
-                yield page
-            else:
-                with TimeRecorder(conv_res, "ocr"):
-                    ocr_rects = self.get_ocr_rects(page)
-
-                    all_ocr_cells = []
-                    for ocr_rect in ocr_rects:
-                        # Skip zero area boxes
-                        if ocr_rect.area() == 0:
-                            continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-                        im = numpy.array(high_res_image)
-                        result = self.reader.readtext(im)
-
-                        del high_res_image
-                        del im
-
-                        cells = [
-                            OcrCell(
-                                id=ix,
-                                text=line[1],
-                                confidence=line[2],
-                                bbox=BoundingBox.from_tuple(
-                                    coord=(
-                                        (line[0][0][0] / self.scale) + ocr_rect.l,
-                                        (line[0][0][1] / self.scale) + ocr_rect.t,
-                                        (line[0][2][0] / self.scale) + ocr_rect.l,
-                                        (line[0][2][1] / self.scale) + ocr_rect.t,
-                                    ),
-                                    origin=CoordOrigin.TOPLEFT,
+        pages = list(page_batch)
+        page_ocr_rects: Dict[int, List[BoundingBox]] = {}
+
+        with TimeRecorder(conv_res, "ocr"):
+            # Gather the crops to OCR from all the pages of the batch
+            crops: List[Tuple[int, BoundingBox, Optional[List[OcrCell]]]] = []
+            images: List[numpy.ndarray] = []
+            cache_keys: List[Optional[str]] = []
+            for page_ix, page in enumerate(pages):
+                assert page._backend is not None
+                if not page._backend.is_valid():
+                    continue
+
+                page_ocr_rects[page_ix] = self.get_ocr_rects(page)
+                for ocr_rect in page_ocr_rects[page_ix]:
+                    # Skip zero area boxes
+                    if ocr_rect.area() == 0:
+                        continue
+                    high_res_image = page._backend.get_page_image(
+                        scale=self.scale, cropbox=ocr_rect
+                    )
+                    cache_key = self.get_cache_key(high_res_image)
+                    cached_cells = self.get_cached_cells(cache_key)
+                    crops.append((page_ix, ocr_rect, cached_cells))
+                    if cached_cells is None:
+                        images.append(numpy.array(high_res_image))
+                        cache_keys.append(cache_key)
+
+            results = iter(self._read_images(images))
+            del images
+
+            all_ocr_cells: Dict[int, List[OcrCell]] = {
+                page_ix: [] for page_ix in page_ocr_rects
+            }
+            cache_keys_iter = iter(cache_keys)
+            for page_ix, ocr_rect, cells in crops:
+                if cells is None:
+                    # Cells relative to the crop
+                    cells = [
+                        OcrCell(
+                            id=ix,
+                            text=line[1],
+                            confidence=line[2],
+                            bbox=BoundingBox.from_tuple(
+                                coord=(
+                                    line[0][0][0] / self.scale,
+                                    line[0][0][1] / self.scale,
+                                    line[0][2][0] / self.scale,
+                                    line[0][2][1] / self.scale,
                                 ),
-                            )
-                            for ix, line in enumerate(result)
-                        ]
-                        all_ocr_cells.extend(cells)
-
-                    # Post-process the cells
-                    page.cells = self.post_process_cells(all_ocr_cells, page.cells)
-
-                # DEBUG code:
-                if settings.debug.visualize_ocr:
-                    self.draw_ocr_rects_and_cells(conv_res, page, ocr_rects)
-
-                yield page
+                                origin=CoordOrigin.TOPLEFT,
+                            ),
+                        )
+                        for ix, line in enumerate(next(results))
+                    ]
+                    self.put_cached_cells(next(cache_keys_iter), cells)
+                all_ocr_cells[page_ix].extend(self.to_page_cells(cells, ocr_rect))
+
+            # Post-process the cells
+            for page_ix, ocr_cells in all_ocr_cells.items():
+                page = pages[page_ix]
+                page.cells = self.post_process_cells(ocr_cells, page.cells)
+
+        for page_ix, page in enumerate(pages):
+            # DEBUG code:
+            if settings.debug.visualize_ocr and page_ix in page_ocr_rects:
+                self.draw_ocr_rects_and_cells(conv_res, page, page_ocr_rects[page_ix])
+
+            yield page
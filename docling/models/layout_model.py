@@ -3,11 +3,14 @@ import logging
 import random
 import time
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Tuple
 
+import numpy as np
+import torch
+import torchvision.transforms as T
 from docling_core.types.doc import CoordOrigin, DocItemLabel
 from docling_ibm_models.layoutmodel.layout_predictor import LayoutPredictor
-from PIL import ImageDraw
+from PIL import Image, ImageDraw
 
 from docling.datamodel.base_models import (
     BoundingBox,
@@ -15,6 +18,7 @@ from docling.datamodel.base_models import (
     Cluster,
     LayoutPrediction,
     Page,
+    PageCells,
 )
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.settings import settings
@@ -25,6 +29,16 @@ from docling.utils.profiling import TimeRecorder
 _log = logging.getLogger(__name__)
 
 
+def _same_predictions(preds_a: List[dict], preds_b: List[dict]) -> bool:
+    # Equal up to the numerical noise of running the model on a batch
+    return len(preds_a) == len(preds_b) and all(
+        a["label"] == b["label"]
+        and abs(a["confidence"] - b["confidence"]) < 1e-3
+        and all(abs(float(a[k]) - float(b[k])) < 0.5 for k in ("l", "t", "r", "b"))
+        for a, b in zip(preds_a, preds_b)
+    )
+
+
 class LayoutModel(BasePageModel):
 
     TEXT_ELEM_LABELS = [
@@ -49,7 +63,16 @@ class LayoutModel(BasePageModel):
     def __init__(self, artifacts_path: Path):
         self.layout_predictor = LayoutPredictor(artifacts_path)  # TODO temporary
 
-    def postprocess(self, clusters_in: List[Cluster], cells: List[Cell], page_height):
+        # Input transform of the layout model, see LayoutPredictor.predict()
+        self._transforms = T.Compose([T.Resize((640, 640)), T.ToTensor()])
+
+        # Batched inference relies on internals of LayoutPredictor. None: not yet
+        # checked against LayoutPredictor.predict() on a first batch.
+        self._batched_inference: Optional[bool] = None
+
+    def postprocess(
+        self, clusters_in: List[Cluster], cells: Iterable[Cell], page_height
+    ) -> Tuple[List[Cluster], PageCells]:
         MIN_INTERSECTION = 0.2
         CLASS_THRESHOLDS = {
             DocItemLabel.CAPTION: 0.35,
@@ -122,17 +145,18 @@ class LayoutModel(BasePageModel):
 
         del clusters_mod
 
+        cells = PageCells.from_cells(cells)
+        l, t, r, b = cells.bboxes.T
         raw_cells = [
-            {
-                "id": c.id,
-                "bbox": list(
-                    c.bbox.to_bottom_left_origin(page_height).as_tuple()
-                ),  # TODO
-                "text": c.text,
-            }
-            for c in cells
+            {"id": id, "bbox": bbox, "text": text}
+            for id, bbox, text in zip(
+                cells.ids.tolist(),
+                np.stack([l, page_height - b, r, page_height - t], axis=1).tolist(),
+                cells.texts,
+            )
         ]
         cell_count = len(raw_cells)
+        cell_index = lu.build_cell_index(raw_cells)
 
         _log.debug("---- 0. Treat cluster overlaps ------")
         clusters_out = lu.remove_cluster_duplicates_by_conf(clusters_out, 0.8)
@@ -142,7 +166,7 @@ class LayoutModel(BasePageModel):
         )
         ## Check for cells included in or touched by clusters:
         clusters_out = lu.assigning_cell_ids_to_clusters(
-            clusters_out, raw_cells, MIN_INTERSECTION
+            clusters_out, raw_cells, MIN_INTERSECTION, cell_index=cell_index
         )
 
         _log.debug("---- 2. Assign Orphans with Low Confidence Detections")
@@ -160,7 +184,7 @@ class LayoutModel(BasePageModel):
 
         # Refresh the cell_ids assignment, after creating new clusters using low conf predictions
         clusters_out = lu.assigning_cell_ids_to_clusters(
-            clusters_out, raw_cells, MIN_INTERSECTION
+            clusters_out, raw_cells, MIN_INTERSECTION, cell_index=cell_index
         )
 
         _log.debug("---- 3. Settle Ambigous Cells")
@@ -200,7 +224,9 @@ class LayoutModel(BasePageModel):
             one_cell_table=True,
         )
 
-        new_clusters = lu.adapt_bboxes(raw_cells, clusters_out, orphan_cell_indices)
+        new_clusters = lu.adapt_bboxes(
+            raw_cells, clusters_out, orphan_cell_indices, cell_index=cell_index
+        )
         clusters_out = new_clusters
 
         ## We first rebuild where every cell is now:
@@ -243,23 +269,31 @@ class LayoutModel(BasePageModel):
         end_time = time.time() - start_time
         _log.debug(f"Finished post processing in seconds={end_time:.3f}")
 
-        cells_out_new = [
-            Cell(
-                id=c["id"],  # type: ignore
-                bbox=BoundingBox.from_tuple(
-                    coord=c["bbox"], origin=CoordOrigin.BOTTOMLEFT  # type: ignore
-                ).to_top_left_origin(page_height),
-                text=c["text"],  # type: ignore
-            )
-            for c in cells_out
-        ]
+        bboxes_out = np.array([c["bbox"] for c in cells_out], dtype=np.float64).reshape(
+            -1, 4
+        )
+        cells_out_new = PageCells(
+            texts=[c["text"] for c in cells_out],  # type: ignore
+            # Back to top-left origin, with inverted coordinates swapped
+            bboxes=np.stack(
+                [
+                    np.minimum(bboxes_out[:, 0], bboxes_out[:, 2]),
+                    page_height - np.maximum(bboxes_out[:, 1], bboxes_out[:, 3]),
+                    np.maximum(bboxes_out[:, 0], bboxes_out[:, 2]),
+                    page_height - np.minimum(bboxes_out[:, 1], bboxes_out[:, 3]),
+                ],
+                axis=1,
+            ),
+            ids=np.array([c["id"] for c in cells_out], dtype=np.int64),
+        )
 
         del cells_out
 
         clusters_out_new = []
         for c in clusters_out:
+            # The cells are in raw cell order, their id is their index.
             cluster_cells = [
-                ccell for ccell in cells_out_new if ccell.id in c["cell_ids"]  # type: ignore
+                cells_out_new[ix] for ix in sorted(set(c["cell_ids"]))  # type: ignore
             ]
             c_new = Cluster(
                 id=c["id"],  # type: ignore
@@ -274,22 +308,123 @@ class LayoutModel(BasePageModel):
 
         return clusters_out_new, cells_out_new
 
+    def _predict_page_images(self, images: List[Image.Image]) -> List[List[dict]]:
+        """Run the layout model on a batch of page images with one forward pass.
+
+        Returns the predictions of every image in the same format as
+        LayoutPredictor.predict().
+        """
+        predictor = self.layout_predictor
+        if (
+            len(images) == 1
+            or self._batched_inference is False
+            or not all(
+                hasattr(predictor, attr)
+                for attr in ("model", "_classes_map", "_black_classes", "_threshold")
+            )
+        ):
+            return [list(predictor.predict(img)) for img in images]
+
+        page_imgs = [img.convert("RGB") for img in images]
+        orig_sizes = torch.tensor([list(img.size) for img in page_imgs])
+        imgs = torch.stack([self._transforms(img) for img in page_imgs])
+
+        try:
+            with torch.no_grad():
+                labels, boxes, scores = predictor.model(imgs, orig_sizes)
+        except RuntimeError as e:
+            _log.warning(
+                f"Batched layout inference failed, falling back to page-by-page "
+                f"inference for this batch: {e}"
+            )
+            return [list(predictor.predict(img)) for img in images]
+
+        if len(labels) != len(page_imgs):
+            _log.warning(
+                "Batched layout inference is not supported by the layout model, "
+                "falling back to page-by-page inference."
+            )
+            self._batched_inference = False
+            return [list(predictor.predict(img)) for img in images]
+
+        # Same post-filtering as LayoutPredictor.predict(), applied per page.
+        batch_predictions = []
+        for i, (w, h) in enumerate(img.size for img in page_imgs):
+            predictions = []
+            for label_idx, box, score in zip(labels[i], boxes[i], scores[i]):
+                label_idx = int(label_idx.item())
+                score = float(score.item())
+                label = predictor._classes_map[label_idx + 1]
+                if label in predictor._black_classes:
+                    continue
+
+                if score > predictor._threshold:
+                    predictions.append(
+                        {
+                            "l": min(w, max(0, box[0])),
+                            "t": min(h, max(0, box[1])),
+                            "r": min(w, max(0, box[2])),
+                            "b": min(h, max(0, box[3])),
+                            "label": label,
+                            "confidence": score,
+                        }
+                    )
+            batch_predictions.append(predictions)
+
+        if self._batched_inference is None:
+            # Guard against changes of the LayoutPredictor internals used above
+            self._batched_inference = _same_predictions(
+                batch_predictions[0], list(predictor.predict(images[0]))
+            )
+            if not self._batched_inference:
+                _log.warning(
+                    "Batched layout inference doesn't match LayoutPredictor.predict(), "
+                    "falling back to page-by-page inference."
+                )
+                return [list(predictor.predict(img)) for img in images]
+
+        return batch_predictions
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
+        for _, page in self.process_page_batch((conv_res, page) for page in page_batch):
+            yield page
+
+    def process_page_batch(
+        self, page_batch: Iterable[Tuple[ConversionResult, Page]]
+    ) -> Iterable[Tuple[ConversionResult, Page]]:
+        page_batch = list(page_batch)
 
-        for page in page_batch:
+        valid_pages = []
+        for conv_res, page in page_batch:
+            assert page._backend is not None
+            if page._backend.is_valid():
+                assert page.size is not None
+                valid_pages.append((conv_res, page))
+
+        batch_predictions: List[List[dict]] = []
+        if len(valid_pages) > 0:
+            # The shared forward pass is timed once, on the document of its first
+            # page, so that summing the timings of the documents doesn't inflate it
+            with TimeRecorder(valid_pages[0][0], "layout_predict"):
+                page_images = []
+                for _, page in valid_pages:
+                    page_image = page.get_image(scale=1.0)
+                    assert page_image is not None
+                    page_images.append(page_image)
+                batch_predictions = self._predict_page_images(page_images)
+        page_predictions = iter(batch_predictions)
+
+        for conv_res, page in page_batch:
             assert page._backend is not None
             if not page._backend.is_valid():
-                yield page
+                yield conv_res, page
             else:
+                assert page.size is not None
                 with TimeRecorder(conv_res, "layout"):
-                    assert page.size is not None
-
                     clusters = []
-                    for ix, pred_item in enumerate(
-                        self.layout_predictor.predict(page.get_image(scale=1.0))
-                    ):
+                    for ix, pred_item in enumerate(next(page_predictions)):
                         label = DocItemLabel(
                             pred_item["label"]
                             .lower()
@@ -305,21 +440,6 @@ class LayoutModel(BasePageModel):
                         )
                         clusters.append(cluster)
 
-                    # Map cells to clusters
-                    # TODO: Remove, postprocess should take care of it anyway.
-                    for cell in page.cells:
-                        for cluster in clusters:
-                            if not cell.bbox.area() > 0:
-                                overlap_frac = 0.0
-                            else:
-                                overlap_frac = (
-                                    cell.bbox.intersection_area_with(cluster.bbox)
-                                    / cell.bbox.area()
-                                )
-
-                            if overlap_frac > 0.5:
-                                cluster.cells.append(cell)
-
                     # Pre-sort clusters
                     # clusters = self.sort_clusters_by_cell_order(clusters)
 
@@ -367,4 +487,4 @@ class LayoutModel(BasePageModel):
                 if settings.debug.visualize_layout:
                     draw_clusters_and_cells()
 
-                yield page
+                yield conv_res, page
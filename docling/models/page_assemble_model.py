@@ -1,7 +1,9 @@
 import logging
 import re
-from typing import Iterable, List
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
 
+from docling_core.types.doc import BoundingBox, ImageRef
 from pydantic import BaseModel
 
 from docling.datamodel.base_models import (
@@ -15,6 +17,7 @@ from docling.datamodel.base_models import (
 from docling.datamodel.document import ConversionResult
 from docling.models.base_model import BasePageModel
 from docling.models.layout_model import LayoutModel
+from docling.utils.image_store import PageImageStore
 from docling.utils.profiling import TimeRecorder
 
 _log = logging.getLogger(__name__)
@@ -22,12 +25,24 @@ _log = logging.getLogger(__name__)
 
 class PageAssembleOptions(BaseModel):
     keep_images: bool = False
+    images_scale: float = 1.0
+    generate_picture_images: bool = False
+    generate_table_images: bool = False
+    images_max_memory: Optional[int] = None  # in bytes, None: unbounded
+    images_spill_path: Optional[Union[Path, str]] = None
 
 
 class PageAssembleModel(BasePageModel):
     def __init__(self, options: PageAssembleOptions):
         self.options = options
 
+        self.image_store: Optional[PageImageStore] = None
+        if self.options.keep_images and self.options.images_max_memory is not None:
+            self.image_store = PageImageStore(
+                max_memory=self.options.images_max_memory,
+                spill_path=self.options.images_spill_path,
+            )
+
     def sanitize_text(self, lines):
         if len(lines) <= 1:
             return " ".join(lines)
@@ -53,6 +68,32 @@ class PageAssembleModel(BasePageModel):
 
         return sanitized_text.strip()  # Strip any leading or trailing whitespace
 
+    def _get_element_image(
+        self, page: Page, element: Union[FigureElement, Table]
+    ) -> Optional[ImageRef]:
+        assert page._backend is not None
+        assert page.size is not None
+
+        # Clip to the page, the backends cannot render outside of it
+        bbox = element.cluster.bbox
+        cropbox = BoundingBox(
+            l=max(bbox.l, 0.0),
+            t=max(bbox.t, 0.0),
+            r=min(bbox.r, page.size.width),
+            b=min(bbox.b, page.size.height),
+            coord_origin=bbox.coord_origin,
+        )
+        if cropbox.area() <= 0:
+            return None
+
+        scale = self.options.images_scale
+        image = page._backend.get_page_image(
+            scale=scale,
+            cropbox=cropbox,
+            oversample=page._image_oversample,
+        )
+        return ImageRef.from_pil(image, dpi=int(72 * scale))
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
@@ -164,9 +205,22 @@ class PageAssembleModel(BasePageModel):
                         elements=elements, headers=headers, body=body
                     )
 
+                    # Crop the requested element images while the backend is loaded
+                    for element in elements:
+                        if (
+                            isinstance(element, FigureElement)
+                            and self.options.generate_picture_images
+                        ) or (
+                            isinstance(element, Table)
+                            and self.options.generate_table_images
+                        ):
+                            element.image = self._get_element_image(page, element)
+
                     # Remove page images (can be disabled)
                     if not self.options.keep_images:
                         page._image_cache = {}
+                    elif self.image_store is not None:
+                        page.store_images(self.image_store)
 
                     # Unload backend
                     page._backend.unload()
@@ -0,0 +1,133 @@
+import hashlib
+import logging
+from typing import Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, ValidationError
+
+from docling.datamodel.base_models import (
+    LayoutPrediction,
+    Page,
+    PageCells,
+    TableStructurePrediction,
+)
+from docling.datamodel.document import ConversionResult
+from docling.models.base_model import BasePageModel
+from docling.utils.cache import BaseCacheStore
+from docling.utils.profiling import TimeRecorder
+from docling.utils.utils import create_hash
+
+_log = logging.getLogger(__name__)
+
+
+class PageStageOutput(BaseModel):
+    cells: Optional[PageCells] = None
+    layout: Optional[LayoutPrediction] = None
+    tablestructure: Optional[TableStructurePrediction] = None
+
+
+class PageCacheModel(BasePageModel):
+    """Memoize the page-level output of a page model.
+
+    Results are stored under the content hash of the page (page image and
+    parsed cells) chained with the configuration of this stage and of all
+    memoized stages before it. Changing the configuration of a stage therefore
+    only recomputes this stage and the ones downstream.
+    """
+
+    def __init__(
+        self,
+        model: BasePageModel,
+        stage_key: str,
+        outputs: List[str],
+        cache_store: BaseCacheStore,
+    ):
+        self.model = model
+        self.stage_key = stage_key
+        self.outputs = outputs  # fields of PageStageOutput produced by the model
+        self.cache_store = cache_store
+
+    @staticmethod
+    def compute_page_hash(page: Page) -> str:
+        assert page.size is not None
+
+        hasher = hashlib.sha256()
+        image = page.get_image(scale=1.0)
+        if image is not None:
+            hasher.update(f"{image.mode}:{image.size}".encode("utf-8"))
+            hasher.update(image.tobytes())
+        hasher.update(page.size.model_dump_json().encode("utf-8"))
+        for text, bbox in zip(page.cells.texts, page.cells.bboxes.tolist()):
+            hasher.update(f"{text}:{tuple(bbox)}".encode("utf-8"))
+
+        return hasher.hexdigest()
+
+    def _get_page_output(self, page: Page) -> PageStageOutput:
+        output = PageStageOutput()
+        if "cells" in self.outputs:
+            output.cells = page.cells
+        if "layout" in self.outputs:
+            output.layout = page.predictions.layout
+        if "tablestructure" in self.outputs:
+            output.tablestructure = page.predictions.tablestructure
+        return output
+
+    def _set_page_output(self, page: Page, output: PageStageOutput):
+        if "cells" in self.outputs and output.cells is not None:
+            page.cells = output.cells
+        if "layout" in self.outputs:
+            page.predictions.layout = output.layout
+        if "tablestructure" in self.outputs:
+            page.predictions.tablestructure = output.tablestructure
+
+    def _load(self, page: Page, key: str) -> bool:
+        cached = self.cache_store.get(key)
+        if cached is None:
+            return False
+        try:
+            output = PageStageOutput.model_validate_json(cached)
+        except ValidationError:
+            _log.warning(f"Ignoring invalid page cache entry {key}.")
+            return False
+
+        self._set_page_output(page, output)
+        return True
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        for _, page in self.process_page_batch((conv_res, page) for page in page_batch):
+            yield page
+
+    def process_page_batch(
+        self, page_batch: Iterable[Tuple[ConversionResult, Page]]
+    ) -> Iterable[Tuple[ConversionResult, Page]]:
+        page_batch = list(page_batch)
+
+        page_keys = {}
+        missed_pages = []
+        for conv_res, page in page_batch:
+            assert page._backend is not None
+            if not page._backend.is_valid():
+                missed_pages.append((conv_res, page))
+                continue
+
+            with TimeRecorder(conv_res, "page_cache"):
+                if page.page_hash is None:
+                    page.page_hash = self.compute_page_hash(page)
+                key = create_hash(f"{page.page_hash}:{self.stage_key}")
+                if self._load(page, key):
+                    continue
+
+            page_keys[id(page)] = key
+            missed_pages.append((conv_res, page))
+
+        if len(missed_pages) > 0:
+            for conv_res, page in self.model.process_page_batch(missed_pages):
+                if id(page) in page_keys:
+                    output = self._get_page_output(page)
+                    self.cache_store.put(
+                        page_keys[id(page)],
+                        output.model_dump_json().encode("utf-8"),
+                    )
+
+        yield from page_batch
@@ -13,6 +13,7 @@ from docling.utils.profiling import TimeRecorder
 
 class PagePreprocessingOptions(BaseModel):
     images_scale: Optional[float]
+    images_oversample: float = 1.5
 
 
 class PagePreprocessingModel(BasePageModel):
@@ -34,6 +35,12 @@ class PagePreprocessingModel(BasePageModel):
 
     # Generate the page image and store it in the page object
     def _populate_page_images(self, page: Page) -> Page:
+        # Plan the page images to render them once, at the largest scale
+        page._image_oversample = self.options.images_oversample
+        page._image_scales = [1.0]
+        if self.options.images_scale is not None:
+            page._image_scales.append(self.options.images_scale)
+
         # default scale
         page.get_image(
             scale=1.0
@@ -53,7 +60,7 @@ class PagePreprocessingModel(BasePageModel):
     def _parse_page_cells(self, conv_res: ConversionResult, page: Page) -> Page:
         assert page._backend is not None
 
-        page.cells = list(page._backend.get_text_cells())
+        page.cells = page._backend.get_page_cells()
 
         # DEBUG code:
         def draw_text_boxes(image, cells, show: bool = False):
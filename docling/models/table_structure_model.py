@@ -1,13 +1,13 @@
 import copy
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, List, Tuple
 
 import numpy
 from docling_core.types.doc import BoundingBox, DocItemLabel, TableCell
 from docling_ibm_models.tableformer.data_management.tf_predictor import TFPredictor
 from PIL import ImageDraw
 
-from docling.datamodel.base_models import Page, Table, TableStructurePrediction
+from docling.datamodel.base_models import Cluster, Page, Table, TableStructurePrediction
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import TableFormerMode, TableStructureOptions
 from docling.datamodel.settings import settings
@@ -82,125 +82,169 @@ class TableStructureModel(BasePageModel):
             out_file = out_path / f"table_struct_page_{page.page_no:05}.png"
             image.save(str(out_file), format="png")
 
+    def _get_table_tokens(
+        self, page: Page, table_clusters: List[Cluster]
+    ) -> List[dict]:
+        # Cells which overlap a table by more than 20% of their area become
+        # tokens of the table, in cell order and once per table they overlap.
+        cells = page.cells.take(
+            [ix for ix, text in enumerate(page.cells.texts) if len(text.strip()) > 0]
+        )
+        if len(cells) == 0:
+            return []
+
+        cell_boxes = cells.bboxes
+        table_boxes = numpy.array(
+            [(c.bbox.l, c.bbox.t, c.bbox.r, c.bbox.b) for c in table_clusters]
+        )
+        cell_areas = (cell_boxes[:, 2] - cell_boxes[:, 0]) * (
+            cell_boxes[:, 3] - cell_boxes[:, 1]
+        )
+
+        l, t, r, b = (cell_boxes[:, i, None] for i in range(4))
+        width = numpy.minimum(r, table_boxes[None, :, 2]) - numpy.maximum(
+            l, table_boxes[None, :, 0]
+        )
+        height = numpy.minimum(b, table_boxes[None, :, 3]) - numpy.maximum(
+            t, table_boxes[None, :, 1]
+        )
+        inter_areas = numpy.where((width <= 0) | (height <= 0), 0.0, width * height)
+
+        tokens = []
+        for ix in numpy.flatnonzero(cell_areas > 0):
+            num_overlaps = int(
+                numpy.count_nonzero(inter_areas[ix] / cell_areas[ix] > 0.2)
+            )
+            if num_overlaps == 0:
+                continue
+
+            token = cells[int(ix)].model_dump()
+            bbox = token["bbox"]
+            for k in ("l", "t", "r", "b"):
+                bbox[k] = bbox[k] * self.scale
+            tokens.extend(
+                [token] + [copy.deepcopy(token) for _ in range(num_overlaps - 1)]
+            )
+
+        return tokens
+
+    def _predict_page_tables(
+        self,
+        conv_res: ConversionResult,
+        page: Page,
+        in_tables: List[Tuple[Cluster, List[float]]],
+        tokens: List[dict],
+    ):
+        assert page._backend is not None
+        assert page.size is not None
+        assert page.predictions.tablestructure is not None
+
+        page_input = {
+            "tokens": tokens,
+            "width": page.size.width * self.scale,
+            "height": page.size.height * self.scale,
+        }
+        page_input["image"] = numpy.asarray(page.get_image(scale=self.scale))
+
+        table_clusters, table_bboxes = zip(*in_tables)
+
+        tf_output = self.tf_predictor.multi_table_predict(
+            page_input, table_bboxes, do_matching=self.do_cell_matching
+        )
+
+        for table_cluster, table_out in zip(table_clusters, tf_output):
+            table_cells = []
+            for element in table_out["tf_responses"]:
+
+                if not self.do_cell_matching:
+                    the_bbox = BoundingBox.model_validate(element["bbox"]).scaled(
+                        1 / self.scale
+                    )
+                    text_piece = page._backend.get_text_in_rect(the_bbox)
+                    element["bbox"]["token"] = text_piece
+
+                tc = TableCell.model_validate(element)
+                if self.do_cell_matching and tc.bbox is not None:
+                    tc.bbox = tc.bbox.scaled(1 / self.scale)
+                table_cells.append(tc)
+
+            # Retrieving cols/rows, after post processing:
+            num_rows = table_out["predict_details"]["num_rows"]
+            num_cols = table_out["predict_details"]["num_cols"]
+            otsl_seq = table_out["predict_details"]["prediction"]["rs_seq"]
+
+            tbl = Table(
+                otsl_seq=otsl_seq,
+                table_cells=table_cells,
+                num_rows=num_rows,
+                num_cols=num_cols,
+                id=table_cluster.id,
+                page_no=page.page_no,
+                cluster=table_cluster,
+                label=DocItemLabel.TABLE,
+            )
+
+            page.predictions.tablestructure.table_map[table_cluster.id] = tbl
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
+        for _, page in self.process_page_batch((conv_res, page) for page in page_batch):
+            yield page
+
+    def process_page_batch(
+        self, page_batch: Iterable[Tuple[ConversionResult, Page]]
+    ) -> Iterable[Tuple[ConversionResult, Page]]:
 
         if not self.enabled:
             yield from page_batch
             return
 
-        for page in page_batch:
+        page_batch = list(page_batch)
+
+        # 1. Collect the tables of all pages in the batch
+        table_pages = []
+        for conv_res, page in page_batch:
             assert page._backend is not None
             if not page._backend.is_valid():
-                yield page
-            else:
-                with TimeRecorder(conv_res, "table_structure"):
-
-                    assert page.predictions.layout is not None
-                    assert page.size is not None
-
-                    page.predictions.tablestructure = (
-                        TableStructurePrediction()
-                    )  # dummy
-
-                    in_tables = [
-                        (
-                            cluster,
-                            [
-                                round(cluster.bbox.l) * self.scale,
-                                round(cluster.bbox.t) * self.scale,
-                                round(cluster.bbox.r) * self.scale,
-                                round(cluster.bbox.b) * self.scale,
-                            ],
-                        )
-                        for cluster in page.predictions.layout.clusters
-                        if cluster.label == DocItemLabel.TABLE
-                    ]
-                    if not len(in_tables):
-                        yield page
-                        continue
-
-                    tokens = []
-                    for c in page.cells:
-                        for cluster, _ in in_tables:
-                            if c.bbox.area() > 0:
-                                if (
-                                    c.bbox.intersection_area_with(cluster.bbox)
-                                    / c.bbox.area()
-                                    > 0.2
-                                ):
-                                    # Only allow non empty stings (spaces) into the cells of a table
-                                    if len(c.text.strip()) > 0:
-                                        new_cell = copy.deepcopy(c)
-                                        new_cell.bbox = new_cell.bbox.scaled(
-                                            scale=self.scale
-                                        )
-
-                                        tokens.append(new_cell.model_dump())
-
-                    page_input = {
-                        "tokens": tokens,
-                        "width": page.size.width * self.scale,
-                        "height": page.size.height * self.scale,
-                    }
-                    page_input["image"] = numpy.asarray(
-                        page.get_image(scale=self.scale)
-                    )
-
-                    table_clusters, table_bboxes = zip(*in_tables)
-
-                    if len(table_bboxes):
-                        tf_output = self.tf_predictor.multi_table_predict(
-                            page_input, table_bboxes, do_matching=self.do_cell_matching
-                        )
-
-                        for table_cluster, table_out in zip(table_clusters, tf_output):
-                            table_cells = []
-                            for element in table_out["tf_responses"]:
-
-                                if not self.do_cell_matching:
-                                    the_bbox = BoundingBox.model_validate(
-                                        element["bbox"]
-                                    ).scaled(1 / self.scale)
-                                    text_piece = page._backend.get_text_in_rect(
-                                        the_bbox
-                                    )
-                                    element["bbox"]["token"] = text_piece
-
-                                tc = TableCell.model_validate(element)
-                                if self.do_cell_matching and tc.bbox is not None:
-                                    tc.bbox = tc.bbox.scaled(1 / self.scale)
-                                table_cells.append(tc)
-
-                            # Retrieving cols/rows, after post processing:
-                            num_rows = table_out["predict_details"]["num_rows"]
-                            num_cols = table_out["predict_details"]["num_cols"]
-                            otsl_seq = table_out["predict_details"]["prediction"][
-                                "rs_seq"
-                            ]
-
-                            tbl = Table(
-                                otsl_seq=otsl_seq,
-                                table_cells=table_cells,
-                                num_rows=num_rows,
-                                num_cols=num_cols,
-                                id=table_cluster.id,
-                                page_no=page.page_no,
-                                cluster=table_cluster,
-                                label=DocItemLabel.TABLE,
-                            )
-
-                            page.predictions.tablestructure.table_map[
-                                table_cluster.id
-                            ] = tbl
-
-                    # For debugging purposes:
-                    if settings.debug.visualize_tables:
-                        self.draw_table_and_cells(
-                            conv_res,
-                            page,
-                            page.predictions.tablestructure.table_map.values(),
-                        )
-
-                yield page
+                continue
+
+            assert page.predictions.layout is not None
+            assert page.size is not None
+
+            page.predictions.tablestructure = TableStructurePrediction()  # dummy
+
+            in_tables = [
+                (
+                    cluster,
+                    [
+                        round(cluster.bbox.l) * self.scale,
+                        round(cluster.bbox.t) * self.scale,
+                        round(cluster.bbox.r) * self.scale,
+                        round(cluster.bbox.b) * self.scale,
+                    ],
+                )
+                for cluster in page.predictions.layout.clusters
+                if cluster.label == DocItemLabel.TABLE
+            ]
+            if len(in_tables) > 0:
+                table_pages.append((conv_res, page, in_tables))
+
+        # 2. Predict the table structures, only pages with tables are rendered
+        for conv_res, page, in_tables in table_pages:
+            with TimeRecorder(conv_res, "table_structure"):
+                tokens = self._get_table_tokens(
+                    page, [cluster for cluster, _ in in_tables]
+                )
+                self._predict_page_tables(conv_res, page, in_tables, tokens)
+
+            # For debugging purposes:
+            if settings.debug.visualize_tables:
+                assert page.predictions.tablestructure is not None
+                self.draw_table_and_cells(
+                    conv_res,
+                    page,
+                    page.predictions.tablestructure.table_map.values(),
+                )
+
+        yield from page_batch
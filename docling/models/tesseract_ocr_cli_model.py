@@ -1,11 +1,11 @@
 import io
 import logging
-import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from subprocess import DEVNULL, PIPE, Popen
-from typing import Iterable, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-import pandas as pd
 from docling_core.types.doc import BoundingBox, CoordOrigin
+from PIL import Image
 
 from docling.datamodel.base_models import Cell, OcrCell, Page
 from docling.datamodel.document import ConversionResult
@@ -27,10 +27,11 @@ class TesseractOcrCliModel(BaseOcrModel):
 
         self._name: Optional[str] = None
         self._version: Optional[str] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
 
         if self.enabled:
             try:
-                self._get_name_and_version()
+                self.engine_version = " ".join(self._get_name_and_version())
 
             except Exception as exc:
                 raise RuntimeError(
@@ -40,6 +41,16 @@ class TesseractOcrCliModel(BaseOcrModel):
                     "Alternatively, Docling has support for other OCR engines. See the documentation."
                 )
 
+            # Each worker thread waits on one tesseract process at a time
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(self.options.num_workers, 1),
+                thread_name_prefix="docling-tesseract",
+            )
+
+    def __del__(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
     def _get_name_and_version(self) -> Tuple[str, str]:
 
         if self._name != None and self._version != None:
@@ -71,8 +82,8 @@ class TesseractOcrCliModel(BaseOcrModel):
 
         return name, version
 
-    def _run_tesseract(self, ifilename: str):
-
+    def _run_tesseract(self, image: Image.Image) -> List[Tuple[int, Dict[str, str]]]:
+        # Runs on a worker thread, the image is passed to tesseract over stdin
         cmd = [self.options.tesseract_cmd]
 
         if self.options.lang is not None and len(self.options.lang) > 0:
@@ -82,28 +93,65 @@ class TesseractOcrCliModel(BaseOcrModel):
             cmd.append("--tessdata-dir")
             cmd.append(self.options.path)
 
-        cmd += [ifilename, "stdout", "tsv"]
+        cmd += ["stdin", "stdout", "tsv"]
         _log.info("command: {}".format(" ".join(cmd)))
 
-        proc = Popen(cmd, stdout=PIPE, stderr=DEVNULL)
-        output, _ = proc.communicate()
+        image_data = io.BytesIO()
+        image.save(image_data, format="PNG", compress_level=1)
 
-        # _log.info(output)
+        proc = Popen(cmd, stdin=PIPE, stdout=PIPE, stderr=DEVNULL)
+        output, _ = proc.communicate(input=image_data.getvalue())
 
         # Decode the byte string to a regular string
         decoded_data = output.decode("utf-8")
-        # _log.info(decoded_data)
-
-        # Read the TSV file generated by Tesseract
-        df = pd.read_csv(io.StringIO(decoded_data), sep="\t")
-
-        # Display the dataframe (optional)
-        # _log.info("df: ", df.head())
 
         # Filter rows that contain actual text (ignore header or empty rows)
-        df_filtered = df[df["text"].notnull() & (df["text"].str.strip() != "")]
+        return [
+            (ix, row)
+            for ix, row in self._read_tsv(decoded_data)
+            if row.get("text", "").strip() != ""
+        ]
+
+    def _ocr_image(self, high_res_image: Image.Image) -> List[OcrCell]:
+        # Runs on a worker thread, returns the cells relative to the image
+        cells = []
+        for ix, row in self._run_tesseract(high_res_image):
+            text = row["text"]
+            conf = float(row["conf"])
+
+            l = float(row["left"])
+            b = float(row["top"])
+            w = float(row["width"])
+            h = float(row["height"])
+
+            t = b + h
+            r = l + w
+
+            cells.append(
+                OcrCell(
+                    id=ix,
+                    text=text,
+                    confidence=conf / 100.0,
+                    bbox=BoundingBox.from_tuple(
+                        coord=(
+                            l / self.scale,
+                            b / self.scale,
+                            r / self.scale,
+                            t / self.scale,
+                        ),
+                        origin=CoordOrigin.TOPLEFT,
+                    ),
+                )
+            )
+        return cells
 
-        return df_filtered
+    @staticmethod
+    def _read_tsv(data: str) -> Iterator[Tuple[int, Dict[str, str]]]:
+        # Read the TSV generated by Tesseract, as numbered rows by column name
+        lines = iter(data.splitlines())
+        header = next(lines, "").split("\t")
+        for ix, line in enumerate(lines):
+            yield ix, dict(zip(header, line.split("\t")))
 
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
@@ -113,68 +161,56 @@ class TesseractOcrCliModel(BaseOcrModel):
             yield from page_batch
             return
 
-        for page in page_batch:
-            assert page._backend is not None
-            if not page._backend.is_valid():
-                yield page
-            else:
-                with TimeRecorder(conv_res, "ocr"):
-
-                    ocr_rects = self.get_ocr_rects(page)
-
-                    all_ocr_cells = []
-                    for ocr_rect in ocr_rects:
-                        # Skip zero area boxes
-                        if ocr_rect.area() == 0:
-                            continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-
-                        with tempfile.NamedTemporaryFile(
-                            suffix=".png", mode="w"
-                        ) as image_file:
-                            fname = image_file.name
-                            high_res_image.save(fname)
-
-                            df = self._run_tesseract(fname)
-
-                        # _log.info(df)
-
-                        # Print relevant columns (bounding box and text)
-                        for ix, row in df.iterrows():
-                            text = row["text"]
-                            conf = row["conf"]
-
-                            l = float(row["left"])
-                            b = float(row["top"])
-                            w = float(row["width"])
-                            h = float(row["height"])
-
-                            t = b + h
-                            r = l + w
-
-                            cell = OcrCell(
-                                id=ix,
-                                text=text,
-                                confidence=conf / 100.0,
-                                bbox=BoundingBox.from_tuple(
-                                    coord=(
-                                        (l / self.scale) + ocr_rect.l,
-                                        (b / self.scale) + ocr_rect.t,
-                                        (r / self.scale) + ocr_rect.l,
-                                        (t / self.scale) + ocr_rect.t,
-                                    ),
-                                    origin=CoordOrigin.TOPLEFT,
-                                ),
-                            )
-                            all_ocr_cells.append(cell)
-
-                    # Post-process the cells
-                    page.cells = self.post_process_cells(all_ocr_cells, page.cells)
-
-                # DEBUG code:
-                if settings.debug.visualize_ocr:
-                    self.draw_ocr_rects_and_cells(conv_res, page, ocr_rects)
-
-                yield page
+        assert self._executor is not None
+
+        pages = list(page_batch)
+        page_ocr_rects: Dict[int, List[BoundingBox]] = {}
+
+        with TimeRecorder(conv_res, "ocr"):
+            # The crops are rendered here, the PDF backends are not thread-safe,
+            # while tesseract processes OCR the crops rendered before
+            page_futures: Dict[int, List[Tuple[BoundingBox, Optional[str], Future]]] = (
+                {}
+            )
+            for page_ix, page in enumerate(pages):
+                assert page._backend is not None
+                if not page._backend.is_valid():
+                    continue
+
+                page_ocr_rects[page_ix] = self.get_ocr_rects(page)
+                page_futures[page_ix] = []
+                for ocr_rect in page_ocr_rects[page_ix]:
+                    # Skip zero area boxes
+                    if ocr_rect.area() == 0:
+                        continue
+                    high_res_image = page._backend.get_page_image(
+                        scale=self.scale, cropbox=ocr_rect
+                    )
+
+                    cache_key = self.get_cache_key(high_res_image)
+                    cached_cells = self.get_cached_cells(cache_key)
+                    if cached_cells is not None:
+                        future: Future = Future()
+                        future.set_result(cached_cells)
+                        cache_key = None  # nothing to put
+                    else:
+                        future = self._executor.submit(self._ocr_image, high_res_image)
+                    page_futures[page_ix].append((ocr_rect, cache_key, future))
+
+            for page_ix, futures in page_futures.items():
+                all_ocr_cells = []
+                for ocr_rect, cache_key, future in futures:
+                    cells = future.result()
+                    self.put_cached_cells(cache_key, cells)
+                    all_ocr_cells.extend(self.to_page_cells(cells, ocr_rect))
+
+                # Post-process the cells
+                page = pages[page_ix]
+                page.cells = self.post_process_cells(all_ocr_cells, page.cells)
+
+        for page_ix, page in enumerate(pages):
+            # DEBUG code:
+            if settings.debug.visualize_ocr and page_ix in page_ocr_rects:
+                self.draw_ocr_rects_and_cells(conv_res, page, page_ocr_rects[page_ix])
+
+            yield page
@@ -1,7 +1,10 @@
 import logging
-from typing import Iterable
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from docling_core.types.doc import BoundingBox, CoordOrigin
+from PIL import Image
 
 from docling.datamodel.base_models import Cell, OcrCell, Page
 from docling.datamodel.document import ConversionResult
@@ -19,7 +22,9 @@ class TesseractOcrModel(BaseOcrModel):
         self.options: TesseractOcrOptions
 
         self.scale = 3  # multiplier for 72 dpi == 216 dpi.
-        self.reader = None
+        self.readers: List = []
+        self._idle_readers: queue.Queue = queue.Queue()
+        self._executor: Optional[ThreadPoolExecutor] = None
 
         if self.enabled:
             install_errmsg = (
@@ -47,34 +52,83 @@ class TesseractOcrModel(BaseOcrModel):
             except:
                 raise ImportError(install_errmsg)
 
+            self.engine_version = f"{tesserocr.__version__} {tesseract_version}"
+
             _, tesserocr_languages = tesserocr.get_languages()
             if not tesserocr_languages:
                 raise ImportError(missing_langs_errmsg)
 
-            # Initialize the tesseractAPI
+            # Initialize one tesseractAPI per worker
             _log.debug("Initializing TesserOCR: %s", tesseract_version)
             lang = "+".join(self.options.lang)
-            if self.options.path is not None:
-                self.reader = tesserocr.PyTessBaseAPI(
-                    path=self.options.path,
-                    lang=lang,
-                    psm=tesserocr.PSM.AUTO,
-                    init=True,
-                    oem=tesserocr.OEM.DEFAULT,
-                )
-            else:
-                self.reader = tesserocr.PyTessBaseAPI(
-                    lang=lang,
-                    psm=tesserocr.PSM.AUTO,
-                    init=True,
-                    oem=tesserocr.OEM.DEFAULT,
-                )
+            for _ in range(max(self.options.num_workers, 1)):
+                if self.options.path is not None:
+                    reader = tesserocr.PyTessBaseAPI(
+                        path=self.options.path,
+                        lang=lang,
+                        psm=tesserocr.PSM.AUTO,
+                        init=True,
+                        oem=tesserocr.OEM.DEFAULT,
+                    )
+                else:
+                    reader = tesserocr.PyTessBaseAPI(
+                        lang=lang,
+                        psm=tesserocr.PSM.AUTO,
+                        init=True,
+                        oem=tesserocr.OEM.DEFAULT,
+                    )
+                self.readers.append(reader)
+                self._idle_readers.put(reader)
             self.reader_RIL = tesserocr.RIL
 
+            # Tesseract releases the GIL, the workers OCR images concurrently
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self.readers), thread_name_prefix="docling-tesserocr"
+            )
+
     def __del__(self):
-        if self.reader is not None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        for reader in self.readers:
             # Finalize the tesseractAPI
-            self.reader.End()
+            reader.End()
+
+    def _ocr_image(self, high_res_image: Image.Image) -> List[OcrCell]:
+        # Runs on a worker thread, with a tesseractAPI of its own. Returns the
+        # cells relative to the image.
+        reader = self._idle_readers.get()
+        try:
+            # Retrieve text snippets with their bounding boxes
+            reader.SetImage(high_res_image)
+            boxes = reader.GetComponentImages(self.reader_RIL.TEXTLINE, True)
+
+            cells = []
+            for ix, (im, box, _, _) in enumerate(boxes):
+                # Set the area of interest. Tesseract uses Bottom-Left for the origin
+                reader.SetRectangle(box["x"], box["y"], box["w"], box["h"])
+
+                # Extract text within the bounding box
+                text = reader.GetUTF8Text().strip()
+                confidence = reader.MeanTextConf()
+                left = box["x"] / self.scale
+                bottom = box["y"] / self.scale
+                right = (box["x"] + box["w"]) / self.scale
+                top = (box["y"] + box["h"]) / self.scale
+
+                cells.append(
+                    OcrCell(
+                        id=ix,
+                        text=text,
+                        confidence=confidence,
+                        bbox=BoundingBox.from_tuple(
+                            coord=(left, top, right, bottom),
+                            origin=CoordOrigin.TOPLEFT,
+                        ),
+                    )
+                )
+            return cells
+        finally:
+            self._idle_readers.put(reader)
 
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
@@ -84,67 +138,56 @@ class TesseractOcrModel(BaseOcrModel):
             yield from page_batch
             return
 
-        for page in page_batch:
-            assert page._backend is not None
-            if not page._backend.is_valid():
-                yield page
-            else:
-                with TimeRecorder(conv_res, "ocr"):
-
-                    assert self.reader is not None
-
-                    ocr_rects = self.get_ocr_rects(page)
-
-                    all_ocr_cells = []
-                    for ocr_rect in ocr_rects:
-                        # Skip zero area boxes
-                        if ocr_rect.area() == 0:
-                            continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-
-                        # Retrieve text snippets with their bounding boxes
-                        self.reader.SetImage(high_res_image)
-                        boxes = self.reader.GetComponentImages(
-                            self.reader_RIL.TEXTLINE, True
-                        )
-
-                        cells = []
-                        for ix, (im, box, _, _) in enumerate(boxes):
-                            # Set the area of interest. Tesseract uses Bottom-Left for the origin
-                            self.reader.SetRectangle(
-                                box["x"], box["y"], box["w"], box["h"]
-                            )
-
-                            # Extract text within the bounding box
-                            text = self.reader.GetUTF8Text().strip()
-                            confidence = self.reader.MeanTextConf()
-                            left = box["x"] / self.scale
-                            bottom = box["y"] / self.scale
-                            right = (box["x"] + box["w"]) / self.scale
-                            top = (box["y"] + box["h"]) / self.scale
-
-                            cells.append(
-                                OcrCell(
-                                    id=ix,
-                                    text=text,
-                                    confidence=confidence,
-                                    bbox=BoundingBox.from_tuple(
-                                        coord=(left, top, right, bottom),
-                                        origin=CoordOrigin.TOPLEFT,
-                                    ),
-                                )
-                            )
-
-                        # del high_res_image
-                        all_ocr_cells.extend(cells)
-
-                    # Post-process the cells
-                    page.cells = self.post_process_cells(all_ocr_cells, page.cells)
-
-                # DEBUG code:
-                if settings.debug.visualize_ocr:
-                    self.draw_ocr_rects_and_cells(conv_res, page, ocr_rects)
-
-                yield page
+        assert self._executor is not None
+
+        pages = list(page_batch)
+        page_ocr_rects: Dict[int, List[BoundingBox]] = {}
+
+        with TimeRecorder(conv_res, "ocr"):
+            # The crops are rendered here, the PDF backends are not thread-safe,
+            # while the workers OCR the crops rendered before
+            page_futures: Dict[int, List[Tuple[BoundingBox, Optional[str], Future]]] = (
+                {}
+            )
+            for page_ix, page in enumerate(pages):
+                assert page._backend is not None
+                if not page._backend.is_valid():
+                    continue
+
+                page_ocr_rects[page_ix] = self.get_ocr_rects(page)
+                page_futures[page_ix] = []
+                for ocr_rect in page_ocr_rects[page_ix]:
+                    # Skip zero area boxes
+                    if ocr_rect.area() == 0:
+                        continue
+                    high_res_image = page._backend.get_page_image(
+                        scale=self.scale, cropbox=ocr_rect
+                    )
+
+                    cache_key = self.get_cache_key(high_res_image)
+                    cached_cells = self.get_cached_cells(cache_key)
+                    if cached_cells is not None:
+                        future: Future = Future()
+                        future.set_result(cached_cells)
+                        cache_key = None  # nothing to put
+                    else:
+                        future = self._executor.submit(self._ocr_image, high_res_image)
+                    page_futures[page_ix].append((ocr_rect, cache_key, future))
+
+            for page_ix, futures in page_futures.items():
+                all_ocr_cells = []
+                for ocr_rect, cache_key, future in futures:
+                    cells = future.result()
+                    self.put_cached_cells(cache_key, cells)
+                    all_ocr_cells.extend(self.to_page_cells(cells, ocr_rect))
+
+                # Post-process the cells
+                page = pages[page_ix]
+                page.cells = self.post_process_cells(all_ocr_cells, page.cells)
+
+        for page_ix, page in enumerate(pages):
+            # DEBUG code:
+            if settings.debug.visualize_ocr and page_ix in page_ocr_rects:
+                self.draw_ocr_rects_and_cells(conv_res, page, page_ocr_rects[page_ix])
+
+            yield page
@@ -1,19 +1,25 @@
 import functools
 import logging
+import queue
+import threading
 import time
 import traceback
 from abc import ABC, abstractmethod
-from typing import Callable, Iterable, List
+from contextlib import ExitStack
+from typing import Callable, Iterable, List, Optional, Set, Tuple
 
-from docling_core.types.doc import DoclingDocument, NodeItem
+from docling_core.types.doc import BoundingBox, DoclingDocument, NodeItem, Size
+from PIL import Image
 
 from docling.backend.abstract_backend import AbstractDocumentBackend
-from docling.backend.pdf_backend import PdfDocumentBackend
+from docling.backend.pdf_backend import PdfDocumentBackend, PdfPageBackend
 from docling.datamodel.base_models import (
+    Cell,
     ConversionStatus,
     DoclingComponentType,
     ErrorItem,
     Page,
+    PageCells,
 )
 from docling.datamodel.document import ConversionResult, InputDocument
 from docling.datamodel.pipeline_options import PipelineOptions
@@ -25,6 +31,59 @@ from docling.utils.utils import chunkify
 _log = logging.getLogger(__name__)
 
 
+# The PDF backends are not thread-safe. When page stages run concurrently, all
+# calls into a backend are serialized through this lock.
+_pdf_backend_lock = threading.RLock()
+
+_END_OF_STAGE = object()
+
+
+class _SerializedPdfPageBackend(PdfPageBackend):
+    """Page backend wrapper holding _pdf_backend_lock for every call."""
+
+    def __init__(self, backend: PdfPageBackend):
+        self.backend = backend
+
+    def get_text_in_rect(self, bbox: BoundingBox) -> str:
+        with _pdf_backend_lock:
+            return self.backend.get_text_in_rect(bbox)
+
+    def get_text_cells(self) -> Iterable[Cell]:
+        with _pdf_backend_lock:
+            return list(self.backend.get_text_cells())
+
+    def get_page_cells(self) -> PageCells:
+        with _pdf_backend_lock:
+            return self.backend.get_page_cells()
+
+    def get_bitmap_rects(self, scale: float = 1) -> Iterable[BoundingBox]:
+        with _pdf_backend_lock:
+            return list(self.backend.get_bitmap_rects(scale))
+
+    def get_page_image(
+        self,
+        scale: float = 1,
+        cropbox: Optional[BoundingBox] = None,
+        oversample: float = 1.5,
+    ) -> Image.Image:
+        with _pdf_backend_lock:
+            return self.backend.get_page_image(
+                scale=scale, cropbox=cropbox, oversample=oversample
+            )
+
+    def get_size(self) -> Size:
+        with _pdf_backend_lock:
+            return self.backend.get_size()
+
+    def is_valid(self) -> bool:
+        with _pdf_backend_lock:
+            return self.backend.is_valid()
+
+    def unload(self):
+        with _pdf_backend_lock:
+            self.backend.unload()
+
+
 class BasePipeline(ABC):
     def __init__(self, pipeline_options: PipelineOptions):
         self.pipeline_options = pipeline_options
@@ -132,25 +191,10 @@ class PaginatedPipeline(BasePipeline):  # TODO this is a bad name.
                 conv_res.pages.append(Page(page_no=i))
 
             try:
-                # Iterate batches of pages (page_batch_size) in the doc
-                for page_batch in chunkify(
-                    conv_res.pages, settings.perf.page_batch_size
-                ):
-                    start_pb_time = time.time()
-
-                    # 1. Initialise the page resources
-                    init_pages = map(
-                        functools.partial(self.initialize_page, conv_res), page_batch
-                    )
-
-                    # 2. Run pipeline stages
-                    pipeline_pages = self._apply_on_pages(conv_res, init_pages)
-
-                    for p in pipeline_pages:  # Must exhaust!
-                        pass
-
-                    end_pb_time = time.time() - start_pb_time
-                    _log.debug(f"Finished converting page batch time={end_pb_time:.3f}")
+                if settings.perf.page_stage_pipelining:
+                    self._build_pages_pipelined(conv_res)
+                else:
+                    self._build_pages(conv_res)
 
             except Exception as e:
                 conv_res.status = ConversionStatus.FAILURE
@@ -168,6 +212,195 @@ class PaginatedPipeline(BasePipeline):  # TODO this is a bad name.
 
         return conv_res
 
+    def execute_batch(
+        self, in_docs: List[InputDocument], raises_on_error: bool
+    ) -> List[ConversionResult]:
+        """Convert several documents, pooling their pages into shared page batches.
+
+        Pages of all documents are chunked together, so that short documents still
+        fill the page batches of the models. If a page batch fails, the documents
+        with pages in it are converted again one by one with execute(), while the
+        other documents stay pooled.
+        """
+        conv_results = [ConversionResult(input=in_doc) for in_doc in in_docs]
+
+        _log.info(f"Processing {len(in_docs)} documents with pooled page batches")
+        with ExitStack() as stack:
+            for conv_res in conv_results:
+                stack.enter_context(
+                    TimeRecorder(conv_res, "doc_build", scope=ProfilingScope.DOCUMENT)
+                )
+            failed_ixs = self._build_pooled_pages(conv_results)
+
+        for ix, conv_res in enumerate(conv_results):
+            if ix in failed_ixs:
+                for page in conv_res.pages:
+                    if page._backend is not None:
+                        page._backend.unload()
+                conv_results[ix] = self.execute(
+                    conv_res.input, raises_on_error=raises_on_error
+                )
+                continue
+
+            if conv_res.input._backend:
+                conv_res.input._backend.unload()
+
+            try:
+                with TimeRecorder(
+                    conv_res, "pipeline_total", scope=ProfilingScope.DOCUMENT
+                ):
+                    conv_res = self._assemble_document(conv_res)
+                    conv_res = self._enrich_document(conv_res)
+                    conv_res.status = self._determine_status(conv_res)
+            except Exception as e:
+                conv_res.status = ConversionStatus.FAILURE
+                if raises_on_error:
+                    raise e
+
+        return conv_results
+
+    def _build_pooled_pages(self, conv_results: List[ConversionResult]) -> Set[int]:
+        # Returns the indices of the documents whose pages could not be built
+        failed_ixs: Set[int] = set()
+        for ix, conv_res in enumerate(conv_results):
+            if not isinstance(conv_res.input._backend, PdfDocumentBackend):
+                _log.warning(
+                    f"The selected backend {type(conv_res.input._backend).__name__} for {conv_res.input.file} is not a PDF backend."
+                )
+                failed_ixs.add(ix)
+                continue
+            for i in range(0, conv_res.input.page_count):
+                conv_res.pages.append(Page(page_no=i))
+
+        # Pages of the documents which failed meanwhile are skipped
+        all_pages = (
+            (ix, page)
+            for ix, conv_res in enumerate(conv_results)
+            for page in conv_res.pages
+            if ix not in failed_ixs
+        )
+        for page_batch in chunkify(all_pages, settings.perf.page_batch_size):
+            start_pb_time = time.time()
+
+            try:
+                # 1. Initialise the page resources
+                init_pages: Iterable[Tuple[ConversionResult, Page]] = (
+                    (conv_results[ix], self.initialize_page(conv_results[ix], page))
+                    for ix, page in page_batch
+                )
+
+                # 2. Run pipeline stages
+                for model in self.build_pipe:
+                    init_pages = model.process_page_batch(init_pages)  # type: ignore
+
+                for p in init_pages:  # Must exhaust!
+                    pass
+
+            except Exception as e:
+                batch_ixs = {ix for ix, _ in page_batch}
+                trace = "\n".join(traceback.format_exception(e))
+                _log.warning(
+                    f"Encountered an error in a pooled page batch, converting its "
+                    f"{len(batch_ixs)} documents one by one:\n{trace}"
+                )
+                failed_ixs.update(batch_ixs)
+
+            end_pb_time = time.time() - start_pb_time
+            _log.debug(f"Finished converting pooled page batch time={end_pb_time:.3f}")
+
+        return failed_ixs
+
+    def _build_pages(self, conv_res: ConversionResult):
+        # Iterate batches of pages (page_batch_size) in the doc
+        for page_batch in chunkify(conv_res.pages, settings.perf.page_batch_size):
+            start_pb_time = time.time()
+
+            # 1. Initialise the page resources
+            init_pages = map(
+                functools.partial(self.initialize_page, conv_res), page_batch
+            )
+
+            # 2. Run pipeline stages
+            pipeline_pages = self._apply_on_pages(conv_res, init_pages)
+
+            for p in pipeline_pages:  # Must exhaust!
+                pass
+
+            end_pb_time = time.time() - start_pb_time
+            _log.debug(f"Finished converting page batch time={end_pb_time:.3f}")
+
+    def _build_pages_pipelined(self, conv_res: ConversionResult):
+        # Each stage of the build_pipe runs on its own thread and hands over
+        # complete page batches to the next stage through a bounded queue. While
+        # e.g. the layout model runs on one batch, the next batch is already being
+        # parsed and rendered. Stages keep their input order, since every stage
+        # is served by a single thread.
+        stop = threading.Event()
+        errors: List[Exception] = []
+        queues: List[queue.Queue] = [
+            queue.Queue(maxsize=max(1, settings.perf.page_stage_queue_size))
+            for _ in range(len(self.build_pipe) + 1)
+        ]
+
+        def fail(e: Exception):
+            errors.append(e)
+            stop.set()
+
+        def feed_pages():
+            try:
+                for page_batch in chunkify(
+                    conv_res.pages, settings.perf.page_batch_size
+                ):
+                    if stop.is_set():
+                        break
+                    with _pdf_backend_lock:
+                        init_pages = [
+                            self.initialize_page(conv_res, page) for page in page_batch
+                        ]
+                    for page in init_pages:
+                        if page._backend is not None:
+                            page._backend = _SerializedPdfPageBackend(page._backend)
+                    queues[0].put(init_pages)
+            except Exception as e:
+                fail(e)
+            finally:
+                queues[0].put(_END_OF_STAGE)
+
+        def run_stage(model: Callable, in_queue: queue.Queue, out_queue: queue.Queue):
+            # A stage always drains its input and forwards the end marker, so that
+            # no thread stays blocked on a full queue after a failure.
+            while (page_batch := in_queue.get()) is not _END_OF_STAGE:
+                if stop.is_set():
+                    continue
+                try:
+                    out_queue.put(list(model(conv_res, page_batch)))
+                except Exception as e:
+                    fail(e)
+            out_queue.put(_END_OF_STAGE)
+
+        threads = [threading.Thread(target=feed_pages, daemon=True)]
+        for model, in_queue, out_queue in zip(self.build_pipe, queues, queues[1:]):
+            threads.append(
+                threading.Thread(
+                    target=run_stage, args=(model, in_queue, out_queue), daemon=True
+                )
+            )
+
+        for thread in threads:
+            thread.start()
+        try:
+            while queues[-1].get() is not _END_OF_STAGE:  # Must exhaust!
+                pass
+        finally:
+            for thread in threads:
+                thread.join()
+            for page in conv_res.pages:
+                if isinstance(page._backend, _SerializedPdfPageBackend):
+                    page._backend = page._backend.backend
+
+        if errors:
+            raise errors[0]
+
     def _determine_status(self, conv_res: ConversionResult) -> ConversionStatus:
         status = ConversionStatus.SUCCESS
         for page in conv_res.pages:
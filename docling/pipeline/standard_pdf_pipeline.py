@@ -1,12 +1,12 @@
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple, Type
 
 from docling_core.types.doc import DocItem, ImageRef, PictureItem, TableItem
 
 from docling.backend.abstract_backend import AbstractDocumentBackend
 from docling.backend.pdf_backend import PdfDocumentBackend
-from docling.datamodel.base_models import AssembledUnit, Page
+from docling.datamodel.base_models import AssembledUnit, FigureElement, Page, Table
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import (
     EasyOcrOptions,
@@ -16,18 +16,18 @@ from docling.datamodel.pipeline_options import (
 )
 from docling.models.base_ocr_model import BaseOcrModel
 from docling.models.ds_glm_model import GlmModel, GlmOptions
-from docling.models.easyocr_model import EasyOcrModel
 from docling.models.layout_model import LayoutModel
 from docling.models.page_assemble_model import PageAssembleModel, PageAssembleOptions
+from docling.models.page_cache_model import PageCacheModel
 from docling.models.page_preprocessing_model import (
     PagePreprocessingModel,
     PagePreprocessingOptions,
 )
 from docling.models.table_structure_model import TableStructureModel
-from docling.models.tesseract_ocr_cli_model import TesseractOcrCliModel
-from docling.models.tesseract_ocr_model import TesseractOcrModel
 from docling.pipeline.base_pipeline import PaginatedPipeline
+from docling.utils.cache import LocalDirectoryCacheStore
 from docling.utils.profiling import ProfilingScope, TimeRecorder
+from docling.utils.utils import create_hash, get_docling_version
 
 _log = logging.getLogger(__name__)
 
@@ -45,11 +45,9 @@ class StandardPdfPipeline(PaginatedPipeline):
         else:
             self.artifacts_path = Path(pipeline_options.artifacts_path)
 
-        keep_images = (
-            self.pipeline_options.generate_page_images
-            or self.pipeline_options.generate_picture_images
-            or self.pipeline_options.generate_table_images
-        )
+        # Picture and table images are cropped during page assembly, only the
+        # full-page images in the output need to be kept until then.
+        keep_images = self.pipeline_options.generate_page_images
 
         self.glm_model = GlmModel(options=GlmOptions())
 
@@ -62,7 +60,12 @@ class StandardPdfPipeline(PaginatedPipeline):
             # Pre-processing
             PagePreprocessingModel(
                 options=PagePreprocessingOptions(
-                    images_scale=pipeline_options.images_scale
+                    images_scale=(
+                        pipeline_options.images_scale
+                        if pipeline_options.generate_page_images
+                        else None
+                    ),
+                    images_oversample=pipeline_options.images_oversample,
                 )
             ),
             # OCR
@@ -80,13 +83,65 @@ class StandardPdfPipeline(PaginatedPipeline):
                 options=pipeline_options.table_structure_options,
             ),
             # Page assemble
-            PageAssembleModel(options=PageAssembleOptions(keep_images=keep_images)),
+            PageAssembleModel(
+                options=PageAssembleOptions(
+                    keep_images=keep_images,
+                    images_scale=pipeline_options.images_scale,
+                    generate_picture_images=pipeline_options.generate_picture_images,
+                    generate_table_images=pipeline_options.generate_table_images,
+                    images_max_memory=pipeline_options.images_max_memory,
+                    images_spill_path=pipeline_options.images_spill_path,
+                )
+            ),
         ]
 
+        if pipeline_options.page_cache_path is not None:
+            self._add_page_cache()
+
         self.enrichment_pipe = [
             # Other models working on `NodeItem` elements in the DoclingDocument
         ]
 
+    def _add_page_cache(self):
+        # Memoize the OCR, layout and table structure stages. The key of each
+        # stage includes the configuration of the memoized stages before it.
+        assert self.pipeline_options.page_cache_path is not None
+        cache_store = LocalDirectoryCacheStore(
+            self.pipeline_options.page_cache_path,
+            max_size=self.pipeline_options.page_cache_max_size,
+        )
+
+        ocr_model, layout_model, table_model = self.build_pipe[1:4]
+        stages = [
+            (
+                ocr_model,
+                f"ocr:{type(ocr_model).__name__}:{self.pipeline_options.do_ocr}:"
+                f"{self.pipeline_options.ocr_options.model_dump_json()}",
+                ["cells"],
+            ),
+            (
+                layout_model,
+                f"layout:{StandardPdfPipeline._layout_model_path}",
+                ["cells", "layout"],
+            ),
+            (
+                table_model,
+                f"table:{self.pipeline_options.do_table_structure}:"
+                f"{self.pipeline_options.table_structure_options.model_dump_json()}",
+                ["tablestructure"],
+            ),
+        ]
+
+        stage_key = get_docling_version()
+        for ix, (model, config, outputs) in enumerate(stages, start=1):
+            stage_key = create_hash(f"{stage_key}:{config}")
+            self.build_pipe[ix] = PageCacheModel(
+                model=model,
+                stage_key=stage_key,
+                outputs=outputs,
+                cache_store=cache_store,
+            )
+
     @staticmethod
     def download_models_hf(
         local_dir: Optional[Path] = None, force: bool = False
@@ -103,17 +158,24 @@ class StandardPdfPipeline(PaginatedPipeline):
         return Path(download_path)
 
     def get_ocr_model(self) -> Optional[BaseOcrModel]:
+        # Only the selected OCR engine is imported.
         if isinstance(self.pipeline_options.ocr_options, EasyOcrOptions):
+            from docling.models.easyocr_model import EasyOcrModel
+
             return EasyOcrModel(
                 enabled=self.pipeline_options.do_ocr,
                 options=self.pipeline_options.ocr_options,
             )
         elif isinstance(self.pipeline_options.ocr_options, TesseractCliOcrOptions):
+            from docling.models.tesseract_ocr_cli_model import TesseractOcrCliModel
+
             return TesseractOcrCliModel(
                 enabled=self.pipeline_options.do_ocr,
                 options=self.pipeline_options.ocr_options,
             )
         elif isinstance(self.pipeline_options.ocr_options, TesseractOcrOptions):
+            from docling.models.tesseract_ocr_model import TesseractOcrModel
+
             return TesseractOcrModel(
                 enabled=self.pipeline_options.do_ocr,
                 options=self.pipeline_options.ocr_options,
@@ -158,12 +220,13 @@ class StandardPdfPipeline(PaginatedPipeline):
                         page.image, dpi=int(72 * self.pipeline_options.images_scale)
                     )
 
-            # Generate images of the requested element types
+            # Attach the images cropped during page assembly to the document items
             if (
                 self.pipeline_options.generate_picture_images
                 or self.pipeline_options.generate_table_images
             ):
                 scale = self.pipeline_options.images_scale
+                element_images = self._get_element_images(conv_res)
                 for element, _level in conv_res.document.iterate_items():
                     if not isinstance(element, DocItem) or len(element.prov) == 0:
                         continue
@@ -174,24 +237,71 @@ class StandardPdfPipeline(PaginatedPipeline):
                         isinstance(element, TableItem)
                         and self.pipeline_options.generate_table_images
                     ):
-                        page_ix = element.prov[0].page_no - 1
-                        page = conv_res.pages[page_ix]
-                        assert page.size is not None
-                        assert page.image is not None
-
-                        crop_bbox = (
-                            element.prov[0]
-                            .bbox.scaled(scale=scale)
-                            .to_top_left_origin(page_height=page.size.height * scale)
+                        prov = element.prov[0]
+                        element.image = self._match_element_image(
+                            element_images.get((prov.page_no, type(element)), []),
+                            prov.bbox.as_tuple(),
                         )
 
-                        cropped_im = page.image.crop(crop_bbox.as_tuple())
-                        element.image = ImageRef.from_pil(
-                            cropped_im, dpi=int(72 * scale)
-                        )
+                        # Crop from the page image, if one was kept
+                        if element.image is None:
+                            page = conv_res.pages[prov.page_no - 1]
+                            if page.size is None or page.image is None:
+                                continue
+
+                            crop_bbox = prov.bbox.scaled(
+                                scale=scale
+                            ).to_top_left_origin(page_height=page.size.height * scale)
+
+                            cropped_im = page.image.crop(crop_bbox.as_tuple())
+                            element.image = ImageRef.from_pil(
+                                cropped_im, dpi=int(72 * scale)
+                            )
 
         return conv_res
 
+    @staticmethod
+    def _get_element_images(
+        conv_res: ConversionResult,
+    ) -> Dict[Tuple[int, Type[DocItem]], List[Tuple[Tuple[float, ...], ImageRef]]]:
+        # Images of the assembled elements, by page number and document item type.
+        # GLM derives the item provenance from the cluster box in bottom-left origin.
+        element_images: Dict[
+            Tuple[int, Type[DocItem]], List[Tuple[Tuple[float, ...], ImageRef]]
+        ] = {}
+        for page in conv_res.pages:
+            if page.assembled is None or page.size is None:
+                continue
+            for el in page.assembled.elements:
+                if isinstance(el, FigureElement):
+                    item_type: Type[DocItem] = PictureItem
+                elif isinstance(el, Table):
+                    item_type = TableItem
+                else:
+                    continue
+                if el.image is None:
+                    continue
+
+                bbox = el.cluster.bbox.to_bottom_left_origin(page.size.height)
+                element_images.setdefault((page.page_no + 1, item_type), []).append(
+                    (bbox.as_tuple(), el.image)
+                )
+        return element_images
+
+    @staticmethod
+    def _match_element_image(
+        candidates: List[Tuple[Tuple[float, ...], ImageRef]],
+        bbox: Tuple[float, ...],
+        tolerance: float = 1.0,
+    ) -> Optional[ImageRef]:
+        best_image = None
+        best_distance = tolerance
+        for candidate_bbox, image in candidates:
+            distance = max(abs(a - b) for a, b in zip(candidate_bbox, bbox))
+            if distance < best_distance:
+                best_image, best_distance = image, distance
+        return best_image
+
     @classmethod
     def get_default_options(cls) -> PdfPipelineOptions:
         return PdfPipelineOptions()
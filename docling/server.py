@@ -0,0 +1,541 @@
+import base64
+import http.client
+import logging
+import queue
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+from typing import Deque, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlparse
+
+from pydantic import AnyHttpUrl, TypeAdapter, ValidationError
+
+from docling.datamodel.base_models import ConversionStatus, DocumentStream
+from docling.datamodel.document import InputDocument, _DocumentConversionInput
+from docling.datamodel.server_models import (
+    ConversionRequest,
+    ConversionResponse,
+    ErrorMessage,
+    ServerHealth,
+)
+from docling.datamodel.settings import DocumentLimits, settings
+from docling.document_converter import DocumentConverter
+
+_log = logging.getLogger(__name__)
+
+
+class ServerOverloadedError(RuntimeError):
+    pass
+
+
+class SourceNotAllowedError(PermissionError):
+    pass
+
+
+class _PendingRequest:
+    def __init__(self, request: ConversionRequest):
+        self.request = request
+        self.in_doc: Optional[InputDocument] = None
+        self.num_pages = 0
+
+        self.done = threading.Event()
+        self.response: Optional[ConversionResponse] = None
+        self.error: Optional[Exception] = None
+
+    def finish(
+        self,
+        response: Optional[ConversionResponse] = None,
+        error: Optional[Exception] = None,
+    ):
+        self.response = response
+        self.error = error
+        self.done.set()
+
+
+class ConversionServer:
+    """Serve conversions from a DocumentConverter kept warm across requests.
+
+    All conversions run on a single worker thread, which owns the converter.
+    Requests arriving within batch_wait_time of each other are converted as one
+    batch, whose pages are pooled into shared page batches of the models. New
+    requests are rejected while more than max_queued_pages pages are waiting, or
+    when max_queued_requests requests are already queued or being converted.
+
+    Only uploaded content is accepted by default. Sources resolved by the server
+    must be enabled explicitly: paths below one of source_roots, and URLs with
+    allow_source_urls.
+    """
+
+    def __init__(
+        self,
+        converter: DocumentConverter,
+        max_queued_pages: int = 1000,
+        max_queued_requests: int = 100,
+        max_batch_size: Optional[int] = None,
+        batch_wait_time: float = 0.05,  # in seconds
+        source_roots: Optional[Sequence[Union[Path, str]]] = None,
+        allow_source_urls: bool = False,
+        max_request_size: int = 100 * 1024 * 1024,  # in bytes
+    ):
+        self.converter = converter
+        self.max_request_size = max_request_size
+        self.source_roots = [Path(root).resolve() for root in source_roots or []]
+        self.allow_source_urls = allow_source_urls
+        self.max_queued_pages = max_queued_pages
+        self.max_queued_requests = max_queued_requests
+        self.max_batch_size = max_batch_size or settings.perf.doc_batch_size
+        self.batch_wait_time = batch_wait_time
+
+        self._inbox: queue.Queue[Optional[_PendingRequest]] = queue.Queue(
+            maxsize=max_queued_requests + 1  # room for the stop sentinel
+        )
+        self._lock = threading.Lock()
+        self._queued_requests = 0
+        self._queued_pages = 0
+
+        self._worker: Optional[threading.Thread] = None
+        self._http_server: Optional[socketserver.BaseServer] = None
+
+    def start(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 5001,
+        socket_path: Optional[Union[Path, str]] = None,
+    ):
+        """Load the pipelines and start listening, on TCP or on a Unix socket."""
+        assert self.converter.allowed_formats is not None
+        for doc_format in self.converter.allowed_formats:
+            self.converter.initialize_pipeline(doc_format)
+
+        self._worker = threading.Thread(
+            target=self._run, name="docling-server-worker", daemon=True
+        )
+        self._worker.start()
+
+        if socket_path is not None:
+            Path(socket_path).unlink(missing_ok=True)
+            self._http_server = _ThreadingUnixHTTPServer(
+                str(socket_path), _ConversionRequestHandler
+            )
+        else:
+            self._http_server = ThreadingHTTPServer(
+                (host, port), _ConversionRequestHandler
+            )
+        self._http_server.conversion_server = self  # type: ignore
+        threading.Thread(
+            target=self._http_server.serve_forever, name="docling-server", daemon=True
+        ).start()
+        _log.info(f"Docling server listening on {self.address}.")
+
+    @property
+    def address(self) -> Union[str, Tuple[str, int]]:
+        assert self._http_server is not None
+        return self._http_server.server_address  # type: ignore
+
+    def serve_forever(self, **kwargs):
+        self.start(**kwargs)
+        try:
+            while self._worker is not None and self._worker.is_alive():
+                self._worker.join(timeout=1.0)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self):
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            if isinstance(self._http_server, _ThreadingUnixHTTPServer):
+                Path(self._http_server.server_address).unlink(missing_ok=True)
+            self._http_server = None
+        if self._worker is not None:
+            self._inbox.put(None)
+            self._worker.join()
+            self._worker = None
+        self.converter.shutdown()
+
+    def health(self) -> ServerHealth:
+        with self._lock:
+            return ServerHealth(
+                queued_requests=self._queued_requests,
+                queued_pages=self._queued_pages,
+                max_queued_pages=self.max_queued_pages,
+                max_queued_requests=self.max_queued_requests,
+            )
+
+    def submit(self, request: ConversionRequest) -> ConversionResponse:
+        """Queue a request and wait for its conversion."""
+        worker = self._worker
+        if worker is None or not worker.is_alive():
+            raise RuntimeError("The conversion server is not running.")
+        if request.source is not None:
+            request = request.model_copy(
+                update={"source": self._resolve_source(request.source)}
+            )
+
+        # Reject before queuing, the page count is only known once admitted
+        with self._lock:
+            if self._queued_requests >= self.max_queued_requests:
+                raise ServerOverloadedError("Too many queued requests.")
+            if self._queued_pages >= self.max_queued_pages:
+                raise ServerOverloadedError("Too many queued pages.")
+            self._queued_requests += 1
+
+        pending = _PendingRequest(request)
+        self._inbox.put_nowait(pending)
+
+        # Don't wait forever on a worker which died
+        while not pending.done.wait(timeout=1.0):
+            if not worker.is_alive() and not pending.done.is_set():
+                self._finish(
+                    pending, error=RuntimeError("The conversion worker stopped.")
+                )
+
+        if pending.error is not None:
+            raise pending.error
+        assert pending.response is not None
+        return pending.response
+
+    def _resolve_source(self, source: str) -> str:
+        """Check that the server may read the source, returns it resolved."""
+        try:
+            TypeAdapter(AnyHttpUrl).validate_python(source)
+        except ValidationError:
+            pass
+        else:
+            if not self.allow_source_urls:
+                raise SourceNotAllowedError("URL sources are not allowed.")
+            return source
+
+        path = Path(source).resolve()
+        if not any(path.is_relative_to(root) for root in self.source_roots):
+            raise SourceNotAllowedError(
+                f"The source {source} is not below an allowed source root."
+            )
+        return str(path)
+
+    def _run(self):
+        ready: Deque[_PendingRequest] = deque()
+        stopping = False
+        while not stopping or len(ready) > 0:
+            if not stopping:
+                stopping = self._admit_requests(ready, timeout=None)
+
+                # Give concurrent requests the chance to join the batch
+                deadline = time.monotonic() + self.batch_wait_time
+                while not stopping and 0 < len(ready) < self.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    stopping = self._admit_requests(ready, timeout=remaining)
+
+            # Requests admitted before stopping are still converted
+            batch = [
+                ready.popleft() for _ in range(min(len(ready), self.max_batch_size))
+            ]
+            if len(batch) > 0:
+                self._convert_batch(batch)
+
+        while not self._inbox.empty():
+            pending = self._inbox.get_nowait()
+            if pending is not None:
+                self._finish(pending, error=RuntimeError("The server is stopping."))
+
+    def _admit_requests(
+        self, ready: Deque[_PendingRequest], timeout: Optional[float]
+    ) -> bool:
+        """Admit the requests of the inbox, returns True when asked to stop."""
+        if len(ready) > 0 and timeout is None:
+            timeout = 0
+        try:
+            pending = self._inbox.get(timeout=timeout)
+        except queue.Empty:
+            return False
+
+        while True:
+            if pending is None:
+                return True
+            self._admit(pending, ready)
+            try:
+                pending = self._inbox.get_nowait()
+            except queue.Empty:
+                return False
+
+    def _admit(self, pending: _PendingRequest, ready: Deque[_PendingRequest]):
+        request = pending.request
+        try:
+            pending.in_doc = self._get_input_doc(request)
+        except Exception as e:
+            self._finish(pending, error=e)
+            return
+
+        if pending.in_doc is None:
+            self._finish(pending, error=ValueError("The input format is not allowed."))
+            return
+
+        # Documents with no page count, e.g. Word documents, are counted as one page
+        pending.num_pages = max(1, pending.in_doc.page_count)
+        with self._lock:
+            if (
+                self._queued_pages > 0
+                and self._queued_pages + pending.num_pages > self.max_queued_pages
+            ):
+                overloaded = True
+            else:
+                overloaded = False
+                self._queued_pages += pending.num_pages
+
+        if overloaded:
+            if pending.in_doc._backend is not None:
+                pending.in_doc._backend.unload()
+            pending.num_pages = 0
+            self._finish(
+                pending,
+                error=ServerOverloadedError(
+                    f"Too many queued pages, rejecting {pending.in_doc.file.name}."
+                ),
+            )
+        else:
+            ready.append(pending)
+
+    def _get_input_doc(self, request: ConversionRequest) -> Optional[InputDocument]:
+        assert self.converter.format_to_options is not None
+
+        source: Union[str, DocumentStream]
+        if request.content is not None:
+            assert request.filename is not None
+            source = DocumentStream(
+                name=request.filename, stream=BytesIO(request.content)
+            )
+        else:
+            assert request.source is not None
+            source = request.source
+
+        conv_input = _DocumentConversionInput(
+            path_or_stream_iterator=[source],
+            limits=DocumentLimits(
+                max_num_pages=request.max_num_pages,
+                max_file_size=request.max_file_size,
+            ),
+        )
+        return next(iter(conv_input.docs(self.converter.format_to_options)), None)
+
+    def _convert_batch(self, batch: List[_PendingRequest]):
+        try:
+            conv_results = list(
+                self.converter.convert_batch(
+                    [pending.in_doc for pending in batch],  # type: ignore
+                    raises_on_error=False,
+                )
+            )
+        except Exception as e:
+            _log.exception("Conversion of a request batch failed.")
+            for pending in batch:
+                self._finish(pending, error=e)
+            return
+
+        for pending, conv_res in zip(batch, conv_results):
+            response = ConversionResponse(
+                filename=conv_res.input.file.name,
+                status=conv_res.status,
+                errors=conv_res.errors,
+                document=(
+                    conv_res.document
+                    if conv_res.status
+                    in {ConversionStatus.SUCCESS, ConversionStatus.PARTIAL_SUCCESS}
+                    else None
+                ),
+            )
+            self._finish(pending, response=response)
+
+    def _finish(
+        self,
+        pending: _PendingRequest,
+        response: Optional[ConversionResponse] = None,
+        error: Optional[Exception] = None,
+    ):
+        with self._lock:
+            self._queued_requests -= 1
+            self._queued_pages -= pending.num_pages
+        pending.finish(response=response, error=error)
+
+
+class _ThreadingUnixHTTPServer(
+    socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    daemon_threads = True
+
+
+class _ConversionRequestHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        _log.debug(format % args)
+
+    def _send_json(self, code: int, body: str, headers: Optional[dict] = None):
+        data = body.encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error_message(self, code: int, message: str, **kwargs):
+        self._send_json(code, ErrorMessage(detail=message).model_dump_json(), **kwargs)
+
+    @property
+    def conversion_server(self) -> ConversionServer:
+        return self.server.conversion_server  # type: ignore
+
+    def do_GET(self):
+        if self.path != "/health":
+            self._send_error_message(404, f"Unknown path {self.path}.")
+            return
+        self._send_json(200, self.conversion_server.health().model_dump_json())
+
+    def do_POST(self):
+        if self.path != "/convert":
+            self._send_error_message(404, f"Unknown path {self.path}.")
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            self._send_error_message(400, "Invalid Content-Length header.")
+            return
+        if length > self.conversion_server.max_request_size:
+            # The body is left unread, the connection can't be reused
+            self.close_connection = True
+            self._send_error_message(
+                413,
+                f"The request of {length} bytes exceeds the maximum of "
+                f"{self.conversion_server.max_request_size} bytes.",
+            )
+            return
+
+        try:
+            request = ConversionRequest.model_validate_json(self.rfile.read(length))
+        except (ValueError, ValidationError) as e:
+            self._send_error_message(400, f"Invalid conversion request: {e}")
+            return
+
+        try:
+            response = self.conversion_server.submit(request)
+        except ServerOverloadedError as e:
+            self._send_error_message(503, str(e), headers={"Retry-After": "1"})
+            return
+        except SourceNotAllowedError as e:
+            self._send_error_message(403, str(e))
+            return
+        except ValueError as e:
+            self._send_error_message(400, str(e))
+            return
+        except Exception as e:
+            self._send_error_message(500, str(e))
+            return
+
+        self._send_json(200, response.model_dump_json())
+
+
+class ConversionClient:
+    """Client of a ConversionServer, over TCP or a Unix socket."""
+
+    def __init__(
+        self,
+        url: str = "http://127.0.0.1:5001",
+        socket_path: Optional[Union[Path, str]] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.url = urlparse(url)
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def convert(
+        self,
+        source: Union[Path, str, DocumentStream],
+        max_num_pages: int = sys.maxsize,
+        max_file_size: int = sys.maxsize,
+    ) -> ConversionResponse:
+        """Convert a document. Paths and streams are uploaded, while strings are
+        resolved by the server (e.g. URLs), if it allows them.
+
+        Raises ServerOverloadedError when the server has too many queued pages, and
+        SourceNotAllowedError when the server may not read the source.
+        """
+        if isinstance(source, Path):
+            request = ConversionRequest(
+                filename=source.name,
+                content=base64.b64encode(source.read_bytes()),
+                max_num_pages=max_num_pages,
+                max_file_size=max_file_size,
+            )
+        elif isinstance(source, DocumentStream):
+            request = ConversionRequest(
+                filename=source.name,
+                content=base64.b64encode(source.stream.getvalue()),
+                max_num_pages=max_num_pages,
+                max_file_size=max_file_size,
+            )
+        else:
+            request = ConversionRequest(
+                source=source,
+                max_num_pages=max_num_pages,
+                max_file_size=max_file_size,
+            )
+
+        code, body = self._request("POST", "/convert", request.model_dump_json())
+        if code == 503:
+            raise ServerOverloadedError(ErrorMessage.model_validate_json(body).detail)
+        elif code == 403:
+            raise SourceNotAllowedError(ErrorMessage.model_validate_json(body).detail)
+        elif code != 200:
+            raise RuntimeError(
+                f"Conversion request failed with status {code}: "
+                f"{ErrorMessage.model_validate_json(body).detail}"
+            )
+        return ConversionResponse.model_validate_json(body)
+
+    def health(self) -> ServerHealth:
+        code, body = self._request("GET", "/health")
+        if code != 200:
+            raise RuntimeError(f"Health request failed with status {code}.")
+        return ServerHealth.model_validate_json(body)
+
+    def _request(
+        self, method: str, path: str, body: Optional[str] = None
+    ) -> Tuple[int, bytes]:
+        conn: http.client.HTTPConnection
+        if self.socket_path is not None:
+            conn = _UnixHTTPConnection(str(self.socket_path), timeout=self.timeout)
+        else:
+            conn = http.client.HTTPConnection(
+                self.url.hostname or "127.0.0.1",
+                self.url.port or 80,
+                timeout=self.timeout,
+            )
+        try:
+            headers = {"Content-Type": "application/json"} if body is not None else {}
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            return response.status, response.read()
+        finally:
+            conn.close()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
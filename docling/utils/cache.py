@@ -0,0 +1,300 @@
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+from typing import Optional, Union
+
+from pydantic import BaseModel
+
+_log = logging.getLogger(__name__)
+
+
+class CacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    puts: int = 0
+    evictions: int = 0
+
+
+class BaseCacheStore(ABC):
+    """Key-value store for cached binary blobs, bounded by its total size.
+
+    When max_size is exceeded, the least recently used entries are evicted.
+    Stores are picklable, such that they can be shared with worker processes.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = max_size  # in bytes, None: unbounded
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self._get(key)
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    def put(self, key: str, value: bytes):
+        if self.max_size is not None and len(value) > self.max_size:
+            _log.debug(f"Not caching {key}, entry is larger than the cache size.")
+            return
+        self._put(key, value)
+        self.stats.puts += 1
+        if self.max_size is not None:
+            self.stats.evictions += self._evict(self.max_size)
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def _put(self, key: str, value: bytes):
+        pass
+
+    @abstractmethod
+    def _evict(self, max_size: int) -> int:
+        """Evict least recently used entries until max_size is met.
+
+        Returns the number of evicted entries.
+        """
+        pass
+
+    @abstractmethod
+    def size(self) -> int:
+        """Total size of the cached entries in bytes."""
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+
+class InMemoryCacheStore(BaseCacheStore):
+    """Cache store keeping the entries in memory, in order of their last access.
+
+    A pickled store is a copy, entries put in worker processes are not shared.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        super().__init__(max_size=max_size)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _put(self, key: str, value: bytes):
+        with self._lock:
+            old_value = self._entries.pop(key, None)
+            if old_value is not None:
+                self._size -= len(old_value)
+            self._entries[key] = value
+            self._size += len(value)
+
+    def _evict(self, max_size: int) -> int:
+        num_evicted = 0
+        with self._lock:
+            while self._size > max_size and self._entries:
+                _, value = self._entries.popitem(last=False)
+                self._size -= len(value)
+                num_evicted += 1
+        return num_evicted
+
+    def size(self) -> int:
+        return self._size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class LocalDirectoryCacheStore(BaseCacheStore):
+    """Cache store keeping one file per entry in a local directory.
+
+    The file modification time records the last access of an entry.
+    """
+
+    def __init__(self, path: Union[Path, str], max_size: Optional[int] = None):
+        super().__init__(max_size=max_size)
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / key[:2] / key
+
+    def _touch(self, entry_path: Path):
+        # Mark as recently used. Set explicitly from a fine-grained clock, file
+        # systems may otherwise use coarse timestamps.
+        now_ns = time.time_ns()
+        os.utime(entry_path, ns=(now_ns, now_ns))
+
+    def _entries(self):
+        return [p for p in self.path.glob("*/*") if p.is_file()]
+
+    def _get(self, key: str) -> Optional[bytes]:
+        entry_path = self._entry_path(key)
+        try:
+            value = entry_path.read_bytes()
+            self._touch(entry_path)
+        except FileNotFoundError:
+            return None
+        return value
+
+    def _put(self, key: str, value: bytes):
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first, such that concurrent readers never
+        # see a partially written entry.
+        fd, tmp_name = tempfile.mkstemp(dir=entry_path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fw:
+                fw.write(value)
+            os.replace(tmp_name, entry_path)
+            self._touch(entry_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _evict(self, max_size: int) -> int:
+        entries = []
+        for p in self._entries():
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+
+        total_size = sum(size for _, size, _ in entries)
+        num_evicted = 0
+        for _, entry_size, p in sorted(entries, key=lambda e: e[0]):
+            if total_size <= max_size:
+                break
+            p.unlink(missing_ok=True)
+            total_size -= entry_size
+            num_evicted += 1
+        return num_evicted
+
+    def size(self) -> int:
+        return sum(p.stat().st_size for p in self._entries())
+
+    def clear(self):
+        for p in self._entries():
+            p.unlink(missing_ok=True)
+
+
+class SqliteCacheStore(BaseCacheStore):
+    """Cache store keeping all entries in a single SQLite database file."""
+
+    def __init__(self, path: Union[Path, str], max_size: Optional[int] = None):
+        super().__init__(max_size=max_size)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_entries_last_access "
+                "ON cache_entries (last_access)"
+            )
+
+    def _connect(self):
+        # A short-lived connection per operation keeps the store thread-safe
+        # and picklable.
+        return _SqliteConnection(self.path)
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE cache_entries SET last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        return row[0]
+
+    def _put(self, key: str, value: bytes):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, size, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), len(value), time.time()),
+            )
+
+    def _evict(self, max_size: int) -> int:
+        num_evicted = 0
+        with self._connect() as conn:
+            total_size = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache_entries"
+            ).fetchone()[0]
+            if total_size <= max_size:
+                return 0
+
+            evict_keys = []
+            for key, entry_size in conn.execute(
+                "SELECT key, size FROM cache_entries ORDER BY last_access"
+            ):
+                if total_size <= max_size:
+                    break
+                evict_keys.append((key,))
+                total_size -= entry_size
+            conn.executemany("DELETE FROM cache_entries WHERE key = ?", evict_keys)
+            num_evicted = len(evict_keys)
+        return num_evicted
+
+    def size(self) -> int:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache_entries"
+            ).fetchone()[0]
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cache_entries")
+
+
+class _SqliteConnection:
+    """Context manager committing and closing a sqlite3 connection."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn = sqlite3.connect(self.path, timeout=30.0)
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        with closing(self.conn):
+            if exc_type is None:
+                self.conn.commit()
+            else:
+                self.conn.rollback()
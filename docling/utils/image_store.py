@@ -0,0 +1,115 @@
+import itertools
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+from PIL import Image
+
+
+class PageImageStore:
+    """Keep page images within a memory budget.
+
+    The most recently used images are kept in memory, up to max_memory bytes of
+    pixel data. Older images are spilled as PNG files to a temporary directory
+    and loaded back when they are accessed again.
+    """
+
+    def __init__(self, max_memory: int, spill_path: Optional[Union[Path, str]] = None):
+        self.max_memory = max_memory
+        self.spill_path = spill_path
+
+        self._lock = threading.Lock()
+        self._keys = itertools.count()
+        self._images: "OrderedDict[int, Image.Image]" = OrderedDict()
+        self._memory = 0
+        self._spilled: Dict[int, Path] = {}
+        self._spill_dir: Optional[tempfile.TemporaryDirectory] = None
+
+    @staticmethod
+    def _image_memory(image: Image.Image) -> int:
+        return image.width * image.height * len(image.getbands())
+
+    def _get_spill_dir(self) -> Path:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.TemporaryDirectory(
+                prefix="docling_page_images_", dir=self.spill_path
+            )
+        return Path(self._spill_dir.name)
+
+    def _add(self, key: int, image: Image.Image):
+        self._images[key] = image
+        self._memory += self._image_memory(image)
+
+        # Spill the least recently used images, but keep the one just added
+        while self._memory > self.max_memory and len(self._images) > 1:
+            old_key, old_image = self._images.popitem(last=False)
+            self._memory -= self._image_memory(old_image)
+            path = self._get_spill_dir() / f"{old_key}.png"
+            old_image.save(path, format="PNG", compress_level=1)
+            self._spilled[old_key] = path
+
+    def put(self, image: Image.Image) -> int:
+        """Add an image to the store and return its key."""
+        with self._lock:
+            key = next(self._keys)
+            self._add(key, image)
+        return key
+
+    def get(self, key: int) -> Optional[Image.Image]:
+        with self._lock:
+            if key in self._images:
+                self._images.move_to_end(key)
+                return self._images[key]
+
+            path = self._spilled.pop(key, None)
+            if path is None:
+                return None
+            with Image.open(path) as spilled_image:
+                image = spilled_image.copy()
+            path.unlink()
+            self._add(key, image)
+            return image
+
+    def discard(self, keys: Iterable[int]):
+        with self._lock:
+            for key in keys:
+                if key in self._images:
+                    self._memory -= self._image_memory(self._images.pop(key))
+                elif key in self._spilled:
+                    self._spilled.pop(key).unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._images) + len(self._spilled)
+
+    @property
+    def memory(self) -> int:
+        """Bytes of pixel data held in memory."""
+        return self._memory
+
+    def __getstate__(self):
+        # Spilled images travel as their PNG data, e.g. to the parent process.
+        with self._lock:
+            return {
+                "max_memory": self.max_memory,
+                "spill_path": self.spill_path,
+                "images": list(self._images.items()),
+                "spilled": [
+                    (key, path.read_bytes()) for key, path in self._spilled.items()
+                ],
+            }
+
+    def __setstate__(self, state):
+        self.__init__(state["max_memory"], state["spill_path"])
+        keys = [key for key, _ in state["images"]] + [
+            key for key, _ in state["spilled"]
+        ]
+        self._keys = itertools.count(max(keys, default=-1) + 1)
+
+        for key, data in state["spilled"]:
+            path = self._get_spill_dir() / f"{key}.png"
+            path.write_bytes(data)
+            self._spilled[key] = path
+        for key, image in state["images"]:
+            self._add(key, image)
@@ -1,8 +1,9 @@
 import copy
 import logging
 
-import networkx as nx
+import numpy as np
 from docling_core.types.doc import DocItemLabel
+from rtree import index
 
 logger = logging.getLogger("layout_utils")
 
@@ -133,17 +134,118 @@ def vertical_overlap_fraction(bboxA, bboxB):
     return fraction
 
 
+## -------------------------------
+## Pairwise geometric relations on bbox arrays
+## The arrays have one row per bbox, with the same column order as the lists.
+## The arithmetic matches the functions above, so the results are identical.
+
+
+def bbox_array(clusters):
+    return np.array([c["bbox"] for c in clusters], dtype=np.float64).reshape(-1, 4)
+
+
+def iou_matrix(bboxes):
+    ## Element [i, j] is bb_iou(bboxes[i], bboxes[j])
+    xA = np.maximum(bboxes[:, None, 0], bboxes[None, :, 0])
+    yA = np.maximum(bboxes[:, None, 1], bboxes[None, :, 1])
+    xB = np.minimum(bboxes[:, None, 2], bboxes[None, :, 2])
+    yB = np.minimum(bboxes[:, None, 3], bboxes[None, :, 3])
+    interArea = np.maximum(0, xB - xA + 1) * np.maximum(0, yB - yA + 1)
+    boxArea = (bboxes[:, 2] - bboxes[:, 0] + 1) * (bboxes[:, 3] - bboxes[:, 1] + 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return interArea / (boxArea[:, None] + boxArea[None, :] - interArea)
+
+
+def contains_matrix(bboxes_i, bboxes_j):
+    ## Element [i, j] is contains(bboxes_i[i], bboxes_j[j])
+    return (
+        (bboxes_i[:, None, 0] <= bboxes_j[None, :, 0])
+        & (bboxes_i[:, None, 1] <= bboxes_j[None, :, 1])
+        & (bboxes_i[:, None, 2] >= bboxes_j[None, :, 2])
+        & (bboxes_i[:, None, 3] >= bboxes_j[None, :, 3])
+    )
+
+
+def intersecting_matrix(bboxes):
+    ## Element [i, j] is is_intersecting(bboxes[i], bboxes[j])
+    return ~(
+        (bboxes[:, None, 2] < bboxes[None, :, 0])
+        | (bboxes[:, None, 0] > bboxes[None, :, 2])
+        | (bboxes[:, None, 3] < bboxes[None, :, 1])
+        | (bboxes[:, None, 1] > bboxes[None, :, 3])
+    )
+
+
+def grow_bboxes(bboxes, margin):
+    ## Moves every side of the bboxes outwards by margin, inwards if negative.
+    return np.stack(
+        [
+            bboxes[:, 0] - margin,
+            bboxes[:, 1] - margin,
+            bboxes[:, 2] + margin,
+            bboxes[:, 3] + margin,
+        ],
+        axis=1,
+    )
+
+
 ## -------------------------------
 ## Cluster-and-cell relations
 
 
+def build_cell_index(raw_cells):
+    ## Builds an R-tree over the raw cell bboxes, to be built once per page and
+    ## shared by the postprocess steps which look up the cells of a cluster.
+    p = index.Property()
+    p.dimension = 2
+    if len(raw_cells) == 0:
+        return index.Index(properties=p)
+    return index.Index(
+        (
+            (
+                ix,
+                (
+                    min(cell["bbox"][0], cell["bbox"][2]),
+                    min(cell["bbox"][1], cell["bbox"][3]),
+                    max(cell["bbox"][0], cell["bbox"][2]),
+                    max(cell["bbox"][1], cell["bbox"][3]),
+                ),
+                None,
+            )
+            for ix, cell in enumerate(raw_cells)
+        ),
+        properties=p,
+    )
+
+
+def find_candidate_cells(cluster_bbox, raw_cells, cell_index=None):
+    ## Returns the indices of the raw cells which may be enclosed by the cluster,
+    ## in raw-cell order. Without an index, all cells are candidates.
+    ## The enclosure test accepts cells reaching up to 3 points out of the cluster,
+    ## so the query box gets a slightly larger margin.
+    margin = 4
+    query_bbox = [
+        cluster_bbox[0] - margin,
+        cluster_bbox[1] - margin,
+        cluster_bbox[2] + margin,
+        cluster_bbox[3] + margin,
+    ]
+    if (
+        cell_index is None
+        or query_bbox[0] > query_bbox[2]
+        or query_bbox[1] > query_bbox[3]
+    ):
+        return range(len(raw_cells))
+    return sorted(cell_index.intersection(query_bbox))
+
+
 def compute_enclosed_cells(
-    cluster_bbox, raw_cells, min_cell_intersection_with_cluster=0.2
+    cluster_bbox, raw_cells, min_cell_intersection_with_cluster=0.2, cell_index=None
 ):
     cells_in_cluster = []
     cells_in_cluster_int = []
-    for ix, cell in enumerate(raw_cells):
-        cell_bbox = cell["bbox"]
+    for ix in find_candidate_cells(cluster_bbox, raw_cells, cell_index):
+        cell_bbox = raw_cells[ix]["bbox"]
         intersection = compute_intersection(cell_bbox, cluster_bbox)
         frac_area = area(cell_bbox) * min_cell_intersection_with_cluster
 
@@ -184,12 +286,13 @@ def find_cell_indices(cluster, cell_array):
     ## "cell_array" that of a cells array.
     ## Returns list of indices of cells in cell_array that have the rawcell_ids as in the cluster,
     ## in the order of the rawcell_ids.
+    positions = {}
+    for ix, cell in enumerate(cell_array):
+        positions.setdefault(cell["rawcell_id"], []).append(ix)
     result = []
     for raw_ix in sorted(cluster["cell_ids"]):
-        ## Find the cell with this rawcell_id (if any)
-        for ix, cell in enumerate(cell_array):
-            if cell["rawcell_id"] == raw_ix:
-                result.append(ix)
+        ## Find the cells with this rawcell_id (if any)
+        result.extend(positions.get(raw_ix, []))
     return result
 
 
@@ -328,9 +431,14 @@ def produce_reading_order(clusters, cluster_sort_type, cell_sort_type, sort_ids)
             "Clusters without cells: "
             + str([cl["id"] for cl in clusters_without_cells])
         )
-        clusters_with_cells_sorted = sorted(
-            clusters_with_cells, key=lambda cluster: cluster["cell_ids"][0]
+        ## Stable sort on the first cell ids, clusters with the same first cell
+        ## keep their order.
+        first_cell_ids = np.array(
+            [cl["cell_ids"][0] for cl in clusters_with_cells], dtype=np.int64
         )
+        clusters_with_cells_sorted = [
+            clusters_with_cells[ix] for ix in np.argsort(first_cell_ids, kind="stable")
+        ]
         logger.debug(
             "  First cell ids after sorting: "
             + str([cl["cell_ids"][0] for cl in clusters_with_cells_sorted])
@@ -363,7 +471,7 @@ def sort_cells_horizontal(line_cell_ids, raw_cells):
     return new_line_cell_ids
 
 
-def adapt_bboxes(raw_cells, clusters, orphan_cell_indices):
+def adapt_bboxes(raw_cells, clusters, orphan_cell_indices, cell_index=None):
     new_clusters = []
     for ix, cluster in enumerate(clusters):
         new_cluster = copy.deepcopy(cluster)
@@ -374,13 +482,15 @@ def adapt_bboxes(raw_cells, clusters, orphan_cell_indices):
         if len(cluster["cell_ids"]) == 0 and cluster["type"] != DocItemLabel.PICTURE:
             logger.debug("  Empty non-picture, removed")
             continue  ## Skip this former cluster, now without cells.
-        new_bbox = adapt_bbox(raw_cells, new_cluster, orphan_cell_indices)
+        new_bbox = adapt_bbox(
+            raw_cells, new_cluster, orphan_cell_indices, cell_index=cell_index
+        )
         new_cluster["bbox"] = new_bbox
         new_clusters.append(new_cluster)
     return new_clusters
 
 
-def adapt_bbox(raw_cells, cluster, orphan_cell_indices):
+def adapt_bbox(raw_cells, cluster, orphan_cell_indices, cell_index=None):
     if not (cluster["type"] in [DocItemLabel.TABLE, DocItemLabel.PICTURE]):
         ## A text-like cluster. The bbox only needs to be around the text cells:
         logger.debug("    Initial bbox: " + str(cluster["bbox"]))
@@ -416,7 +526,10 @@ def adapt_bbox(raw_cells, cluster, orphan_cell_indices):
         ## (To decrease dependencies, we don't make use of which cells we actually removed.)
         ## We don't worry about orphan cells, those could still be added to the table.
         enclosed_cells = compute_enclosed_cells(
-            new_bbox, raw_cells, min_cell_intersection_with_cluster=0.3
+            new_bbox,
+            raw_cells,
+            min_cell_intersection_with_cluster=0.3,
+            cell_index=cell_index,
         )[0]
         additional_cells = set(enclosed_cells) - set(cluster["cell_ids"])
         logger.debug(
@@ -471,37 +584,59 @@ def adapt_bbox(raw_cells, cluster, orphan_cell_indices):
 
 
 def remove_cluster_duplicates_by_conf(cluster_predictions, threshold=0.5):
-    DuplicateDeletedClusterIDs = []
-    for cluster_1 in cluster_predictions:
-        for cluster_2 in cluster_predictions:
-            if cluster_1["id"] != cluster_2["id"]:
-                if_conf = False
-                if cluster_1["confidence"] > cluster_2["confidence"]:
-                    if_conf = True
-                if if_conf == True:
-                    if bb_iou(cluster_1["bbox"], cluster_2["bbox"]) > threshold:
-                        DuplicateDeletedClusterIDs.append(cluster_2["id"])
-                    elif contains(
-                        cluster_1["bbox"],
-                        [
-                            cluster_2["bbox"][0] + 3,
-                            cluster_2["bbox"][1] + 3,
-                            cluster_2["bbox"][2] - 3,
-                            cluster_2["bbox"][3] - 3,
-                        ],
-                    ):
-                        DuplicateDeletedClusterIDs.append(cluster_2["id"])
-
+    ## Removes the clusters overlapping with, or contained in, a more confident one.
+    if len(cluster_predictions) == 0:
+        return cluster_predictions
+    ids = np.array([c["id"] for c in cluster_predictions])
+    confidences = np.array([c["confidence"] for c in cluster_predictions])
+    bboxes = bbox_array(cluster_predictions)
+
+    duplicates = (
+        (ids[:, None] != ids[None, :])
+        & (confidences[:, None] > confidences[None, :])
+        & (
+            (iou_matrix(bboxes) > threshold)
+            | contains_matrix(bboxes, grow_bboxes(bboxes, -3))
+        )
+    )
+    ## Column j of each pair, in the order of the pairs
+    DuplicateDeletedClusterIDs = [
+        cluster_predictions[j]["id"] for j in np.nonzero(duplicates)[1]
+    ]
     DuplicateDeletedClusterIDs = list(set(DuplicateDeletedClusterIDs))
 
-    for cl_id in DuplicateDeletedClusterIDs:
+    remove_clusters_by_id(cluster_predictions, DuplicateDeletedClusterIDs)
+    return cluster_predictions
+
+
+def remove_clusters_by_id(cluster_predictions, cluster_ids):
+    ## Removes the clusters with the given ids from the list, in place, and
+    ## returns them in the order they are removed.
+    if len({c["id"] for c in cluster_predictions}) == len(cluster_predictions):
+        clusters_by_id = {c["id"]: c for c in cluster_predictions}
+        removed = [
+            clusters_by_id.pop(cl_id)
+            for cl_id in cluster_ids
+            if cl_id in clusters_by_id
+        ]
+        removed_ids = {c["id"] for c in removed}
+        cluster_predictions[:] = [
+            c for c in cluster_predictions if c["id"] not in removed_ids
+        ]
+        return removed
+
+    ## Ids can repeat, e.g. when a low confidence prediction is added back for
+    ## several orphans. The clusters removed then depend on their order, which
+    ## is kept as is.
+    removed = []
+    for cl_id in cluster_ids:
         for cluster in cluster_predictions:
             if cl_id == cluster["id"]:
+                removed.append(cluster)
                 cluster_predictions.remove(cluster)
-    return cluster_predictions
+    return removed
 
 
-# Assign orphan cells by a low confidence prediction that is below the assigned confidence
 def assign_orphans_with_low_conf_pred(
     cluster_predictions, cluster_predictions_low, raw_cells, orphan_cell_indices
 ):
@@ -678,33 +813,33 @@ def set_orphan_as_text(
 
 
 def merge_cells(cluster_predictions):
-    # Using graph component creates clusters if orphan cells are touching or too close.
-    G = nx.Graph()
-    for cluster in cluster_predictions:
-        if cluster["created_by"] == "orphan_default":
-            G.add_node(cluster["id"])
+    # Merges the orphan clusters which are touching or too close, as connected
+    # components over the pairs of intersecting (grown) bboxes.
+    orphans = [c for c in cluster_predictions if c["created_by"] == "orphan_default"]
+    orphan_ids = [c["id"] for c in orphans]
+
+    parents = {cl_id: cl_id for cl_id in orphan_ids}
+
+    def find(cl_id):
+        while parents[cl_id] != cl_id:
+            parents[cl_id] = parents[parents[cl_id]]
+            cl_id = parents[cl_id]
+        return cl_id
+
+    if len(orphans) > 0:
+        bboxes = grow_bboxes(bbox_array(orphans), 2)
+        ids = np.array(orphan_ids)
+        touching = intersecting_matrix(bboxes) & (ids[:, None] != ids[None, :])
+        for i, j in zip(*np.nonzero(np.triu(touching))):
+            root_i, root_j = find(orphan_ids[i]), find(orphan_ids[j])
+            if root_i != root_j:
+                parents[root_j] = root_i
+
+    components = {}
+    for cl_id in parents:
+        components.setdefault(find(cl_id), []).append(cl_id)
+    component = sorted(map(sorted, components.values()))
 
-    for cluster_1 in cluster_predictions:
-        for cluster_2 in cluster_predictions:
-            if (
-                cluster_1["id"] != cluster_2["id"]
-                and cluster_2["created_by"] == "orphan_default"
-                and cluster_1["created_by"] == "orphan_default"
-            ):
-                cl1 = copy.deepcopy(cluster_1["bbox"])
-                cl2 = copy.deepcopy(cluster_2["bbox"])
-                cl1[0] = cl1[0] - 2
-                cl1[1] = cl1[1] - 2
-                cl1[2] = cl1[2] + 2
-                cl1[3] = cl1[3] + 2
-                cl2[0] = cl2[0] - 2
-                cl2[1] = cl2[1] - 2
-                cl2[2] = cl2[2] + 2
-                cl2[3] = cl2[3] + 2
-                if is_intersecting(cl1, cl2):
-                    G.add_edge(cluster_1["id"], cluster_2["id"])
-
-    component = sorted(map(sorted, nx.k_edge_components(G, k=1)))
     max_id = -1
     for cluster_1 in cluster_predictions:
         if cluster_1["id"] > max_id:
@@ -713,12 +848,8 @@ def merge_cells(cluster_predictions):
     for nodes in component:
         if len(nodes) > 1:
             max_id += 1
-            lines = []
-            for node in nodes:
-                for cluster in cluster_predictions:
-                    if cluster["id"] == node:
-                        lines.append(cluster)
-                        cluster_predictions.remove(cluster)
+            # With repeated ids, every orphan removed is merged
+            lines = remove_clusters_by_id(cluster_predictions, nodes)
             new_merged_cluster = build_cluster_from_lines(
                 lines, DocItemLabel.TEXT, max_id
             )
@@ -734,65 +865,71 @@ def clean_up_clusters(
     one_cell_table=False,
 ):
     DuplicateDeletedClusterIDs = []
+    if len(cluster_predictions) == 0:
+        return cluster_predictions
+
+    ids = np.array([c["id"] for c in cluster_predictions])
+    bboxes = bbox_array(cluster_predictions)
+    other = ids[:, None] != ids[None, :]
+
+    if merge_cells == True:
+        # remove any artifcats created by merging clusters
+        pairs = other & contains_matrix(bboxes, grow_bboxes(bboxes, -3))
+    elif img_table == True:
+        # remove clusters that might appear inside tables, or images (such as pdf cells in graphs)
+        labels = [c["type"] for c in cluster_predictions]
+        is_text = np.array([label == DocItemLabel.TEXT for label in labels])
+        is_picture = np.array([label == DocItemLabel.PICTURE for label in labels])
+        is_table = np.array([label == DocItemLabel.TABLE for label in labels])
+        pairs = (
+            other
+            & ((is_text[:, None] & is_picture[None, :]) | is_table[None, :])
+            & (
+                (iou_matrix(bboxes) > 0.5)
+                | contains_matrix(grow_bboxes(bboxes, 3), bboxes).T
+            )
+        )
+    else:
+        pairs = np.zeros_like(other)
 
-    for cluster_1 in cluster_predictions:
-        for cluster_2 in cluster_predictions:
-            if cluster_1["id"] != cluster_2["id"]:
-                # remove any artifcats created by merging clusters
-                if merge_cells == True:
-                    if contains(
-                        cluster_1["bbox"],
-                        [
-                            cluster_2["bbox"][0] + 3,
-                            cluster_2["bbox"][1] + 3,
-                            cluster_2["bbox"][2] - 3,
-                            cluster_2["bbox"][3] - 3,
-                        ],
-                    ):
-                        cluster_1["cell_ids"] = (
-                            cluster_1["cell_ids"] + cluster_2["cell_ids"]
-                        )
-                        DuplicateDeletedClusterIDs.append(cluster_2["id"])
-                # remove clusters that might appear inside tables, or images (such as pdf cells in graphs)
-                elif img_table == True:
-                    if (
-                        cluster_1["type"] == DocItemLabel.TEXT
-                        and cluster_2["type"] == DocItemLabel.PICTURE
-                        or cluster_2["type"] == DocItemLabel.TABLE
-                    ):
-                        if bb_iou(cluster_1["bbox"], cluster_2["bbox"]) > 0.5:
-                            DuplicateDeletedClusterIDs.append(cluster_1["id"])
-                        elif contains(
-                            [
-                                cluster_2["bbox"][0] - 3,
-                                cluster_2["bbox"][1] - 3,
-                                cluster_2["bbox"][2] + 3,
-                                cluster_2["bbox"][3] + 3,
-                            ],
-                            cluster_1["bbox"],
-                        ):
-                            DuplicateDeletedClusterIDs.append(cluster_1["id"])
-            # remove tables that have one pdf cell
-            if one_cell_table == True:
-                if (
-                    cluster_1["type"] == DocItemLabel.TABLE
-                    and len(cluster_1["cell_ids"]) < 2
-                ):
-                    DuplicateDeletedClusterIDs.append(cluster_1["id"])
+    def treat_pair(cluster_1, cluster_2):
+        if merge_cells == True:
+            cluster_1["cell_ids"] = cluster_1["cell_ids"] + cluster_2["cell_ids"]
+            DuplicateDeletedClusterIDs.append(cluster_2["id"])
+        else:
+            DuplicateDeletedClusterIDs.append(cluster_1["id"])
+
+    # The pairs are treated in the order of the pairwise loops: merged cell_ids
+    # carry over to the clusters treated later.
+    for i, cluster_1 in enumerate(cluster_predictions):
+        js = np.flatnonzero(pairs[i]).tolist()
+        # remove tables that have one pdf cell, checked after the pair with the
+        # first cluster (later pairs only add cells)
+        num_before_check = 1 if js[:1] == [0] else 0
+        for j in js[:num_before_check]:
+            treat_pair(cluster_1, cluster_predictions[j])
+        if (
+            one_cell_table == True
+            and cluster_1["type"] == DocItemLabel.TABLE
+            and len(cluster_1["cell_ids"]) < 2
+        ):
+            DuplicateDeletedClusterIDs.append(cluster_1["id"])
+        for j in js[num_before_check:]:
+            treat_pair(cluster_1, cluster_predictions[j])
 
     DuplicateDeletedClusterIDs = list(set(DuplicateDeletedClusterIDs))
 
-    for cl_id in DuplicateDeletedClusterIDs:
-        for cluster in cluster_predictions:
-            if cl_id == cluster["id"]:
-                cluster_predictions.remove(cluster)
+    remove_clusters_by_id(cluster_predictions, DuplicateDeletedClusterIDs)
     return cluster_predictions
 
 
-def assigning_cell_ids_to_clusters(clusters, raw_cells, threshold):
+def assigning_cell_ids_to_clusters(clusters, raw_cells, threshold, cell_index=None):
     for cluster in clusters:
         cells_in_cluster, _ = compute_enclosed_cells(
-            cluster["bbox"], raw_cells, min_cell_intersection_with_cluster=threshold
+            cluster["bbox"],
+            raw_cells,
+            min_cell_intersection_with_cluster=threshold,
+            cell_index=cell_index,
         )
         cluster["cell_ids"] = cells_in_cluster
         ## These cell_ids are ids of the raw cells.
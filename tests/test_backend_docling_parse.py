@@ -61,6 +61,19 @@ def test_get_text_from_rect(test_doc_path):
     assert textpiece.strip() == ref
 
 
+def test_get_text_in_cell_rects():
+    doc_backend = _get_backend(Path("./tests/data/2305.03393v1-pg9.pdf"))
+    page_backend: DoclingParsePageBackend = doc_backend.load_page(0)
+
+    # Every text cell is found back in its own rect
+    for cell in page_backend.get_text_cells():
+        assert cell.text in page_backend.get_text_in_rect(cell.bbox)
+
+    # Rects off the page or without extent contain no text
+    assert page_backend.get_text_in_rect(BoundingBox(l=-20, t=-20, r=-10, b=-10)) == ""
+    assert page_backend.get_text_in_rect(BoundingBox(l=100, t=100, r=100, b=400)) == ""
+
+
 def test_crop_page_image(test_doc_path):
     doc_backend = _get_backend(test_doc_path)
     page_backend: DoclingParsePageBackend = doc_backend.load_page(0)
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import pytest
+from docling_core.types.doc import CoordOrigin
 
 from docling.backend.docling_parse_v2_backend import (
     DoclingParseV2DocumentBackend,
@@ -47,6 +48,23 @@ def test_text_cell_counts():
             last_cell_count = len(cells)
 
 
+def test_text_cells_decoding():
+    doc_backend = _get_backend(Path("./tests/data/2305.03393v1-pg9.pdf"))
+    page_backend: DoclingParseV2PageBackend = doc_backend.load_page(0)
+    page_size = page_backend.get_size()
+
+    cells_table = page_backend._dpage["sanitized"]["cells"]
+    texts = [row[cells_table["header"].index("text")] for row in cells_table["data"]]
+
+    cells = list(page_backend.get_text_cells())
+    assert [c.id for c in cells] == list(range(len(texts)))
+    assert [c.text for c in cells] == texts
+    for cell in cells:
+        assert cell.bbox.coord_origin == CoordOrigin.TOPLEFT
+        assert 0 <= cell.bbox.l <= cell.bbox.r <= page_size.width
+        assert 0 <= cell.bbox.t <= cell.bbox.b <= page_size.height
+
+
 def test_get_text_from_rect(test_doc_path):
     doc_backend = _get_backend(test_doc_path)
     page_backend: DoclingParseV2PageBackend = doc_backend.load_page(0)
@@ -60,6 +78,19 @@ def test_get_text_from_rect(test_doc_path):
     assert textpiece.strip() == ref
 
 
+def test_get_text_in_cell_rects():
+    doc_backend = _get_backend(Path("./tests/data/2305.03393v1-pg9.pdf"))
+    page_backend: DoclingParseV2PageBackend = doc_backend.load_page(0)
+
+    # Every text cell is found back in its own rect
+    for cell in page_backend.get_text_cells():
+        assert cell.text in page_backend.get_text_in_rect(cell.bbox)
+
+    # Rects off the page or without extent contain no text
+    assert page_backend.get_text_in_rect(BoundingBox(l=-20, t=-20, r=-10, b=-10)) == ""
+    assert page_backend.get_text_in_rect(BoundingBox(l=100, t=100, r=100, b=400)) == ""
+
+
 def test_crop_page_image(test_doc_path):
     doc_backend = _get_backend(test_doc_path)
     page_backend: DoclingParseV2PageBackend = doc_backend.load_page(0)
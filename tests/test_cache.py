@@ -0,0 +1,108 @@
+from pathlib import Path
+
+import pytest
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import ConversionStatus, InputFormat
+from docling.datamodel.settings import settings
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.utils.cache import (
+    InMemoryCacheStore,
+    LocalDirectoryCacheStore,
+    SqliteCacheStore,
+)
+
+from .test_paginated_pipeline import CellsPipeline
+
+
+@pytest.fixture(params=["memory", "directory", "sqlite"])
+def get_cache_store(request, tmp_path):
+    def _get_cache_store(max_size=None):
+        if request.param == "memory":
+            return InMemoryCacheStore(max_size=max_size)
+        if request.param == "directory":
+            return LocalDirectoryCacheStore(tmp_path / "cache", max_size=max_size)
+        return SqliteCacheStore(tmp_path / "cache.db", max_size=max_size)
+
+    return _get_cache_store
+
+
+def test_cache_store_lru_eviction(get_cache_store):
+    store = get_cache_store(max_size=30)
+
+    store.put("aa01", b"0123456789")
+    store.put("bb02", b"0123456789")
+    store.put("cc03", b"0123456789")
+    assert store.size() == 30
+
+    # Touch the oldest entry, the second one becomes least recently used
+    assert store.get("aa01") == b"0123456789"
+
+    store.put("dd04", b"0123456789")
+    assert store.get("bb02") is None
+    assert store.get("aa01") is not None
+    assert store.get("dd04") is not None
+    assert store.size() == 30
+
+    # Entries larger than the whole cache are not stored
+    store.put("ee05", b"x" * 31)
+    assert store.get("ee05") is None
+
+    assert store.stats.hits == 3
+    assert store.stats.misses == 2
+    assert store.stats.puts == 4
+    assert store.stats.evictions == 1
+
+    store.clear()
+    assert store.size() == 0
+
+
+def test_converter_uses_cache(get_cache_store):
+    docx_path = Path("./tests/data/docx/lorem_ipsum.docx")
+    store = get_cache_store()
+    converter = DocumentConverter(allowed_formats=[InputFormat.DOCX], cache_store=store)
+
+    conv_res = converter.convert(docx_path)
+    assert store.stats.misses == 1
+    assert store.stats.puts == 1
+
+    cached_res = converter.convert(docx_path)
+    assert store.stats.hits == 1
+    assert cached_res.status == ConversionStatus.SUCCESS
+    assert cached_res.input.document_hash == conv_res.input.document_hash
+    assert cached_res.document.export_to_dict() == conv_res.document.export_to_dict()
+
+    # Another document is not served from the cache
+    converter.convert(Path("./tests/data/docx/word_sample.docx"))
+    assert store.stats.misses == 2
+
+
+def test_converter_uses_cache_with_page_pooling(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings.perf, "doc_page_pooling", True)
+    pdf_paths = [
+        Path("./tests/data/2305.03393v1-pg9.pdf"),
+        Path("./tests/data/redp5110_sampled.pdf"),
+    ]
+    store = LocalDirectoryCacheStore(tmp_path / "cache")
+    converter = DocumentConverter(
+        allowed_formats=[InputFormat.PDF],
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=CellsPipeline, backend=PyPdfiumDocumentBackend
+            )
+        },
+        cache_store=store,
+    )
+
+    conv_results = list(converter.convert_all(pdf_paths))
+    assert store.stats.misses == 2
+    assert store.stats.puts == 2
+
+    cached_results = list(converter.convert_all(pdf_paths))
+    assert store.stats.hits == 2
+    assert [r.input.file for r in cached_results] == pdf_paths
+    for conv_res, cached_res in zip(conv_results, cached_results):
+        assert cached_res.status == ConversionStatus.SUCCESS
+        assert (
+            cached_res.document.export_to_dict() == conv_res.document.export_to_dict()
+        )
@@ -0,0 +1,163 @@
+import asyncio
+import subprocess
+import sys
+from contextlib import aclosing
+from pathlib import Path
+
+from docling.datamodel.base_models import ConversionStatus, InputFormat
+from docling.datamodel.settings import DocBatchExecutor, settings
+from docling.document_converter import DocumentConverter
+
+
+def get_input_paths():
+    return sorted(Path("./tests/data/docx").glob("*.docx")) + sorted(
+        Path("./tests/data/html").glob("*.html")
+    )
+
+
+def get_converter():
+    return DocumentConverter(allowed_formats=[InputFormat.DOCX, InputFormat.HTML])
+
+
+def test_process_pool_matches_serial(monkeypatch):
+    input_paths = get_input_paths()
+
+    serial_results = list(get_converter().convert_all(input_paths))
+
+    monkeypatch.setattr(
+        settings,
+        "perf",
+        settings.perf.model_copy(
+            update={
+                "doc_batch_executor": DocBatchExecutor.PROCESS_POOL,
+                "doc_batch_concurrency": 2,
+            }
+        ),
+    )
+    converter = get_converter()
+    try:
+        pool_results = list(converter.convert_all(input_paths))
+
+        monkeypatch.setattr(settings.perf, "doc_batch_ordered", False)
+        unordered_results = list(converter.convert_all(input_paths))
+    finally:
+        converter.shutdown()
+
+    assert [r.input.file for r in pool_results] == input_paths
+    assert sorted(r.input.file for r in unordered_results) == input_paths
+
+    for serial_res, pool_res in zip(serial_results, pool_results):
+        assert pool_res.status == ConversionStatus.SUCCESS
+        assert pool_res.input.document_hash == serial_res.input.document_hash
+        assert (
+            pool_res.document.export_to_dict() == serial_res.document.export_to_dict()
+        )
+
+
+def test_aconvert_all_matches_convert_all(monkeypatch):
+    input_paths = get_input_paths()
+    sync_results = list(get_converter().convert_all(input_paths))
+
+    monkeypatch.setattr(settings.perf, "doc_batch_concurrency", 1)
+    monkeypatch.setattr(settings.perf, "doc_batch_size", 2)
+
+    async def sources():
+        for input_path in input_paths:
+            await asyncio.sleep(0)
+            yield input_path
+
+    async def convert():
+        converter = get_converter()
+        try:
+            results = [r async for r in converter.aconvert_all(sources())]
+            single_res = await converter.aconvert(input_paths[0])
+        finally:
+            converter.shutdown()
+        return results, single_res
+
+    async_results, single_res = asyncio.run(convert())
+
+    assert [r.input.file for r in async_results] == input_paths
+    for sync_res, async_res in zip(sync_results, async_results):
+        assert async_res.status == ConversionStatus.SUCCESS
+        assert async_res.document.export_to_dict() == sync_res.document.export_to_dict()
+    assert (
+        single_res.document.export_to_dict()
+        == sync_results[0].document.export_to_dict()
+    )
+
+
+def test_aconvert_all_stops_early():
+    input_paths = get_input_paths()
+    num_consumed = 0
+
+    def sources():
+        nonlocal num_consumed
+        for input_path in input_paths:
+            num_consumed += 1
+            yield input_path
+
+    async def convert():
+        converter = get_converter()
+        try:
+            async with aclosing(converter.aconvert_all(sources())) as results:
+                async for conv_res in results:
+                    return conv_res
+        finally:
+            converter.shutdown()
+
+    conv_res = asyncio.run(convert())
+
+    assert conv_res.input.file == input_paths[0]
+    # Sources beyond the in-flight window were never pulled
+    max_in_flight = settings.perf.doc_batch_concurrency * settings.perf.doc_batch_size
+    assert num_consumed == max_in_flight < len(input_paths)
+
+
+def test_lazy_imports():
+    # Importing the converter and converting a Word document must not import the
+    # other backends nor the models. pandas is left out, docling_core imports it.
+    code = (
+        "import sys\n"
+        "from docling.document_converter import DocumentConverter\n"
+        "print(' '.join(sys.modules))\n"
+        "DocumentConverter().convert('./tests/data/docx/lorem_ipsum.docx')\n"
+        "print(' '.join(sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    after_import, after_convert = (
+        set(line.split()) for line in result.stdout.splitlines()
+    )
+    for module in ["torch", "docling_ibm_models", "easyocr"]:
+        assert module not in after_import, f"{module} was imported"
+    for module in [
+        "torch",
+        "docling_ibm_models",
+        "easyocr",
+        "docling_parse",
+        "pptx",
+        "marko",
+        "docling.pipeline.standard_pdf_pipeline",
+    ]:
+        assert module not in after_convert, f"{module} was imported"
+
+
+def test_import_time():
+    # Importing the converter used to take several seconds, most of it in torch
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import docling.document_converter"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Cumulative import time in us, as reported by -X importtime
+    import_times = {
+        parts[2].strip(): int(parts[1])
+        for parts in (line.split("|") for line in result.stderr.splitlines())
+        if len(parts) == 3 and parts[1].strip().isdigit()
+    }
+    assert import_times["docling.document_converter"] < 3_500_000
@@ -0,0 +1,110 @@
+from pathlib import Path
+
+import numpy as np
+from docling_core.types.doc import BoundingBox
+from PIL import Image
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import InputFormat, OcrCell, Page, Size
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import EasyOcrOptions
+from docling.models.easyocr_model import EasyOcrModel
+
+
+class RecordingReader:
+    def __init__(self):
+        self.batches = []
+
+    def readtext_batched(self, images, batch_size=1):
+        # Report the marker pixel of each image as its text
+        self.batches.append([im.shape for im in images])
+        return [
+            [([[0, 0], [1, 0], [1, 1], [0, 1]], str(im[0, 0, 0]), 0.9)] for im in images
+        ]
+
+
+class CropPageBackend:
+    def is_valid(self):
+        return True
+
+    def get_page_image(self, scale, cropbox):
+        # Crops are marked with their left coordinate
+        im = Image.new(
+            "RGB",
+            (round(cropbox.width * scale), round(cropbox.height * scale)),
+            "white",
+        )
+        im.putpixel((0, 0), (round(cropbox.l),) * 3)
+        return im
+
+
+def test_read_images_in_batches():
+    model = EasyOcrModel(enabled=False, options=EasyOcrOptions(batch_size=2))
+    model.reader = RecordingReader()
+
+    sizes = [(30, 40), (300, 400), (30, 50), (310, 400), (20, 20)]
+    images = []
+    for ix, (height, width) in enumerate(sizes):
+        im = np.zeros((height, width, 3), dtype=np.uint8)
+        im[0, 0] = ix
+        images.append(im)
+
+    results = model._read_images(images)
+
+    # Results are in the order of the images
+    assert [result[0][1] for result in results] == ["0", "1", "2", "3", "4"]
+
+    # Similar sizes are batched and padded together
+    assert model.reader.batches == [
+        [(20, 20, 3)],
+        [(30, 50, 3), (30, 50, 3)],
+        [(310, 400, 3), (310, 400, 3)],
+    ]
+    assert model._read_images([]) == []
+
+
+def test_ocr_results_cache():
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    model = EasyOcrModel(
+        enabled=False, options=EasyOcrOptions(cache_memory_size=1 << 20)
+    )
+    model.enabled = True
+    model.reader = RecordingReader()
+
+    def ocr_page(lefts):
+        page = Page(page_no=0, size=Size(width=600, height=800))
+        page._backend = CropPageBackend()
+        page.cells = []
+        model.get_ocr_rects = lambda page: [
+            BoundingBox(l=l, t=100, r=l + 50, b=150) for l in lefts
+        ]
+        (page,) = model(ConversionResult(input=in_doc), [page])
+        return [
+            (cell.text, cell.bbox.l, cell.bbox.t)
+            for cell in page.cells
+            if isinstance(cell, OcrCell)
+        ]
+
+    assert ocr_page([10, 80]) == [("10", 10, 100), ("80", 80, 100)]
+    assert len(model.reader.batches) == 1
+
+    # Only the new crop is read, the cached cells keep their place
+    assert ocr_page([150, 10, 220, 80]) == [
+        ("150", 150, 100),
+        ("10", 10, 100),
+        ("220", 220, 100),
+        ("80", 80, 100),
+    ]
+    assert model.reader.batches[1:] == [[(150, 150, 3), (150, 150, 3)]]
+
+    assert ocr_page([80, 220]) == [("80", 80, 100), ("220", 220, 100)]
+    assert len(model.reader.batches) == 2
+
+    # Results of another engine version are not reused
+    model.engine_version = "0.0.0"
+    assert ocr_page([80]) == [("80", 80, 100)]
+    assert len(model.reader.batches) == 3
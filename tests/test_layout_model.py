@@ -0,0 +1,199 @@
+import time
+
+import torch
+import torchvision.transforms as T
+from docling_core.types.doc import BoundingBox, DocItemLabel
+from docling_ibm_models.layoutmodel.layout_predictor import LayoutPredictor
+from PIL import Image
+
+from docling.datamodel.base_models import Cell, Cluster
+from docling.models.layout_model import LayoutModel
+
+
+def fake_layout_model(imgs, orig_sizes):
+    # Deterministic per image, independent of the other images in the batch.
+    num_imgs = imgs.shape[0]
+    means = imgs.mean(dim=(1, 2, 3))
+    labels = torch.tensor([[0, 8, 15, 9, 5]] * num_imgs)
+    scores = torch.stack(
+        [torch.tensor([0.9, 0.7, 0.95, 0.3, 0.61]) + m * 0.01 for m in means]
+    )
+    boxes = torch.stack(
+        [
+            torch.tensor(
+                [
+                    [-5.0, 10.0, 0.5 * w, 0.25 * h],
+                    [10.0, 0.3 * h, w + 12.0, 0.4 * h],
+                    [0.0, 0.0, w, h],
+                    [1.0, 2.0, 3.0, 4.0],
+                    [0.1 * w, 0.9 * h, 0.9 * w, h + 1.0],
+                ]
+            )
+            for w, h in orig_sizes.tolist()
+        ]
+    )
+    return labels, boxes, scores
+
+
+def get_layout_model(layout_model=fake_layout_model):
+    predictor = LayoutPredictor.__new__(LayoutPredictor)
+    predictor._classes_map = {
+        0: "background",
+        1: "Caption",
+        6: "Page-header",
+        9: "Section-header",
+        10: "Table",
+        16: "Form",
+    }
+    predictor._black_classes = {"Form", "Key-Value Region"}
+    predictor._threshold = 0.6
+    predictor.model = layout_model
+
+    # Bypass loading the model artifacts
+    model = LayoutModel.__new__(LayoutModel)
+    model.layout_predictor = predictor
+    model._transforms = T.Compose([T.Resize((640, 640)), T.ToTensor()])
+    model._batched_inference = None
+    return model
+
+
+def get_page_images():
+    return [
+        Image.new("RGB", (612, 792), color=(255, 255, 255)),
+        Image.new("L", (595, 842), color=40),
+        Image.new("RGB", (842, 595), color=(10, 200, 30)),
+    ]
+
+
+def test_batched_predictions_match_single_page():
+    model = get_layout_model()
+    images = get_page_images()
+
+    batched = model._predict_page_images(images)
+    single = [list(model.layout_predictor.predict(img)) for img in images]
+
+    assert model._batched_inference is True  # checked against predict()
+    assert len(batched) == len(images)
+    for batch_preds, single_preds in zip(batched, single):
+        assert len(batch_preds) == len(single_preds) == 3
+        for batch_pred, single_pred in zip(batch_preds, single_preds):
+            assert batch_pred["label"] == single_pred["label"]
+            assert batch_pred["confidence"] == single_pred["confidence"]
+            for k in ["l", "t", "r", "b"]:
+                assert float(batch_pred[k]) == float(single_pred[k])
+
+
+def test_batched_predictions_fallback():
+    def single_image_model(imgs, orig_sizes):
+        labels, boxes, scores = fake_layout_model(imgs, orig_sizes)
+        return labels[:1], boxes[:1], scores[:1]
+
+    model = get_layout_model(single_image_model)
+    images = get_page_images()
+
+    predictions = model._predict_page_images(images)
+
+    assert not model._batched_inference
+    assert predictions == [list(model.layout_predictor.predict(img)) for img in images]
+
+
+def test_batched_predictions_guard(caplog, monkeypatch):
+    images = get_page_images()
+
+    # A failing batch falls back for this batch only
+    def failing_model(imgs, orig_sizes):
+        if imgs.shape[0] > 1:
+            raise RuntimeError("out of memory")
+        return fake_layout_model(imgs, orig_sizes)
+
+    model = get_layout_model(failing_model)
+    predictions = model._predict_page_images(images)
+    assert model._batched_inference is None
+    assert predictions == [list(model.layout_predictor.predict(img)) for img in images]
+    assert "out of memory" in caplog.text
+
+    # A change of the filtering in predict() disables batching
+    model = get_layout_model()
+    predict = model.layout_predictor.predict
+    monkeypatch.setattr(
+        model.layout_predictor, "predict", lambda img: list(predict(img))[:1]
+    )
+    predictions = model._predict_page_images(images)
+    assert model._batched_inference is False
+    assert predictions == [list(model.layout_predictor.predict(img)) for img in images]
+    assert "doesn't match" in caplog.text
+
+    # Missing internals are never used
+    model = get_layout_model()
+    del model.layout_predictor._threshold
+    monkeypatch.setattr(model.layout_predictor, "predict", lambda img: [img.size])
+    assert model._predict_page_images(images) == [[img.size] for img in images]
+
+
+def get_multi_column_page(num_columns, num_paragraphs, num_lines, num_words):
+    # Cells in reading order, one text cluster per paragraph of each column.
+    cells = []
+    clusters = []
+    column_width = 540 / num_columns
+    line_height = 700 / (num_paragraphs * (num_lines + 1))
+    for col in range(num_columns):
+        for par in range(num_paragraphs):
+            first_cell = len(cells)
+            top = 40 + par * (num_lines + 1) * line_height
+            for line in range(num_lines):
+                for word in range(num_words):
+                    l = 36 + col * column_width + word * column_width / num_words
+                    t = top + line * line_height
+                    cells.append(
+                        Cell(
+                            id=len(cells),
+                            text=f"w{len(cells)}",
+                            bbox=BoundingBox(
+                                l=l,
+                                t=t,
+                                r=l + 0.8 * column_width / num_words,
+                                b=t + 0.8 * line_height,
+                            ),
+                        )
+                    )
+            clusters.append(
+                Cluster(
+                    id=len(clusters),
+                    label=DocItemLabel.TEXT,
+                    confidence=0.9,
+                    bbox=BoundingBox(
+                        l=min(c.bbox.l for c in cells[first_cell:]),
+                        t=min(c.bbox.t for c in cells[first_cell:]),
+                        r=max(c.bbox.r for c in cells[first_cell:]),
+                        b=max(c.bbox.b for c in cells[first_cell:]),
+                    ),
+                )
+            )
+    # The layout model doesn't predict the clusters in reading order
+    clusters.reverse()
+    return clusters, cells
+
+
+def test_postprocess_reading_order_on_dense_pages():
+    model = LayoutModel.__new__(LayoutModel)
+
+    for num_paragraphs in [4, 16]:
+        num_columns, num_lines, num_words = 3, 6, 10
+        clusters, cells = get_multi_column_page(
+            num_columns, num_paragraphs, num_lines, num_words
+        )
+
+        start_time = time.monotonic()
+        clusters_out, cells_out = model.postprocess(clusters, cells, page_height=792)
+        elapsed = time.monotonic() - start_time
+        assert elapsed < 2.0  # was quadratic in the number of cells
+
+        # Column by column, paragraph by paragraph
+        cells_per_paragraph = num_lines * num_words
+        assert len(clusters_out) == num_columns * num_paragraphs
+        for ix, cluster in enumerate(clusters_out):
+            assert cluster.id == ix
+            assert [c.id for c in cluster.cells] == list(
+                range(ix * cells_per_paragraph, (ix + 1) * cells_per_paragraph)
+            )
+        assert [c.id for c in cells_out] == [c.id for c in cells]
@@ -0,0 +1,326 @@
+import copy
+import itertools
+import random
+
+import networkx as nx
+import pytest
+from docling_core.types.doc import DocItemLabel
+
+from docling.utils import layout_utils as lu
+
+
+def get_random_cells(rng, num_cells, page_size=600.0):
+    raw_cells = []
+    for ix in range(num_cells):
+        l = rng.uniform(0, page_size)
+        b = rng.uniform(0, page_size)
+        # Include tiny cells, which the containment test accepts near a cluster
+        w = rng.choice([0.0, rng.uniform(0, 6), rng.uniform(0, 60)])
+        h = rng.choice([0.0, rng.uniform(0, 6), rng.uniform(0, 12)])
+        raw_cells.append({"id": ix, "bbox": [l, b, l + w, b + h], "text": str(ix)})
+    return raw_cells
+
+
+def get_random_clusters(rng, num_clusters, page_size=600.0):
+    clusters = []
+    for ix in range(num_clusters):
+        l = rng.uniform(-10, page_size)
+        b = rng.uniform(-10, page_size)
+        w = rng.uniform(0, 300)
+        h = rng.uniform(0, 200)
+        clusters.append({"id": ix, "bbox": [l, b, l + w, b + h], "cell_ids": []})
+    return clusters
+
+
+def test_indexed_enclosed_cells_match_full_scan():
+    rng = random.Random(42)
+    raw_cells = get_random_cells(rng, 2000)
+    cell_index = lu.build_cell_index(raw_cells)
+
+    for cluster in get_random_clusters(rng, 200):
+        for threshold in [0.2, 0.3]:
+            assert lu.compute_enclosed_cells(
+                cluster["bbox"], raw_cells, threshold, cell_index=cell_index
+            ) == lu.compute_enclosed_cells(cluster["bbox"], raw_cells, threshold)
+
+
+def test_indexed_cell_assignment_matches_full_scan():
+    rng = random.Random(7)
+    raw_cells = get_random_cells(rng, 500)
+    clusters = get_random_clusters(rng, 50)
+
+    indexed = lu.assigning_cell_ids_to_clusters(
+        [dict(c, cell_ids=[]) for c in clusters],
+        raw_cells,
+        0.2,
+        cell_index=lu.build_cell_index(raw_cells),
+    )
+    full_scan = lu.assigning_cell_ids_to_clusters(
+        [dict(c, cell_ids=[]) for c in clusters], raw_cells, 0.2
+    )
+    assert [c["cell_ids"] for c in indexed] == [c["cell_ids"] for c in full_scan]
+
+    # An empty page has no cells to assign
+    empty_index = lu.build_cell_index([])
+    assert lu.compute_enclosed_cells([0, 0, 10, 10], [], cell_index=empty_index) == (
+        [],
+        [],
+    )
+
+
+def get_cluster(id, bbox, confidence=0.9, label=DocItemLabel.TEXT, cell_ids=None):
+    return {
+        "id": id,
+        "bbox": bbox,
+        "confidence": confidence,
+        "cell_ids": cell_ids or [],
+        "type": label,
+        "created_by": "high_conf_pred",
+    }
+
+
+def test_remove_cluster_duplicates_by_conf():
+    clusters = [
+        get_cluster(0, [0, 0, 100, 100], confidence=0.9),
+        # Overlaps with cluster 0, less confident
+        get_cluster(1, [1, 1, 100, 99], confidence=0.8),
+        # Contained in cluster 0, less confident
+        get_cluster(2, [10, 10, 20, 20], confidence=0.5),
+        # Contained in cluster 0, more confident
+        get_cluster(3, [50, 50, 60, 60], confidence=0.95),
+        get_cluster(4, [200, 200, 300, 300], confidence=0.3),
+    ]
+    clusters = lu.remove_cluster_duplicates_by_conf(clusters, 0.8)
+    assert [c["id"] for c in clusters] == [0, 3, 4]
+
+
+def test_clean_up_clusters():
+    clusters = [
+        get_cluster(0, [0, 0, 100, 100], cell_ids=[0, 1]),
+        get_cluster(1, [10, 10, 20, 20], cell_ids=[2]),
+        get_cluster(2, [200, 200, 300, 300], label=DocItemLabel.TABLE, cell_ids=[3]),
+        get_cluster(3, [400, 0, 500, 100], label=DocItemLabel.TABLE, cell_ids=[4, 5]),
+    ]
+    clusters = lu.clean_up_clusters(
+        clusters, [], merge_cells=True, img_table=True, one_cell_table=True
+    )
+    assert [c["id"] for c in clusters] == [0, 3]
+    assert clusters[0]["cell_ids"] == [0, 1, 2]
+
+
+def test_merge_cells():
+    clusters = [get_cluster(0, [0, 0, 500, 100])]
+    for id, bbox in [
+        (1, [0, 200, 10, 210]),
+        (2, [12, 200, 22, 210]),  # close to 1
+        (3, [100, 200, 110, 210]),
+        (4, [24, 204, 30, 220]),  # close to 2
+    ]:
+        clusters.append(
+            dict(get_cluster(id, bbox, cell_ids=[id]), created_by="orphan_default")
+        )
+
+    clusters = lu.merge_cells(clusters)
+    assert [c["id"] for c in clusters] == [0, 3, 5]
+    assert clusters[2]["cell_ids"] == [1, 2, 4]
+    assert clusters[2]["bbox"] == [0, 200, 30, 220]
+    assert clusters[2]["created_by"] == "merged_cells"
+
+
+# Previous (pairwise loop) implementations, the reference for the vectorized ones
+
+
+def remove_cluster_duplicates_by_conf_loop(cluster_predictions, threshold=0.5):
+    DuplicateDeletedClusterIDs = []
+    for cluster_1 in cluster_predictions:
+        for cluster_2 in cluster_predictions:
+            if cluster_1["id"] != cluster_2["id"]:
+                if cluster_1["confidence"] > cluster_2["confidence"]:
+                    if lu.bb_iou(cluster_1["bbox"], cluster_2["bbox"]) > threshold:
+                        DuplicateDeletedClusterIDs.append(cluster_2["id"])
+                    elif lu.contains(
+                        cluster_1["bbox"],
+                        [
+                            cluster_2["bbox"][0] + 3,
+                            cluster_2["bbox"][1] + 3,
+                            cluster_2["bbox"][2] - 3,
+                            cluster_2["bbox"][3] - 3,
+                        ],
+                    ):
+                        DuplicateDeletedClusterIDs.append(cluster_2["id"])
+
+    DuplicateDeletedClusterIDs = list(set(DuplicateDeletedClusterIDs))
+
+    for cl_id in DuplicateDeletedClusterIDs:
+        for cluster in cluster_predictions:
+            if cl_id == cluster["id"]:
+                cluster_predictions.remove(cluster)
+    return cluster_predictions
+
+
+def merge_cells_loop(cluster_predictions):
+    G = nx.Graph()
+    for cluster in cluster_predictions:
+        if cluster["created_by"] == "orphan_default":
+            G.add_node(cluster["id"])
+
+    for cluster_1 in cluster_predictions:
+        for cluster_2 in cluster_predictions:
+            if (
+                cluster_1["id"] != cluster_2["id"]
+                and cluster_2["created_by"] == "orphan_default"
+                and cluster_1["created_by"] == "orphan_default"
+            ):
+                cl1 = [x + d for x, d in zip(cluster_1["bbox"], [-2, -2, 2, 2])]
+                cl2 = [x + d for x, d in zip(cluster_2["bbox"], [-2, -2, 2, 2])]
+                if lu.is_intersecting(cl1, cl2):
+                    G.add_edge(cluster_1["id"], cluster_2["id"])
+
+    component = sorted(map(sorted, nx.k_edge_components(G, k=1)))
+    max_id = -1
+    for cluster_1 in cluster_predictions:
+        if cluster_1["id"] > max_id:
+            max_id = cluster_1["id"]
+
+    for nodes in component:
+        if len(nodes) > 1:
+            max_id += 1
+            lines = []
+            for node in nodes:
+                for cluster in cluster_predictions:
+                    if cluster["id"] == node:
+                        lines.append(cluster)
+                        cluster_predictions.remove(cluster)
+            new_merged_cluster = lu.build_cluster_from_lines(
+                lines, DocItemLabel.TEXT, max_id
+            )
+            cluster_predictions.append(new_merged_cluster)
+    return cluster_predictions
+
+
+def clean_up_clusters_loop(
+    cluster_predictions,
+    raw_cells,
+    merge_cells=False,
+    img_table=False,
+    one_cell_table=False,
+):
+    DuplicateDeletedClusterIDs = []
+
+    for cluster_1 in cluster_predictions:
+        for cluster_2 in cluster_predictions:
+            if cluster_1["id"] != cluster_2["id"]:
+                if merge_cells == True:
+                    if lu.contains(
+                        cluster_1["bbox"],
+                        [
+                            cluster_2["bbox"][0] + 3,
+                            cluster_2["bbox"][1] + 3,
+                            cluster_2["bbox"][2] - 3,
+                            cluster_2["bbox"][3] - 3,
+                        ],
+                    ):
+                        cluster_1["cell_ids"] = (
+                            cluster_1["cell_ids"] + cluster_2["cell_ids"]
+                        )
+                        DuplicateDeletedClusterIDs.append(cluster_2["id"])
+                elif img_table == True:
+                    if (
+                        cluster_1["type"] == DocItemLabel.TEXT
+                        and cluster_2["type"] == DocItemLabel.PICTURE
+                        or cluster_2["type"] == DocItemLabel.TABLE
+                    ):
+                        if lu.bb_iou(cluster_1["bbox"], cluster_2["bbox"]) > 0.5:
+                            DuplicateDeletedClusterIDs.append(cluster_1["id"])
+                        elif lu.contains(
+                            [
+                                cluster_2["bbox"][0] - 3,
+                                cluster_2["bbox"][1] - 3,
+                                cluster_2["bbox"][2] + 3,
+                                cluster_2["bbox"][3] + 3,
+                            ],
+                            cluster_1["bbox"],
+                        ):
+                            DuplicateDeletedClusterIDs.append(cluster_1["id"])
+            if one_cell_table == True:
+                if (
+                    cluster_1["type"] == DocItemLabel.TABLE
+                    and len(cluster_1["cell_ids"]) < 2
+                ):
+                    DuplicateDeletedClusterIDs.append(cluster_1["id"])
+
+    DuplicateDeletedClusterIDs = list(set(DuplicateDeletedClusterIDs))
+
+    for cl_id in DuplicateDeletedClusterIDs:
+        for cluster in cluster_predictions:
+            if cl_id == cluster["id"]:
+                cluster_predictions.remove(cluster)
+    return cluster_predictions
+
+
+def get_random_predictions(rng, num_clusters, repeated_ids=False):
+    # Small pages and rounded coordinates, for many overlaps, containments,
+    # touching bboxes and ties
+    ids = rng.sample(range(3 * num_clusters), num_clusters)
+    if repeated_ids:
+        ids = [rng.choice(ids[: num_clusters // 2 + 1]) for _ in ids]
+    clusters = []
+    for id in ids:
+        l = round(rng.uniform(0, 200))
+        b = round(rng.uniform(0, 200))
+        w = round(rng.choice([rng.uniform(0, 8), rng.uniform(0, 80)]))
+        h = round(rng.choice([rng.uniform(0, 8), rng.uniform(0, 40)]))
+        cluster = get_cluster(
+            id,
+            [l, b, l + w, b + h],
+            confidence=rng.choice([0.3, 0.5, 0.8, 0.9]),
+            label=rng.choice(
+                [DocItemLabel.TEXT, DocItemLabel.PICTURE, DocItemLabel.TABLE]
+            ),
+            cell_ids=rng.sample(range(100), rng.choice([0, 1, 1, 2, 3])),
+        )
+        if rng.random() < 0.6:
+            cluster["created_by"] = "orphan_default"
+        clusters.append(cluster)
+    return clusters
+
+
+@pytest.mark.parametrize("repeated_ids", [False, True])
+def test_cluster_clean_up_matches_pairwise_loops(repeated_ids):
+    rng = random.Random(12)
+    for _ in range(300):
+        clusters = get_random_predictions(
+            rng, rng.randint(0, 25), repeated_ids=repeated_ids
+        )
+
+        for threshold in [0.5, 0.8]:
+            assert lu.remove_cluster_duplicates_by_conf(
+                copy.deepcopy(clusters), threshold
+            ) == remove_cluster_duplicates_by_conf_loop(
+                copy.deepcopy(clusters), threshold
+            )
+
+        assert lu.merge_cells(copy.deepcopy(clusters)) == merge_cells_loop(
+            copy.deepcopy(clusters)
+        )
+
+        for flags in itertools.product([False, True], repeat=3):
+            assert lu.clean_up_clusters(
+                copy.deepcopy(clusters), [], *flags
+            ) == clean_up_clusters_loop(copy.deepcopy(clusters), [], *flags)
+
+
+def test_merge_cells_with_repeated_orphan_ids():
+    # Orphans 1 (twice, apart) and 2 touch: both clusters with id 1 are merged,
+    # as by the pairwise loops
+    clusters = [
+        dict(get_cluster(id, bbox, cell_ids=[ix]), created_by="orphan_default")
+        for ix, (id, bbox) in enumerate(
+            [(1, [0, 0, 10, 10]), (2, [12, 0, 22, 10]), (1, [24, 0, 34, 10])]
+        )
+    ]
+    clusters = lu.merge_cells(clusters)
+    assert len(clusters) == 1
+    assert clusters[0]["id"] == 3
+    assert clusters[0]["cell_ids"] == [0, 2, 1]
+    assert clusters[0]["bbox"] == [0, 0, 34, 10]
@@ -0,0 +1,176 @@
+import random
+import time
+
+import numpy as np
+from docling_core.types.doc import BoundingBox
+from PIL import Image, ImageDraw
+from scipy.ndimage import find_objects, label
+
+from docling.datamodel.base_models import Cell, Page, Size
+from docling.datamodel.pipeline_options import EasyOcrOptions
+from docling.models.base_ocr_model import BaseOcrModel, find_ocr_rects
+
+
+class OcrModel(BaseOcrModel):
+    def __call__(self, conv_res, page_batch):
+        yield from page_batch
+
+
+class BitmapPageBackend:
+    def __init__(self, bitmap_rects):
+        self.bitmap_rects = bitmap_rects
+
+    def get_bitmap_rects(self, scale=1):
+        yield from self.bitmap_rects
+
+
+def get_page(bitmap_rects, cells=[]):
+    page = Page(page_no=0, size=Size(width=600, height=800))
+    page._backend = BitmapPageBackend(bitmap_rects)
+    page.cells = cells
+    return page
+
+
+def get_text_lines(l, t, r, b, line_height=12):
+    # Lines of text filling the given box, half of it is line spacing
+    return [
+        Cell(
+            id=ix,
+            text="x" * round((r - l) / 5),
+            bbox=BoundingBox(l=l, t=y, r=r, b=y + line_height / 2),
+        )
+        for ix, y in enumerate(range(t, b, line_height))
+    ]
+
+
+def as_tuples(rects):
+    return [rect.as_tuple() for rect in rects]
+
+
+def test_ocr_rects_text_coverage():
+    bitmap_rects = [
+        BoundingBox(l=10, t=10, r=590, b=790),  # full-page background
+    ]
+    cells = get_text_lines(60, 60, 540, 740)
+
+    # OCR everything by default
+    model = OcrModel(enabled=True, options=EasyOcrOptions())
+    assert as_tuples(model.get_ocr_rects(get_page(bitmap_rects, cells))) == [
+        (0, 0, 600, 800)
+    ]
+
+    # Skip rects whose text is available
+    model = OcrModel(enabled=True, options=EasyOcrOptions(text_coverage_threshold=0.15))
+    assert model.get_ocr_rects(get_page(bitmap_rects, cells)) == []
+    assert as_tuples(model.get_ocr_rects(get_page(bitmap_rects))) == [(0, 0, 600, 800)]
+
+    # Sparse text, e.g. a caption over a picture, is not enough
+    assert as_tuples(model.get_ocr_rects(get_page(bitmap_rects, cells[:10]))) == [
+        (0, 0, 600, 800)
+    ]
+
+    # Forced OCR is never skipped
+    model = OcrModel(
+        enabled=True,
+        options=EasyOcrOptions(text_coverage_threshold=0.15, force_full_page_ocr=True),
+    )
+    assert as_tuples(model.get_ocr_rects(get_page(bitmap_rects, cells))) == [
+        (0, 0, 600, 800)
+    ]
+
+
+def test_ocr_rects_text_coverage_per_rect():
+    bitmap_rects = [
+        BoundingBox(l=50, t=50, r=300, b=300),  # picture with a text layer
+        BoundingBox(l=50, t=400, r=300, b=650),  # scanned picture
+    ]
+    cells = get_text_lines(50, 50, 300, 300)
+
+    model = OcrModel(enabled=True, options=EasyOcrOptions(text_coverage_threshold=0.15))
+    assert as_tuples(model.get_ocr_rects(get_page(bitmap_rects, cells))) == [
+        (50, 400, 300, 650)
+    ]
+
+
+def find_ocr_rects_raster(size, bitmap_rects):
+    # Reference: label the bitmaps drawn into a page raster
+    image = Image.new("1", (round(size.width), round(size.height)))
+    draw = ImageDraw.Draw(image)
+    for rect in bitmap_rects:
+        x0, y0, x1, y1 = (round(c) for c in rect.as_tuple())
+        draw.rectangle([(x0, y0), (x1, y1)], fill=1)
+
+    np_image = np.array(image)
+    labeled_image, _ = label(np_image > 0)
+    boxes = [
+        (slc[1].start, slc[0].start, slc[1].stop - 1, slc[0].stop - 1)
+        for slc in find_objects(labeled_image)
+    ]
+    return np.sum(np_image > 0) / (size.width * size.height), boxes
+
+
+def test_find_ocr_rects_matches_raster():
+    rng = random.Random(42)
+    size = Size(width=300.4, height=200.6)
+
+    for _ in range(200):
+        bitmap_rects = []
+        for _ in range(rng.randint(0, 12)):
+            l = rng.uniform(-20, 310)
+            t = rng.uniform(-20, 210)
+            # Include lines and boxes which touch on an edge or corner only
+            w = rng.choice([0.0, rng.randint(1, 30), rng.uniform(0, 120)])
+            h = rng.choice([0.0, rng.randint(1, 30), rng.uniform(0, 80)])
+            bitmap_rects.append(BoundingBox(l=l, t=t, r=l + w, b=t + h))
+
+        coverage, ocr_rects = find_ocr_rects(size, bitmap_rects)
+        raster_coverage, raster_boxes = find_ocr_rects_raster(size, bitmap_rects)
+        assert abs(coverage - raster_coverage) < 1e-9
+        assert as_tuples(ocr_rects) == raster_boxes
+
+
+def test_find_ocr_rects_many_tiles():
+    # Scanned pages are often split into thousands of image tiles
+    rng = random.Random(42)
+    size = Size(width=612, height=792)
+    bitmap_rects = []
+    for row in range(60):
+        for col in range(50):
+            if rng.random() < 0.2:
+                continue  # gaps split the tiles into several components
+            l, t = 12 * col + 6, 13 * row + 6
+            bitmap_rects.append(BoundingBox(l=l, t=t, r=l + 11, b=t + 12))
+    rng.shuffle(bitmap_rects)
+    assert len(bitmap_rects) > 2000
+
+    start = time.monotonic()
+    coverage, ocr_rects = find_ocr_rects(size, bitmap_rects)
+    elapsed = time.monotonic() - start
+
+    raster_coverage, raster_boxes = find_ocr_rects_raster(size, bitmap_rects)
+    assert abs(coverage - raster_coverage) < 1e-9
+    assert as_tuples(ocr_rects) == raster_boxes
+    assert elapsed < 1.0
+
+    # Merging the gaps gives back the whole grid
+    _, ocr_rects = find_ocr_rects(size, bitmap_rects, merge_distance=15)
+    assert len(ocr_rects) == 1
+
+
+def test_find_ocr_rects_merge_distance():
+    size = Size(width=600, height=800)
+    bitmap_rects = [
+        BoundingBox(l=10, t=10, r=100, b=100),
+        BoundingBox(l=101, t=101, r=200, b=200),  # touches on a corner only
+        BoundingBox(l=205, t=10, r=300, b=100),
+        BoundingBox(l=400, t=400, r=500, b=500),
+    ]
+    assert find_ocr_rects(size, []) == (0.0, [])
+
+    coverage, ocr_rects = find_ocr_rects(size, bitmap_rects)
+    assert len(ocr_rects) == 4
+
+    # Nearby rects are merged, the coverage stays the same
+    merged_coverage, ocr_rects = find_ocr_rects(size, bitmap_rects, merge_distance=5)
+    assert merged_coverage == coverage
+    assert as_tuples(ocr_rects) == [(10, 10, 300, 200), (400, 400, 500, 500)]
@@ -0,0 +1,102 @@
+from pathlib import Path
+from typing import Iterable
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import ConversionStatus, InputFormat, Page
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import PipelineOptions
+from docling.models.base_model import BasePageModel
+from docling.models.page_cache_model import PageCacheModel
+from docling.models.page_preprocessing_model import (
+    PagePreprocessingModel,
+    PagePreprocessingOptions,
+)
+from docling.pipeline.base_pipeline import PaginatedPipeline
+from docling.utils.cache import LocalDirectoryCacheStore
+
+
+class UppercaseCellsModel(BasePageModel):
+    def __init__(self):
+        self.num_pages = 0
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        for page in page_batch:
+            self.num_pages += 1
+            page.cells = [
+                cell.model_copy(update={"text": cell.text.upper()})
+                for cell in page.cells
+            ]
+            yield page
+
+
+class CachedCellsPipeline(PaginatedPipeline):
+    def __init__(self, cache_store: LocalDirectoryCacheStore, stage_key: str):
+        super().__init__(PipelineOptions())
+        self.stage_model = UppercaseCellsModel()
+        self.build_pipe = [
+            PagePreprocessingModel(options=PagePreprocessingOptions(images_scale=1.0)),
+            PageCacheModel(
+                model=self.stage_model,
+                stage_key=stage_key,
+                outputs=["cells"],
+                cache_store=cache_store,
+            ),
+        ]
+
+    def initialize_page(self, conv_res: ConversionResult, page: Page) -> Page:
+        page._backend = conv_res.input._backend.load_page(page.page_no)  # type: ignore
+        if page._backend is not None and page._backend.is_valid():
+            page.size = page._backend.get_size()
+        return page
+
+    @classmethod
+    def get_default_options(cls) -> PipelineOptions:
+        return PipelineOptions()
+
+    @classmethod
+    def is_backend_supported(cls, backend):
+        return True
+
+
+def get_input_doc():
+    return InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+
+
+def get_page_cells(conv_res: ConversionResult):
+    return [
+        [(c.text, c.bbox.as_tuple()) for c in page.cells] for page in conv_res.pages
+    ]
+
+
+def test_page_cache_model(tmp_path):
+    cache_store = LocalDirectoryCacheStore(tmp_path / "page_cache")
+
+    pipeline = CachedCellsPipeline(cache_store, stage_key="stage-a")
+    conv_res = pipeline.execute(get_input_doc(), raises_on_error=True)
+    assert conv_res.status == ConversionStatus.SUCCESS
+    assert pipeline.stage_model.num_pages == 1
+    assert cache_store.stats.puts == 1
+
+    cells = get_page_cells(conv_res)
+    assert len(cells[0]) > 0
+    assert all(text == text.upper() for text, _ in cells[0])
+
+    # Same content and stage configuration, served from the cache
+    pipeline = CachedCellsPipeline(cache_store, stage_key="stage-a")
+    cached_res = pipeline.execute(get_input_doc(), raises_on_error=True)
+    assert pipeline.stage_model.num_pages == 0
+    assert cache_store.stats.hits == 1
+    assert cached_res.pages[0].page_hash == conv_res.pages[0].page_hash
+    assert get_page_cells(cached_res) == cells
+
+    # Another stage configuration is recomputed
+    pipeline = CachedCellsPipeline(cache_store, stage_key="stage-b")
+    pipeline.execute(get_input_doc(), raises_on_error=True)
+    assert pipeline.stage_model.num_pages == 1
+    assert cache_store.stats.puts == 2
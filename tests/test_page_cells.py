@@ -0,0 +1,52 @@
+import pickle
+
+from docling_core.types.doc import BoundingBox
+
+from docling.datamodel.base_models import Cell, OcrCell, Page, PageCells
+
+
+def get_cells():
+    return [
+        Cell(id=0, text="Hello", bbox=BoundingBox(l=10, t=20, r=60, b=32)),
+        OcrCell(
+            id=1,
+            text="wörld",
+            bbox=BoundingBox(l=64.5, t=20, r=100, b=32),
+            confidence=0.75,
+        ),
+        Cell(id=2, text="", bbox=BoundingBox(l=10, t=40, r=10, b=52)),
+    ]
+
+
+def test_page_cells_list_view():
+    cells = get_cells()
+    page_cells = PageCells.from_cells(cells)
+
+    assert len(page_cells) == 3
+    assert list(page_cells) == cells
+    assert page_cells == cells
+    assert page_cells[1] == cells[1]
+    assert isinstance(page_cells[1], OcrCell)
+    assert page_cells[-1] == cells[-1]
+    assert page_cells[1:] == cells[1:]
+    assert page_cells.texts == ["Hello", "wörld", ""]
+    assert page_cells.bboxes.tolist()[1] == [64.5, 20.0, 100.0, 32.0]
+
+    assert page_cells.take([2, 0]) == [cells[2], cells[0]]
+    assert page_cells[:1] + cells[1:] == cells
+    assert PageCells() == []
+
+
+def test_page_cells_on_page():
+    cells = get_cells()
+
+    # Lists of cells assigned to a page are stored as PageCells
+    page = Page(page_no=0)
+    page.cells = cells
+    assert isinstance(page.cells, PageCells)
+    assert page.cells == cells
+
+    # Serialized as a list of cells
+    dumped = page.model_dump_json()
+    assert Page.model_validate_json(dumped).cells == cells
+    assert pickle.loads(pickle.dumps(page)).cells == cells
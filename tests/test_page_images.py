@@ -0,0 +1,157 @@
+import pickle
+from pathlib import Path
+
+from docling_core.types.doc import BoundingBox, DocItemLabel
+from PIL import Image
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import (
+    Cluster,
+    FigureElement,
+    InputFormat,
+    LayoutPrediction,
+    Page,
+    Table,
+)
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.models.page_assemble_model import PageAssembleModel, PageAssembleOptions
+from docling.models.page_preprocessing_model import (
+    PagePreprocessingModel,
+    PagePreprocessingOptions,
+)
+from docling.utils.image_store import PageImageStore
+
+
+def get_input_doc():
+    return InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+
+
+def get_page(rendered_scales):
+    in_doc = get_input_doc()
+    page_backend = in_doc._backend.load_page(0)
+
+    # Record the scales rendered through the backend
+    get_page_image = page_backend.get_page_image
+
+    def recording_get_page_image(scale=1, cropbox=None, oversample=1.5):
+        rendered_scales.append((scale, oversample))
+        return get_page_image(scale=scale, cropbox=cropbox, oversample=oversample)
+
+    page_backend.get_page_image = recording_get_page_image
+
+    page = Page(page_no=0)
+    page._backend = page_backend
+    page.size = page_backend.get_size()
+    return page
+
+
+def test_page_images_render_once():
+    rendered_scales = []
+    page = get_page(rendered_scales)
+    model = PagePreprocessingModel(PagePreprocessingOptions(images_scale=2.0))
+    model._populate_page_images(page)
+
+    # Both planned scales derive from a single render
+    assert rendered_scales == [(2.0, 1.5)]
+    assert page.get_image(scale=1.0).size == (612, 792)
+    assert page.get_image(scale=2.0).size == (1224, 1584)
+    assert page.image.size == (1224, 1584)
+
+    # Smaller scales derive from the cached images, larger ones are rendered
+    assert page.get_image(scale=1.5).size == (918, 1188)
+    assert page.get_image(scale=3.0).size == (1836, 2376)
+    assert rendered_scales == [(2.0, 1.5), (3.0, 1.5)]
+
+
+def test_page_images_without_oversampling():
+    rendered_scales = []
+    page = get_page(rendered_scales)
+    model = PagePreprocessingModel(
+        PagePreprocessingOptions(images_scale=1.0, images_oversample=1.0)
+    )
+    model._populate_page_images(page)
+
+    assert rendered_scales == [(1.0, 1.0)]
+    assert page.get_image(scale=1.0).size == (612, 792)
+
+
+def test_page_image_store():
+    images = [Image.new("RGB", (100, 50), color=(ix, 0, 0)) for ix in range(10)]
+    image_memory = 100 * 50 * 3
+
+    store = PageImageStore(max_memory=3 * image_memory)
+    keys = [store.put(image) for image in images]
+    assert len(store) == 10
+    assert store.memory == 3 * image_memory
+
+    # Spilled images are loaded back as they were
+    for key, image in zip(keys, images):
+        assert store.get(key).tobytes() == image.tobytes()
+        assert store.memory <= 3 * image_memory
+
+    restored = pickle.loads(pickle.dumps(store))
+    for key, image in zip(keys, images):
+        assert restored.get(key).tobytes() == image.tobytes()
+
+    store.discard(keys[:5])
+    assert len(store) == 5
+    assert store.get(keys[0]) is None
+
+
+def test_page_store_images():
+    page = get_page([])
+    model = PagePreprocessingModel(PagePreprocessingOptions(images_scale=2.0))
+    model._populate_page_images(page)
+    image = page.image.copy()
+
+    store = PageImageStore(max_memory=0)
+    page._backend.unload()
+    page._backend = None
+    page.store_images(store)
+    assert page._image_cache == {}
+    assert len(store) == 2
+    assert page.image.tobytes() == image.tobytes()
+
+    # The images are dropped together with the page
+    del page
+    assert len(store) == 0
+
+
+def test_page_assemble_element_images():
+    rendered_scales = []
+    page = get_page(rendered_scales)
+    page.predictions.layout = LayoutPrediction(
+        clusters=[
+            Cluster(
+                id=0,
+                label=DocItemLabel.PICTURE,
+                bbox=BoundingBox(l=100, t=100, r=300, b=200),
+            ),
+            # Extends beyond the page, cropped to it
+            Cluster(
+                id=1,
+                label=DocItemLabel.TABLE,
+                bbox=BoundingBox(l=500, t=700, r=650, b=800),
+            ),
+        ]
+    )
+    model = PageAssembleModel(
+        PageAssembleOptions(
+            images_scale=2.0, generate_picture_images=True, generate_table_images=True
+        )
+    )
+    conv_res = ConversionResult(input=get_input_doc())
+    page = next(iter(model(conv_res, [page])))
+
+    # The elements are rendered by themselves and the page image is dropped
+    picture, table = page.assembled.elements
+    assert isinstance(picture, FigureElement) and isinstance(table, Table)
+    assert picture.image.size.width == 400 and picture.image.size.height == 200
+    assert table.image.size.width == 224 and table.image.size.height == 184
+    assert picture.image.dpi == 144
+    assert rendered_scales == [(2.0, 1.5), (2.0, 1.5)]
+    assert page._image_cache == {}
@@ -0,0 +1,193 @@
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+import pytest
+
+from docling.backend.pypdfium2_backend import (
+    PyPdfiumDocumentBackend,
+    PyPdfiumPageBackend,
+)
+from docling.datamodel.base_models import ConversionStatus, InputFormat, Page
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import PipelineOptions
+from docling.datamodel.settings import settings
+from docling.models.base_model import BasePageModel
+from docling.models.page_preprocessing_model import (
+    PagePreprocessingModel,
+    PagePreprocessingOptions,
+)
+from docling.pipeline.base_pipeline import PaginatedPipeline
+
+
+class FailingPageModel(BasePageModel):
+    def __init__(self, fail_on_page: int):
+        self.fail_on_page = fail_on_page
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        for page in page_batch:
+            if page.page_no == self.fail_on_page:
+                raise RuntimeError(f"Failed on page {page.page_no}")
+            yield page
+
+
+class BatchRecordingModel(BasePageModel):
+    def __init__(self):
+        self.batches: List[List[str]] = []
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        for _, page in self.process_page_batch((conv_res, page) for page in page_batch):
+            yield page
+
+    def process_page_batch(
+        self, page_batch: Iterable[Tuple[ConversionResult, Page]]
+    ) -> Iterable[Tuple[ConversionResult, Page]]:
+        page_batch = list(page_batch)
+        self.batches.append(
+            [
+                f"{conv_res.input.file.name}:{page.page_no}"
+                for conv_res, page in page_batch
+            ]
+        )
+        yield from page_batch
+
+
+class CellsPipeline(PaginatedPipeline):
+    def __init__(self, pipeline_options: PipelineOptions, fail_on_page: int = -1):
+        super().__init__(pipeline_options)
+        self.build_pipe = [
+            PagePreprocessingModel(options=PagePreprocessingOptions(images_scale=2.0)),
+            FailingPageModel(fail_on_page=fail_on_page),
+            BatchRecordingModel(),
+        ]
+
+    def initialize_page(self, conv_res: ConversionResult, page: Page) -> Page:
+        page._backend = conv_res.input._backend.load_page(page.page_no)  # type: ignore
+        if page._backend is not None and page._backend.is_valid():
+            page.size = page._backend.get_size()
+        return page
+
+    @classmethod
+    def get_default_options(cls) -> PipelineOptions:
+        return PipelineOptions()
+
+    @classmethod
+    def is_backend_supported(cls, backend):
+        return True
+
+
+def get_input_doc(pdf_path: Path = Path("./tests/data/redp5110_sampled.pdf")):
+    return InputDocument(
+        path_or_stream=pdf_path,
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+
+
+def get_page_cells(conv_res: ConversionResult):
+    return [
+        [(c.text, c.bbox.as_tuple()) for c in page.cells] for page in conv_res.pages
+    ]
+
+
+@pytest.fixture
+def stage_pipelining(monkeypatch):
+    monkeypatch.setattr(
+        settings,
+        "perf",
+        settings.perf.model_copy(
+            update={
+                "page_stage_pipelining": True,
+                "page_batch_size": 2,
+                "page_stage_queue_size": 1,
+            }
+        ),
+    )
+
+
+def test_pipelined_pages_match_sequential(monkeypatch):
+    sequential_res = CellsPipeline(PipelineOptions()).execute(
+        get_input_doc(), raises_on_error=True
+    )
+
+    monkeypatch.setattr(settings.perf, "page_stage_pipelining", True)
+    monkeypatch.setattr(settings.perf, "page_stage_queue_size", 1)
+    pipelined_res = CellsPipeline(PipelineOptions()).execute(
+        get_input_doc(), raises_on_error=True
+    )
+
+    assert pipelined_res.status == ConversionStatus.SUCCESS
+    assert len(pipelined_res.pages) == len(sequential_res.pages)
+    assert get_page_cells(pipelined_res) == get_page_cells(sequential_res)
+    for page in pipelined_res.pages:
+        assert isinstance(page._backend, PyPdfiumPageBackend)
+        assert page.get_image(scale=2.0) is not None
+
+
+def test_pipelined_pages_raise_stage_error(stage_pipelining):
+    pipeline = CellsPipeline(PipelineOptions(), fail_on_page=5)
+
+    with pytest.raises(RuntimeError, match="Failed on page 5"):
+        pipeline.execute(get_input_doc(), raises_on_error=True)
+
+    conv_res = pipeline.execute(get_input_doc(), raises_on_error=False)
+    assert conv_res.status == ConversionStatus.FAILURE
+
+
+def test_pooled_documents_match_single_documents(monkeypatch):
+    monkeypatch.setattr(settings.perf, "page_batch_size", 4)
+    pdf_paths = [
+        Path("./tests/data/2305.03393v1-pg9.pdf"),
+        Path("./tests/data/redp5110_sampled.pdf"),
+        Path("./tests/data/2305.03393v1-pg9.pdf"),
+    ]
+
+    pipeline = CellsPipeline(PipelineOptions())
+    single_results = [
+        pipeline.execute(get_input_doc(pdf_path), raises_on_error=True)
+        for pdf_path in pdf_paths
+    ]
+
+    pipeline = CellsPipeline(PipelineOptions())
+    pooled_results = pipeline.execute_batch(
+        [get_input_doc(pdf_path) for pdf_path in pdf_paths], raises_on_error=True
+    )
+
+    assert len(pooled_results) == len(pdf_paths)
+    for single_res, pooled_res in zip(single_results, pooled_results):
+        assert pooled_res.status == ConversionStatus.SUCCESS
+        assert pooled_res.input.file == single_res.input.file
+        assert get_page_cells(pooled_res) == get_page_cells(single_res)
+
+    # All batches are full, except the last one, and they mix documents
+    batches = pipeline.build_pipe[-1].batches
+    assert [len(b) for b in batches] == [4, 4, 4, 4, 4]
+    assert batches[0][0] == "2305.03393v1-pg9.pdf:0"
+    assert batches[0][1] == "redp5110_sampled.pdf:0"
+    assert batches[-1][-1] == "2305.03393v1-pg9.pdf:0"
+
+
+def test_pooled_documents_fallback_on_error():
+    pdf_paths = [
+        Path("./tests/data/2305.03393v1-pg9.pdf"),
+        Path("./tests/data/redp5110_sampled.pdf"),
+    ]
+    pipeline = CellsPipeline(PipelineOptions(), fail_on_page=5)
+
+    conv_results = pipeline.execute_batch(
+        [get_input_doc(pdf_path) for pdf_path in pdf_paths], raises_on_error=False
+    )
+
+    assert [r.status for r in conv_results] == [
+        ConversionStatus.SUCCESS,
+        ConversionStatus.FAILURE,
+    ]
+    assert len(conv_results[0].pages) == 1
+
+    # Only the document of the failed page batch is converted again
+    batches = pipeline.build_pipe[-1].batches
+    assert sum("2305.03393v1-pg9.pdf:0" in b for b in batches) == 1
+    assert batches[-1] == [f"redp5110_sampled.pdf:{ix}" for ix in range(4)]
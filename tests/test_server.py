@@ -0,0 +1,231 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+import pytest
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import ConversionStatus, InputFormat, Page
+from docling.datamodel.document import ConversionResult
+from docling.datamodel.pipeline_options import PipelineOptions
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.models.base_model import BasePageModel
+from docling.server import (
+    ConversionClient,
+    ConversionServer,
+    ServerOverloadedError,
+    SourceNotAllowedError,
+)
+
+from .test_paginated_pipeline import CellsPipeline
+
+
+class SlowPageModel(BasePageModel):
+    started = threading.Event()
+    release = threading.Event()
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        for page in page_batch:
+            self.started.set()
+            assert self.release.wait(timeout=60)
+            yield page
+
+
+class SlowPipeline(CellsPipeline):
+    def __init__(self, pipeline_options: PipelineOptions):
+        super().__init__(pipeline_options)
+        self.build_pipe = [SlowPageModel(), *self.build_pipe]
+
+
+def get_converter(pipeline_cls=CellsPipeline):
+    return DocumentConverter(
+        allowed_formats=[InputFormat.DOCX, InputFormat.PDF],
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=pipeline_cls, backend=PyPdfiumDocumentBackend
+            )
+        },
+    )
+
+
+@pytest.fixture
+def server():
+    server = ConversionServer(get_converter(), max_queued_pages=10)
+    server.start(port=0)
+    yield server
+    server.stop()
+
+
+def test_server_converts_documents(server):
+    docx_path = Path("./tests/data/docx/lorem_ipsum.docx")
+    expected_doc = get_converter().convert(docx_path).document
+
+    host, port = server.address
+    client = ConversionClient(url=f"http://{host}:{port}")
+
+    response = client.convert(docx_path)
+    assert response.status == ConversionStatus.SUCCESS
+    assert response.filename == docx_path.name
+    assert response.document is not None
+    assert response.document.export_to_dict() == expected_doc.export_to_dict()
+
+    health = client.health()
+    assert health.queued_requests == 0
+    assert health.queued_pages == 0
+
+
+def test_server_rejects_sources_by_default(server):
+    host, port = server.address
+    client = ConversionClient(url=f"http://{host}:{port}")
+
+    with pytest.raises(SourceNotAllowedError):
+        client.convert(str(Path("./tests/data/docx/lorem_ipsum.docx").resolve()))
+    with pytest.raises(SourceNotAllowedError):
+        client.convert("https://arxiv.org/pdf/2206.01062")
+    assert client.health().queued_requests == 0
+
+
+def test_server_resolves_sources_below_roots():
+    docx_path = Path("./tests/data/docx/lorem_ipsum.docx")
+    expected_doc = get_converter().convert(docx_path).document
+
+    server = ConversionServer(get_converter(), source_roots=[Path("./tests/data/docx")])
+    server.start(port=0)
+    try:
+        host, port = server.address
+        client = ConversionClient(url=f"http://{host}:{port}")
+
+        response = client.convert(str(docx_path))
+        assert response.document is not None
+        assert response.document.export_to_dict() == expected_doc.export_to_dict()
+
+        for source in [
+            "./tests/data/2305.03393v1-pg9.pdf",
+            "./tests/data/docx/../2305.03393v1-pg9.pdf",
+        ]:
+            with pytest.raises(SourceNotAllowedError):
+                client.convert(source)
+    finally:
+        server.stop()
+
+
+def test_server_rejects_large_requests():
+    server = ConversionServer(get_converter(), max_request_size=10_000)
+    server.start(port=0)
+    try:
+        host, port = server.address
+        client = ConversionClient(url=f"http://{host}:{port}")
+
+        with pytest.raises(RuntimeError, match="status 413"):
+            client.convert(Path("./tests/data/2305.03393v1-pg9.pdf"))
+        assert client.health().queued_requests == 0
+    finally:
+        server.stop()
+
+
+def test_server_on_unix_socket(tmp_path):
+    socket_path = tmp_path / "docling.sock"
+    server = ConversionServer(get_converter())
+    server.start(socket_path=socket_path)
+    try:
+        client = ConversionClient(socket_path=socket_path)
+        response = client.convert(Path("./tests/data/2305.03393v1-pg9.pdf"))
+        assert response.status == ConversionStatus.SUCCESS
+    finally:
+        server.stop()
+    assert not socket_path.exists()
+
+
+def test_server_batches_and_rejects_requests(server, monkeypatch):
+    converting = threading.Event()
+    release = threading.Event()
+    batches = []
+    convert_batch = server._convert_batch
+
+    def blocking_convert_batch(batch):
+        converting.set()
+        release.wait()
+        batches.append([pending.in_doc.file.name for pending in batch])
+        convert_batch(batch)
+
+    monkeypatch.setattr(server, "_convert_batch", blocking_convert_batch)
+
+    host, port = server.address
+    client = ConversionClient(url=f"http://{host}:{port}")
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        first = pool.submit(client.convert, Path("./tests/data/2305.03393v1-pg9.pdf"))
+        assert converting.wait(timeout=60)
+
+        # The worker is busy, these requests queue up
+        queued = [
+            pool.submit(client.convert, Path("./tests/data/docx/lorem_ipsum.docx")),
+            pool.submit(client.convert, Path("./tests/data/docx/word_sample.docx")),
+        ]
+        while client.health().queued_requests < 3:
+            release.wait(0.01)
+
+        # 18 more pages exceed the queue limit once the requests are admitted
+        rejected = pool.submit(
+            client.convert, Path("./tests/data/redp5110_sampled.pdf")
+        )
+        release.set()
+
+        assert first.result().status == ConversionStatus.SUCCESS
+        assert all(f.result().status == ConversionStatus.SUCCESS for f in queued)
+        with pytest.raises(ServerOverloadedError):
+            rejected.result()
+
+    assert batches[0] == ["2305.03393v1-pg9.pdf"]
+    assert sorted(batches[1]) == ["lorem_ipsum.docx", "word_sample.docx"]
+    assert client.health().queued_pages == 0
+
+
+def test_server_rejects_requests_beyond_queue_limit():
+    SlowPageModel.started.clear()
+    SlowPageModel.release.clear()
+    server = ConversionServer(
+        get_converter(pipeline_cls=SlowPipeline), max_queued_requests=2
+    )
+    server.start(port=0)
+    try:
+        host, port = server.address
+        client = ConversionClient(url=f"http://{host}:{port}", timeout=60)
+        pdf_path = Path("./tests/data/2305.03393v1-pg9.pdf")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            converting = pool.submit(client.convert, pdf_path)
+            assert SlowPageModel.started.wait(timeout=60)
+            queued = pool.submit(client.convert, pdf_path)
+            while client.health().queued_requests < 2:
+                SlowPageModel.release.wait(0.01)
+
+            # Rejected right away instead of waiting behind the slow pipeline
+            with pytest.raises(ServerOverloadedError):
+                client.convert(pdf_path)
+            assert not converting.done()
+
+            SlowPageModel.release.set()
+            assert converting.result().status == ConversionStatus.SUCCESS
+            assert queued.result().status == ConversionStatus.SUCCESS
+        assert client.health().queued_requests == 0
+    finally:
+        SlowPageModel.release.set()
+        server.stop()
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_server_fails_requests_of_a_dead_worker(server, monkeypatch):
+    def dying_convert_batch(batch):
+        raise SystemExit()
+
+    monkeypatch.setattr(server, "_convert_batch", dying_convert_batch)
+
+    host, port = server.address
+    client = ConversionClient(url=f"http://{host}:{port}", timeout=60)
+    with pytest.raises(RuntimeError, match="worker stopped"):
+        client.convert(Path("./tests/data/2305.03393v1-pg9.pdf"))
+    with pytest.raises(RuntimeError, match="not running"):
+        client.convert(Path("./tests/data/2305.03393v1-pg9.pdf"))
+    assert client.health().queued_requests == 0
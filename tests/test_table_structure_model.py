@@ -0,0 +1,64 @@
+import copy
+from pathlib import Path
+
+from docling_core.types.doc import BoundingBox, DocItemLabel
+
+from docling.backend.docling_parse_backend import DoclingParseDocumentBackend
+from docling.datamodel.base_models import Cluster, InputFormat, Page
+from docling.datamodel.document import InputDocument
+from docling.datamodel.pipeline_options import TableStructureOptions
+from docling.models.table_structure_model import TableStructureModel
+
+
+def get_page():
+    pdf_path = Path("./tests/data/2305.03393v1-pg9.pdf")
+    in_doc = InputDocument(
+        path_or_stream=pdf_path,
+        format=InputFormat.PDF,
+        backend=DoclingParseDocumentBackend,
+    )
+    page = Page(page_no=0)
+    page._backend = in_doc._backend.load_page(0)
+    page.cells = list(page._backend.get_text_cells())
+    return page
+
+
+def reference_table_tokens(page, table_clusters, scale):
+    tokens = []
+    for c in page.cells:
+        for cluster in table_clusters:
+            if c.bbox.area() > 0:
+                if c.bbox.intersection_area_with(cluster.bbox) / c.bbox.area() > 0.2:
+                    if len(c.text.strip()) > 0:
+                        new_cell = copy.deepcopy(c)
+                        new_cell.bbox = new_cell.bbox.scaled(scale=scale)
+                        tokens.append(new_cell.model_dump())
+    return tokens
+
+
+def test_table_tokens():
+    page = get_page()
+    model = TableStructureModel(
+        enabled=False, artifacts_path=Path("."), options=TableStructureOptions()
+    )
+    model.scale = 2.0
+
+    table_clusters = [
+        Cluster(
+            id=ix,
+            label=DocItemLabel.TABLE,
+            bbox=BoundingBox(l=l, t=t, r=r, b=b),
+        )
+        for ix, (l, t, r, b) in enumerate(
+            [
+                (100.0, 100.0, 500.0, 400.0),
+                (300.0, 350.0, 550.0, 700.0),  # overlaps the first table
+                (0.0, 0.0, 10.0, 10.0),
+            ]
+        )
+    ]
+
+    tokens = model._get_table_tokens(page, table_clusters)
+
+    assert len(tokens) > 0
+    assert tokens == reference_table_tokens(page, table_clusters, model.scale)
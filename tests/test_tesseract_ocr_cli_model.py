@@ -0,0 +1,105 @@
+import stat
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import InputFormat, Page
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import TesseractCliOcrOptions
+from docling.models.tesseract_ocr_cli_model import TesseractOcrCliModel
+
+TSV_HEADER = "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext"
+
+FAKE_TESSERACT = f"""#!{sys.executable}
+import io
+import sys
+
+from PIL import Image
+
+if sys.argv[1:] == ["--version"]:
+    print("tesseract 5.3.0")
+    sys.exit()
+
+# Report the size of the image read from stdin as words, count the calls
+assert sys.argv[-3:] == ["stdin", "stdout", "tsv"]
+with open(sys.argv[0] + ".calls", "a") as calls:
+    calls.write("x")
+image = Image.open(io.BytesIO(sys.stdin.buffer.read()))
+print({TSV_HEADER!r})
+print("1\\t1\\t0\\t0\\t0\\t0\\t0\\t0\\t90\\t60\\t-1\\t")
+print(f"5\\t1\\t1\\t1\\t1\\t1\\t3\\t6\\t30\\t15\\t91.5\\t{{image.width}}")
+print("5\\t1\\t1\\t1\\t1\\t2\\t36\\t6\\t30\\t15\\t89\\t ")
+print(f"5\\t1\\t1\\t1\\t1\\t3\\t69\\t6\\t21\\t15\\t96\\tNA")
+"""
+
+
+def get_tesseract_cmd(tmp_path):
+    tesseract_cmd = tmp_path / "tesseract"
+    tesseract_cmd.write_text(FAKE_TESSERACT)
+    tesseract_cmd.chmod(tesseract_cmd.stat().st_mode | stat.S_IEXEC)
+    return tesseract_cmd
+
+
+def test_run_tesseract_over_stdin(tmp_path):
+    tesseract_cmd = get_tesseract_cmd(tmp_path)
+    model = TesseractOcrCliModel(
+        enabled=False,
+        options=TesseractCliOcrOptions(tesseract_cmd=str(tesseract_cmd), lang=[]),
+    )
+    rows = model._run_tesseract(Image.new("RGB", (90, 60), color="white"))
+
+    # Rows without text are dropped, numbers and "NA" are text like any other
+    assert [(ix, row["text"], row["conf"]) for ix, row in rows] == [
+        (1, "90", "91.5"),
+        (3, "NA", "96"),
+    ]
+    assert rows[0][1]["left"] == "3" and rows[0][1]["height"] == "15"
+
+
+def test_read_tsv():
+    assert list(TesseractOcrCliModel._read_tsv("")) == []
+    assert list(TesseractOcrCliModel._read_tsv(TSV_HEADER + "\n")) == []
+
+
+def test_ocr_results_cache(tmp_path):
+    tesseract_cmd = get_tesseract_cmd(tmp_path)
+    calls_path = Path(f"{tesseract_cmd}.calls")
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    conv_res = ConversionResult(input=in_doc)
+
+    def convert_page(model):
+        page = Page(page_no=0)
+        page._backend = in_doc._backend.load_page(0)
+        page.size = page._backend.get_size()
+        (page,) = model(conv_res, [page])
+        return [cell for cell in page.cells if cell.text in ["1836", "NA"]]
+
+    def get_model(**kwargs):
+        options = TesseractCliOcrOptions(
+            tesseract_cmd=str(tesseract_cmd),
+            force_full_page_ocr=True,
+            cache_path=tmp_path / "ocr_cache",
+            **kwargs,
+        )
+        return TesseractOcrCliModel(enabled=True, options=options)
+
+    model = get_model(cache_memory_size=1_000_000)
+    cells = convert_page(model)
+    assert [cell.text for cell in cells] == ["1836", "NA"]
+    assert cells[0].bbox.as_tuple() == (1.0, 2.0, 11.0, 7.0)
+    assert calls_path.read_text() == "x"
+
+    # Served from the in-memory cache, then from the on-disk cache
+    assert convert_page(model) == cells
+    assert convert_page(get_model()) == cells
+    assert calls_path.read_text() == "x"
+
+    # The languages are part of the key
+    assert convert_page(get_model(lang=["eng"])) == cells
+    assert calls_path.read_text() == "xx"
@@ -0,0 +1,109 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from docling_core.types.doc import BoundingBox
+from PIL import Image
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import InputFormat, OcrCell, Page
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import TesseractOcrOptions
+from docling.models.tesseract_ocr_model import TesseractOcrModel
+
+
+class RIL:
+    TEXTLINE = 2
+
+
+class RecordingReader:
+    def __init__(self):
+        self.busy = threading.Lock()
+        self.image = None
+
+    def SetImage(self, image):
+        # A tesseractAPI must never be shared by two threads at once
+        assert self.busy.acquire(blocking=False)
+        self.image = image
+
+    def GetComponentImages(self, level, text_only):
+        time.sleep(0.01)
+        return [(None, {"x": 0, "y": 0, "w": 30, "h": 15}, 0, 0)]
+
+    def SetRectangle(self, x, y, w, h):
+        pass
+
+    def GetUTF8Text(self):
+        text = str(self.image.width)
+        self.busy.release()
+        return text
+
+    def MeanTextConf(self):
+        return 90
+
+    def End(self):
+        pass
+
+
+def get_model(num_readers):
+    model = TesseractOcrModel(enabled=False, options=TesseractOcrOptions())
+    model.readers = [RecordingReader() for _ in range(num_readers)]
+    for reader in model.readers:
+        model._idle_readers.put(reader)
+    model.reader_RIL = RIL
+    model._executor = ThreadPoolExecutor(max_workers=len(model.readers))
+    return model
+
+
+def test_ocr_images_concurrently():
+    model = get_model(3)
+
+    images = [Image.new("RGB", (100 + ix, 50)) for ix in range(20)]
+    futures = [model._executor.submit(model._ocr_image, im) for im in images]
+
+    # Results are mapped back to their images
+    for ix, future in enumerate(futures):
+        (cell,) = future.result()
+        assert cell.text == str(100 + ix)
+        assert cell.bbox.as_tuple() == (0, 0, 10, 5)
+
+    assert model._idle_readers.qsize() == 3
+
+
+def test_ocr_cells_on_page():
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+
+    model = get_model(1)
+    model.options = TesseractOcrOptions(cache_memory_size=1 << 20)
+    model.cache_stores = TesseractOcrModel(
+        enabled=False, options=model.options
+    ).cache_stores
+    model.enabled = True
+    model.get_ocr_rects = lambda page: [
+        BoundingBox(l=100, t=200, r=200, b=300),
+        BoundingBox(l=50, t=400, r=110, b=420),
+    ]
+
+    def ocr_page():
+        page = Page(page_no=0)
+        page._backend = in_doc._backend.load_page(0)
+        page.size = page._backend.get_size()
+        (page,) = model(ConversionResult(input=in_doc), [page])
+        return [
+            (cell.text, cell.bbox.as_tuple())
+            for cell in page.cells
+            if isinstance(cell, OcrCell)
+        ]
+
+    # The cells of a rect are placed relative to its origin on the page, also
+    # when they come from the cache
+    expected = [("300", (100, 200, 110, 205)), ("180", (50, 400, 60, 405))]
+    assert ocr_page() == expected
+    model.readers[0].image = None
+    assert ocr_page() == expected
+    assert model.readers[0].image is None  # read from the cache